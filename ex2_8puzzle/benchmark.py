@@ -0,0 +1,152 @@
+'''
+Comparações de desempenho entre as variantes do resolvedor.
+
+    python benchmark.py filas --lado 3 --instancias 50
+    python benchmark.py vetorizado --lado 4 --passos 60
+    python benchmark.py hda --lado 4 --instancias 5 --passos 80 --processos 8
+
+As instâncias são geradas por passeios aleatórios a partir do objetivo
+(com semente fixa), então são sempre solúveis e repetíveis.
+'''
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from estado import obter_tabuleiro
+from fila_aberta import criar_fila
+
+
+def gerar_instancias(lado, quantidade, passos, semente=0):
+    """
+    Gera estados embaralhados por `passos` movimentos aleatórios do vazio.
+
+    Returns:
+        Lista de tuplas (estado_inicial, estado_objetivo) em matrizes
+    """
+    gerador = random.Random(semente)
+    tabuleiro = obter_tabuleiro(lado)
+    objetivo = tabuleiro.desempacotar(tabuleiro.objetivo_padrao)
+    instancias = []
+    for _ in range(quantidade):
+        codigo = tabuleiro.objetivo_padrao
+        vazio = tabuleiro.posicao_vazio(codigo)
+        anterior = -1
+        for _ in range(passos):
+            destino = gerador.choice([d for _, d in tabuleiro.vizinhos[vazio] if d != anterior])
+            codigo, _ = tabuleiro.mover(codigo, vazio, destino)
+            anterior, vazio = vazio, destino
+        instancias.append((tabuleiro.desempacotar(codigo), objetivo))
+    return instancias
+
+
+def medir_operacoes(nome, operacoes, semente=0):
+    """
+    Mede só a fila: insere e remove `operacoes` itens com f crescendo devagar
+    de 20 a 80 e h até 40, como acontece no A* do 15-puzzle (com f sem limite
+    a FilaBaldes gastaria o tempo criando baldes que um A* nunca usa).
+
+    Returns:
+        Operações (inserção + remoção) por segundo
+    """
+    gerador = random.Random(semente)
+    prioridades = [(20 + 60 * f // operacoes + gerador.randrange(3), gerador.randrange(40))
+                   for f in range(operacoes)]
+    fila = criar_fila(nome)
+    inicio = time.perf_counter()
+    for i, (f, chave) in enumerate(prioridades):
+        fila.inserir(f, chave, i)
+        fila.inserir(f + 1, chave, i)
+        fila.remover()
+    while len(fila):
+        fila.remover()
+    return 3 * operacoes / (time.perf_counter() - inicio)
+
+
+def comparar_filas(lado, quantidade, passos, heuristica):
+    """
+    Compara FilaHeap e FilaBaldes isoladamente e dentro do A*.
+    """
+    from main import busca_a_estrela
+
+    print("Fila isolada (operações por segundo):")
+    for nome in ('heap', 'baldes'):
+        print(f"  {nome:7} {medir_operacoes(nome, 200000):12.0f}")
+
+    instancias = gerar_instancias(lado, quantidade, passos)
+    print(f"\nA* em {quantidade} instâncias {lado}x{lado} ({passos} passos, {heuristica}):")
+    for nome in ('heap', 'baldes'):
+        inicio = time.perf_counter()
+        expandidos = movimentos = 0
+        for estado, objetivo in instancias:
+            caminho, nos, _ = busca_a_estrela(estado, objetivo, heuristica, fila=nome)
+            expandidos += nos
+            movimentos += len(caminho)
+        tempo = time.perf_counter() - inicio
+        print(f"  {nome:7} {tempo:8.3f} s  {expandidos:9d} nós  {expandidos / tempo:10.0f} nós/s  "
+              f"{movimentos} movimentos")
+
+
+def comparar_vetorizado(lado, quantidade, passos, heuristica):
+    """
+    Compara o A* nó a nó com a expansão vetorizada em lotes.
+    """
+    from main import busca_a_estrela
+    from vetorizado import busca_vetorizada
+
+    instancias = gerar_instancias(lado, quantidade, passos)
+    print(f"{quantidade} instâncias {lado}x{lado} ({passos} passos, {heuristica}):")
+    for nome, busca in (('a_estrela', busca_a_estrela), ('vetorizado', busca_vetorizada)):
+        inicio = time.perf_counter()
+        expandidos = movimentos = 0
+        for estado, objetivo in instancias:
+            caminho, nos, _ = busca(estado, objetivo, heuristica)
+            expandidos += nos
+            movimentos += len(caminho)
+        tempo = time.perf_counter() - inicio
+        print(f"  {nome:10} {tempo:8.3f} s  {expandidos:9d} nós  {expandidos / tempo:10.0f} nós/s  "
+              f"{movimentos} movimentos")
+
+
+def comparar_hda(lado, quantidade, passos, heuristica, processos):
+    """
+    Compara o A* serial com o HDA* e mostra o speedup e a eficiência
+    (speedup dividido pelo número de processos).
+    """
+    from hda import medir_escalabilidade
+
+    instancias = gerar_instancias(lado, quantidade, passos)
+    print(f"{quantidade} instâncias {lado}x{lado} ({passos} passos, {heuristica}), "
+          f"{processos} processos:")
+    serial, paralelo = medir_escalabilidade(instancias, [processos], heuristica)
+    for nome, medida in (('a_estrela', serial), ('hda', paralelo)):
+        print(f"  {nome:10} {medida['tempo']:8.3f} s  {medida['nos']:9d} nós  "
+              f"{medida['nos'] / medida['tempo']:10.0f} nós/s")
+    print(f"  speedup {paralelo['aceleracao']:.2f}, eficiência {paralelo['eficiencia']:.0%}"
+          f"{'' if paralelo['mesmo_custo'] else '  (custos diferentes do A*!)'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do resolvedor do quebra-cabeça.")
+    parser.add_argument('comparacao', choices=['filas', 'vetorizado', 'hda'])
+    parser.add_argument('--lado', type=int, default=3)
+    parser.add_argument('--instancias', type=int, default=50)
+    parser.add_argument('--passos', type=int, default=200)
+    parser.add_argument('--heuristica', default='manhattan')
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1,
+                        help="processos do HDA* (padrão: número de núcleos)")
+    args = parser.parse_args()
+
+    if args.comparacao == 'filas':
+        comparar_filas(args.lado, args.instancias, args.passos, args.heuristica)
+    elif args.comparacao == 'vetorizado':
+        comparar_vetorizado(args.lado, args.instancias, args.passos, args.heuristica)
+    elif args.comparacao == 'hda':
+        comparar_hda(args.lado, args.instancias, args.passos, args.heuristica, args.processos)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+'''
+Busca bidirecional MM (meet in the middle).
+
+Duas buscas heurísticas simultâneas: uma do estado inicial para o
+objetivo e outra do objetivo para o inicial, cada uma com a sua
+heurística (Manhattan até o objetivo e até o inicial). Como só usam
+heurísticas calculadas para qualquer par de estados, servem para
+objetivos sem banco de padrões.
+
+MM ordena cada fronteira por pr(n) = max(f(n), 2g(n)), o que garante que
+nenhuma das buscas passa da metade do caminho ótimo, e expande a direção
+com menor pr. U é o custo da melhor solução encontrada ao cruzar as
+fronteiras; a busca para quando
+
+    U <= max(C, fmin_ida, fmin_volta, gmin_ida + gmin_volta + 1)
+
+com C o menor pr entre as duas fronteiras. Cada termo é um limite
+inferior do custo ótimo (o último vale porque todo movimento custa 1),
+então U é ótimo (Holte et al., 2016).
+'''
+
+import heapq
+import time
+
+from estado import obter_tabuleiro
+from heuristicas import obter_heuristica
+from pool_nos import CaminhoPreguicoso
+
+
+class Direcao:
+    """
+    Estado de uma das duas buscas.
+
+    Args:
+        tabuleiro: Tabuleiro dos estados
+        avaliador: Heurística para o estado onde esta direção quer chegar
+        codigo: Estado de onde esta direção parte
+    """
+
+    def __init__(self, tabuleiro, avaliador, codigo):
+        self.tabuleiro = tabuleiro
+        self.avaliador = avaliador
+        h = avaliador.calcular(codigo)
+        self.g = {codigo: 0}  # Menor g de cada estado visto (aberto ou fechado)
+        self.pais = {codigo: None}  # codigo -> (codigo do pai, índice do movimento)
+        self.abertos = {codigo}
+        vazio = tabuleiro.posicao_vazio(codigo)
+        # Filas com remoção preguiçosa: uma entrada vale se o estado está
+        # aberto com o mesmo g
+        self.por_pr = [(h, 0, h, codigo, vazio)]  # (pr, -g, h, codigo, vazio)
+        self.por_f = [(h, 0, codigo)]
+        self.por_g = [(0, codigo)]
+        self.expandidos = 0
+
+    def pr_min(self):
+        fila = self.por_pr
+        while fila and (fila[0][3] not in self.abertos or -fila[0][1] != self.g[fila[0][3]]):
+            heapq.heappop(fila)
+        return fila[0][0] if fila else None
+
+    def f_min(self):
+        fila = self.por_f
+        while fila and (fila[0][2] not in self.abertos or fila[0][1] != self.g[fila[0][2]]):
+            heapq.heappop(fila)
+        return fila[0][0] if fila else None
+
+    def g_min(self):
+        fila = self.por_g
+        while fila and (fila[0][1] not in self.abertos or fila[0][0] != self.g[fila[0][1]]):
+            heapq.heappop(fila)
+        return fila[0][0] if fila else None
+
+    def inserir(self, codigo, g, h, vazio, pai, d):
+        self.g[codigo] = g
+        self.pais[codigo] = (pai, d)
+        self.abertos.add(codigo)
+        heapq.heappush(self.por_pr, (max(g + h, 2 * g), -g, h, codigo, vazio))
+        heapq.heappush(self.por_f, (g + h, g, codigo))
+        heapq.heappush(self.por_g, (g, codigo))
+
+    def expandir(self, outra, melhor):
+        """
+        Expande o nó de menor pr (o topo já foi validado por pr_min).
+
+        Args:
+            outra: A Direcao oposta, consultada para cruzar as fronteiras
+            melhor: Tupla (U, estado de encontro) atual
+
+        Returns:
+            A tupla (U, estado de encontro) atualizada
+        """
+        _, g, h, codigo, vazio = heapq.heappop(self.por_pr)
+        g = -g
+        self.abertos.discard(codigo)
+        self.expandidos += 1
+        tabuleiro = self.tabuleiro
+        g_filho = g + 1
+        for d, destino in tabuleiro.direcoes[vazio]:
+            novo, peca = tabuleiro.mover(codigo, vazio, destino)
+            if g_filho >= self.g.get(novo, g_filho + 1):
+                continue
+            h_filho = self.avaliador.atualizar(h, novo, peca, destino, vazio)
+            self.inserir(novo, g_filho, h_filho, destino, codigo, d)
+            g_outra = outra.g.get(novo)
+            if g_outra is not None and g_filho + g_outra < melhor[0]:
+                melhor = (g_filho + g_outra, novo)
+        return melhor
+
+    def movimentos_ate(self, codigo):
+        """
+        Índices dos movimentos da origem desta direção até `codigo`.
+        """
+        movimentos = bytearray()
+        while self.pais[codigo] is not None:
+            codigo, d = self.pais[codigo]
+            movimentos.append(d)
+        movimentos.reverse()
+        return movimentos
+
+
+def busca_bidirecional(estado_inicial, estado_objetivo, heuristica='manhattan'):
+    """
+    Busca bidirecional MM, ótima para qualquer par (inicial, objetivo).
+
+    Args:
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (define o N)
+        heuristica: 'manhattan' ou 'conflito_linear', usada nas duas direções
+
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo) com a solução ótima,
+        ou (None, nos_expandidos, tempo) se não houver solução
+    """
+    inicio = time.time()
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    codigo_inicial = tabuleiro.empacotar(estado_inicial)
+    objetivo = tabuleiro.empacotar(estado_objetivo)
+    if not tabuleiro.eh_soluvel(codigo_inicial, objetivo):
+        return None, 0, time.time() - inicio
+
+    ida = Direcao(tabuleiro, obter_heuristica(heuristica, objetivo, tabuleiro), codigo_inicial)
+    volta = Direcao(tabuleiro, obter_heuristica(heuristica, codigo_inicial, tabuleiro), objetivo)
+    # (U, estado onde as buscas se encontraram)
+    melhor = (0, codigo_inicial) if codigo_inicial == objetivo else (float('inf'), None)
+
+    while True:
+        pr_ida, pr_volta = ida.pr_min(), volta.pr_min()
+        if pr_ida is None or pr_volta is None:
+            break
+        limite = max(min(pr_ida, pr_volta), ida.f_min(), volta.f_min(),
+                     ida.g_min() + volta.g_min() + 1)
+        if melhor[0] <= limite:
+            break
+        # Expande a direção de menor pr (a de ida nos empates)
+        if pr_ida <= pr_volta:
+            melhor = ida.expandir(volta, melhor)
+        else:
+            melhor = volta.expandir(ida, melhor)
+
+    nos_expandidos = ida.expandidos + volta.expandidos
+    if melhor[1] is None:
+        return None, nos_expandidos, time.time() - inicio
+
+    # Ida até o encontro, depois a volta percorrida ao contrário: cada
+    # movimento da busca de volta vira o movimento oposto (d ^ 1)
+    encontro = melhor[1]
+    movimentos = ida.movimentos_ate(encontro)
+    movimentos.extend(d ^ 1 for d in reversed(volta.movimentos_ate(encontro)))
+    return CaminhoPreguicoso(tabuleiro, codigo_inicial, movimentos), nos_expandidos, \
+        time.time() - inicio
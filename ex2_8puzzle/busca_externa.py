@@ -0,0 +1,352 @@
+'''
+A* com orçamento de memória e despejo em disco (A* externo).
+
+Os estados ficam em baldes indexados por (g, h), processados em ordem de
+f = g + h e, dentro do mesmo f, de g. A detecção de duplicados é adiada:
+um balde aberto só é ordenado e limpo de repetições na hora de ser
+expandido, quando dele também são subtraídos os baldes já expandidos
+(g - 1, h) e (g - 2, h). Com heurística consistente e custo unitário essas
+são as únicas camadas onde um estado pode reaparecer, então não é preciso
+manter todos os estados explorados em um conjunto na memória.
+
+Enquanto os estados guardados cabem no orçamento, tudo fica na memória.
+A conta é feita a cada estado guardado: assim que o orçamento é
+ultrapassado, os baldes abertos de menor prioridade (maior f) e depois os
+segmentos fechados mais antigos vão para arquivos ordenados, lidos de volta
+em fluxo (intercalação ordenada, em blocos proporcionais ao orçamento)
+quando necessários. Um balde grande demais para o orçamento (uma camada
+inteira da busca em largura, por exemplo) é despejado antes de ser
+expandido, e então lido do disco.
+
+    caminho, nos_expandidos, tempo = busca_externa(inicial, objetivo, memoria_mb=64)
+
+Com heuristica=None a busca é em largura, camada a camada.
+'''
+
+import heapq
+import os
+import tempfile
+import time
+from array import array
+from bisect import bisect_left
+
+from estado import obter_tabuleiro
+from heuristicas import obter_heuristica
+from pool_nos import CaminhoPreguicoso
+
+# Heurísticas consistentes: a subtração das camadas g - 1 e g - 2 depende disso
+CONSISTENTES = ('manhattan', 'padroes')
+ESTADOS_POR_BLOCO = 1 << 16  # Leitura dos arquivos em blocos deste tamanho
+
+
+class SemHeuristica:
+    """
+    h = 0 em todo estado, para a busca em largura.
+    """
+
+    def calcular(self, codigo):
+        return 0
+
+    def atualizar(self, h, codigo, peca, de, para):
+        return 0
+
+
+class Armazenamento:
+    """
+    Arquivos temporários com estados ordenados, um inteiro por registro.
+    Estados de até 64 bits usam array('Q'); os maiores (5x5), registros de
+    largura fixa em bytes.
+    """
+
+    def __init__(self, tabuleiro, diretorio, estados_por_bloco=ESTADOS_POR_BLOCO):
+        self.diretorio = diretorio
+        self.compacto = tabuleiro.bits * tabuleiro.casas <= 64
+        self.largura = 8 if self.compacto else (tabuleiro.bits * tabuleiro.casas + 7) // 8
+        self.estados_por_bloco = estados_por_bloco
+        self.arquivos = 0
+        self.bytes_escritos = 0
+
+    def novo_vetor(self):
+        return array('Q') if self.compacto else []
+
+    def escrever(self, codigos):
+        """
+        Grava estados já ordenados em um novo arquivo e retorna (caminho, quantidade).
+        """
+        caminho = os.path.join(self.diretorio, f"segmento_{self.arquivos:06d}.bin")
+        self.arquivos += 1
+        with open(caminho, 'wb') as arquivo:
+            if self.compacto:
+                if not isinstance(codigos, array):
+                    codigos = array('Q', codigos)
+                codigos.tofile(arquivo)
+            else:
+                arquivo.write(b''.join(c.to_bytes(self.largura, 'little') for c in codigos))
+        quantidade = len(codigos)
+        self.bytes_escritos += quantidade * self.largura
+        return caminho, quantidade
+
+    def ler(self, caminho):
+        """
+        Percorre os estados de um arquivo, em blocos.
+        """
+        with open(caminho, 'rb') as arquivo:
+            while True:
+                dados = arquivo.read(self.estados_por_bloco * self.largura)
+                if not dados:
+                    return
+                if self.compacto:
+                    bloco = array('Q')
+                    bloco.frombytes(dados)
+                    yield from bloco
+                else:
+                    largura = self.largura
+                    for i in range(0, len(dados), largura):
+                        yield int.from_bytes(dados[i:i + largura], 'little')
+
+    def contem(self, caminho, quantidade, codigo):
+        """
+        Busca binária de um estado em um arquivo ordenado.
+        """
+        largura = self.largura
+        with open(caminho, 'rb') as arquivo:
+            baixo, alto = 0, quantidade
+            while baixo < alto:
+                meio = (baixo + alto) // 2
+                arquivo.seek(meio * largura)
+                valor = int.from_bytes(arquivo.read(largura), 'little')
+                if valor < codigo:
+                    baixo = meio + 1
+                elif valor > codigo:
+                    alto = meio
+                else:
+                    return True
+        return False
+
+
+def _unicos(fluxo):
+    """
+    Remove repetições consecutivas de um fluxo ordenado.
+    """
+    anterior = None
+    for codigo in fluxo:
+        if codigo != anterior:
+            anterior = codigo
+            yield codigo
+
+
+def _subtrair(fluxo, removidos):
+    """
+    Estados do fluxo ordenado que não estão no fluxo ordenado `removidos`.
+    """
+    proximo = next(removidos, None)
+    for codigo in fluxo:
+        while proximo is not None and proximo < codigo:
+            proximo = next(removidos, None)
+        if codigo != proximo:
+            yield codigo
+
+
+class BaldeAberto:
+    """
+    Estados gerados para um (g, h), ainda com repetições. Os da memória
+    ficam na ordem de chegada; cada despejo grava um arquivo ordenado.
+    """
+
+    def __init__(self, armazenamento):
+        self.armazenamento = armazenamento
+        self.memoria = armazenamento.novo_vetor()
+        self.arquivos = []
+
+    def despejar(self):
+        if self.memoria:
+            self.arquivos.append(self.armazenamento.escrever(sorted(set(self.memoria))))
+            self.memoria = self.armazenamento.novo_vetor()
+
+    def ordenados(self):
+        """
+        Fluxo ordenado e sem repetições de todos os estados do balde.
+        """
+        fluxos = [self.armazenamento.ler(caminho) for caminho, _ in self.arquivos]
+        fluxos.append(iter(sorted(set(self.memoria))))
+        self.memoria = self.armazenamento.novo_vetor()
+        return _unicos(heapq.merge(*fluxos))
+
+
+class CamadaFechada:
+    """
+    Estados já expandidos de um (g, h), em segmentos ordenados e
+    crescentes (os do disco primeiro, depois o da memória).
+    """
+
+    def __init__(self, armazenamento):
+        self.armazenamento = armazenamento
+        self.memoria = armazenamento.novo_vetor()
+        self.arquivos = []
+
+    def adicionar(self, codigo):
+        self.memoria.append(codigo)  # Chega em ordem crescente
+
+    def despejar(self):
+        if self.memoria:
+            self.arquivos.append(self.armazenamento.escrever(self.memoria))
+            self.memoria = self.armazenamento.novo_vetor()
+
+    def ordenados(self):
+        for caminho, _ in self.arquivos:
+            yield from self.armazenamento.ler(caminho)
+        yield from list(self.memoria)
+
+    def contem(self, codigo):
+        i = bisect_left(self.memoria, codigo)
+        if i < len(self.memoria) and self.memoria[i] == codigo:
+            return True
+        return any(self.armazenamento.contem(caminho, quantidade, codigo)
+                   for caminho, quantidade in self.arquivos)
+
+
+def busca_externa(estado_inicial, estado_objetivo, heuristica='manhattan', memoria_mb=256,
+                  diretorio=None, relatorio=None):
+    """
+    A* (ou busca em largura) com os estados limitados a um orçamento de memória.
+
+    Args:
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (define o N)
+        heuristica: 'manhattan', 'padroes' (consistentes) ou None para busca em largura
+        memoria_mb: Orçamento, em MB, para os estados guardados na memória
+        diretorio: Onde criar os arquivos temporários (padrão: o do sistema).
+            São apagados ao final
+        relatorio: Dicionário opcional preenchido com 'arquivos', 'bytes_escritos',
+            'limite_estados' (o orçamento em estados) e 'pico_estados_memoria'
+
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo) com a solução ótima,
+        ou (None, nos_expandidos, tempo) se não houver solução
+    """
+    inicio = time.time()
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    objetivo = tabuleiro.empacotar(estado_objetivo)
+    if heuristica is None:
+        avaliador = SemHeuristica()
+    elif heuristica in CONSISTENTES:
+        avaliador = obter_heuristica(heuristica, objetivo, tabuleiro)
+    else:
+        raise ValueError(f"A busca externa requer heurística consistente ({', '.join(CONSISTENTES)}), "
+                         f"não {heuristica}")
+    codigo_inicial = tabuleiro.empacotar(estado_inicial)
+    if not tabuleiro.eh_soluvel(codigo_inicial, objetivo):
+        return None, 0, time.time() - inicio
+
+    with tempfile.TemporaryDirectory(prefix='busca_externa_', dir=diretorio) as temporario:
+        compacto = tabuleiro.bits * tabuleiro.casas <= 64
+        # Estimativa de bytes por estado na memória (array de uint64 ou lista de int)
+        limite_estados = int(memoria_mb * 2 ** 20) // (8 if compacto else 48)
+        # Cada fluxo lido do disco ocupa um bloco: uma fração do orçamento
+        armazenamento = Armazenamento(tabuleiro, temporario,
+                                      max(1, min(ESTADOS_POR_BLOCO, limite_estados // 16)))
+        abertos = {}  # (g, h) -> BaldeAberto
+        fechados = {}  # (g, h) -> CamadaFechada
+        h_inicial = avaliador.calcular(codigo_inicial)
+        abertos[(0, h_inicial)] = BaldeAberto(armazenamento)
+        abertos[(0, h_inicial)].memoria.append(codigo_inicial)
+        nos_expandidos = 0
+        em_memoria = 1  # Estados nos vetores em memória dos baldes e camadas
+        pico = 1
+
+        def controlar_memoria():
+            """
+            Despeja baldes em disco até o total na memória voltar à metade do
+            orçamento: primeiro os abertos de maior f, depois os fechados de menor g.
+            """
+            nonlocal em_memoria, pico
+            pico = max(pico, em_memoria)
+            candidatos = sorted(abertos.items(), key=lambda item: (-sum(item[0]), item[0][0]))
+            candidatos += sorted(fechados.items(), key=lambda item: item[0][0])
+            for _, segmento in candidatos:
+                if em_memoria <= limite_estados // 2:
+                    break
+                em_memoria -= len(segmento.memoria)
+                segmento.despejar()
+
+        objetivo_g = None
+        while abertos:
+            g, h = min(abertos, key=lambda chave: (chave[0] + chave[1], chave[0]))
+            balde = abertos.pop((g, h))
+            camada = CamadaFechada(armazenamento)
+            fechados[(g, h)] = camada
+            # O balde ordenado fica na memória durante a expansão, a não ser
+            # que seja lido do disco
+            if len(balde.memoria) > limite_estados // 2:
+                em_memoria -= len(balde.memoria)
+                balde.despejar()
+            no_balde = len(balde.memoria)
+
+            # Detecção adiada de duplicados: ordena, tira repetições e
+            # subtrai as camadas anteriores com o mesmo h
+            anteriores = [fechados[chave].ordenados() for chave in ((g - 1, h), (g - 2, h))
+                          if chave in fechados]
+            fluxo = balde.ordenados()
+            if anteriores:
+                fluxo = _subtrair(fluxo, _unicos(heapq.merge(*anteriores)))
+
+            for codigo in fluxo:
+                camada.adicionar(codigo)
+                em_memoria += 1
+                if codigo == objetivo:
+                    objetivo_g = g
+                    break
+                nos_expandidos += 1
+                vazio = tabuleiro.posicao_vazio(codigo)
+                for destino_vazio in tabuleiro.vizinhos[vazio]:
+                    destino = destino_vazio[1]
+                    novo, peca = tabuleiro.mover(codigo, vazio, destino)
+                    h_novo = avaliador.atualizar(h, novo, peca, destino, vazio)
+                    sucessor = abertos.get((g + 1, h_novo))
+                    if sucessor is None:
+                        sucessor = abertos[(g + 1, h_novo)] = BaldeAberto(armazenamento)
+                    sucessor.memoria.append(novo)
+                    em_memoria += 1
+                    if em_memoria > limite_estados:
+                        controlar_memoria()
+                if em_memoria > limite_estados:
+                    controlar_memoria()
+            pico = max(pico, em_memoria)
+            em_memoria -= no_balde
+            if objetivo_g is not None:
+                break
+
+        caminho = None
+        if objetivo_g is not None:
+            caminho = _reconstruir(tabuleiro, avaliador, fechados, codigo_inicial, objetivo,
+                                   objetivo_g)
+        if relatorio is not None:
+            relatorio.update(arquivos=armazenamento.arquivos,
+                             bytes_escritos=armazenamento.bytes_escritos,
+                             limite_estados=limite_estados, pico_estados_memoria=pico)
+    return caminho, nos_expandidos, time.time() - inicio
+
+
+def _reconstruir(tabuleiro, avaliador, fechados, codigo_inicial, objetivo, g):
+    """
+    Volta do objetivo ao início procurando, a cada passo, um vizinho na
+    camada fechada (g - 1, h do vizinho).
+    """
+    movimentos = bytearray()
+    codigo = objetivo
+    h = avaliador.calcular(objetivo)
+    while g > 0:
+        vazio = tabuleiro.posicao_vazio(codigo)
+        for d, destino in tabuleiro.direcoes[vazio]:
+            anterior, peca = tabuleiro.mover(codigo, vazio, destino)
+            h_anterior = avaliador.atualizar(h, anterior, peca, destino, vazio)
+            camada = fechados.get((g - 1, h_anterior))
+            if camada is not None and camada.contem(anterior):
+                # Do anterior para o atual o vazio faz o movimento oposto a d
+                movimentos.append(d ^ 1)
+                codigo, h, g = anterior, h_anterior, g - 1
+                break
+        else:
+            raise RuntimeError("Camada anterior não encontrada na reconstrução do caminho")
+    movimentos.reverse()
+    return CaminhoPreguicoso(tabuleiro, codigo_inicial, movimentos)
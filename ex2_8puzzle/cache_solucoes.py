@@ -0,0 +1,152 @@
+'''
+Cache de soluções entre consultas, com objetivos renomeados.
+
+Qualquer par (inicial, objetivo) pode ser reduzido a (inicial', objetivo
+canônico) renomeando as peças (ver Tabuleiro.renomear); como os movimentos
+do vazio não dependem dos números das peças, a sequência de ações que
+resolve um resolve o outro. O cache guarda essas sequências indexadas pelo
+estado inicial canônico, em ordem LRU e com tamanho limitado, de modo que
+consultas repetidas ou equivalentes (o mesmo embaralhamento com outro
+objetivo) não fazem nenhuma busca:
+
+    cache = CacheSolucoes(capacidade=10000)
+    caminho, nos_expandidos, tempo = cache.resolver(inicial, objetivo)
+'''
+
+import time
+from collections import OrderedDict
+
+from estado import MOVIMENTOS, obter_tabuleiro
+from pool_nos import CaminhoPreguicoso
+
+
+class CacheSolucoes:
+    """
+    Cache LRU de sequências de movimentos por estado inicial canônico.
+
+    Args:
+        capacidade: Máximo de soluções guardadas; ao passar dele, a usada há
+            mais tempo é descartada
+        busca: Função de busca usada nas consultas que não estão no cache,
+            com a assinatura de busca_a_estrela (padrão: busca_a_estrela).
+            Deve ser ótima para que as soluções do cache também sejam
+        heuristica: Heurística passada para a busca. Com 'padroes', as
+            consultas cujo objetivo não tem o vazio no canto final usam
+            'conflito_linear', pois os bancos de padrões só existem para o
+            objetivo ordenado
+    """
+
+    def __init__(self, capacidade=4096, busca=None, heuristica='manhattan'):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser pelo menos 1")
+        if busca is None:
+            from main import busca_a_estrela
+            busca = busca_a_estrela
+        self.capacidade = capacidade
+        self.busca = busca
+        self.heuristica = heuristica
+        # (lado, vazio do objetivo, inicial renomeado) -> bytes com os movimentos
+        self.solucoes = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+        self.descartadas = 0
+
+    @staticmethod
+    def chave(tabuleiro, codigo, objetivo):
+        """
+        Chave canônica de uma consulta com estados empacotados.
+        """
+        renomeado, vazio = tabuleiro.renomear(codigo, objetivo)
+        return tabuleiro.lado, vazio, renomeado
+
+    def consultar(self, estado_inicial, estado_objetivo):
+        """
+        Procura a solução de uma consulta no cache.
+
+        Returns:
+            CaminhoPreguicoso a partir do estado inicial original, ou None se
+            a consulta (ou uma equivalente) ainda não foi resolvida
+        """
+        tabuleiro = obter_tabuleiro(len(estado_objetivo))
+        codigo = tabuleiro.empacotar(estado_inicial)
+        return self._consultar(tabuleiro, codigo,
+                               self.chave(tabuleiro, codigo, tabuleiro.empacotar(estado_objetivo)))
+
+    def _consultar(self, tabuleiro, codigo, chave):
+        movimentos = self.solucoes.get(chave)
+        if movimentos is None:
+            self.falhas += 1
+            return None
+        self.solucoes.move_to_end(chave)
+        self.acertos += 1
+        # Os mesmos movimentos, refeitos a partir do estado do chamador
+        return CaminhoPreguicoso(tabuleiro, codigo, movimentos)
+
+    def guardar(self, estado_inicial, estado_objetivo, caminho):
+        """
+        Guarda a solução de uma consulta.
+
+        Args:
+            caminho: Sequência de pares (acao, estado), como a devolvida pelas
+                buscas, ou só a lista com os nomes das ações
+        """
+        tabuleiro = obter_tabuleiro(len(estado_objetivo))
+        self._guardar(self.chave(tabuleiro, tabuleiro.empacotar(estado_inicial),
+                                 tabuleiro.empacotar(estado_objetivo)), caminho)
+
+    def _guardar(self, chave, caminho):
+        if isinstance(caminho, CaminhoPreguicoso):
+            movimentos = caminho.movimentos
+        else:
+            nomes = [acao for acao, _, _ in MOVIMENTOS]
+            movimentos = bytes(nomes.index(passo if isinstance(passo, str) else passo[0])
+                               for passo in caminho)
+        self.solucoes[chave] = movimentos
+        self.solucoes.move_to_end(chave)
+        while len(self.solucoes) > self.capacidade:
+            self.solucoes.popitem(last=False)
+            self.descartadas += 1
+        return movimentos
+
+    def resolver(self, estado_inicial, estado_objetivo):
+        """
+        Resolve pelo cache ou, se não estiver nele, pela busca (guardando o
+        resultado).
+
+        Returns:
+            Tupla (caminho, nos_expandidos, tempo), como busca_a_estrela; em
+            um acerto nos_expandidos é 0
+        """
+        inicio = time.time()
+        tabuleiro = obter_tabuleiro(len(estado_objetivo))
+        codigo = tabuleiro.empacotar(estado_inicial)
+        chave = self.chave(tabuleiro, codigo, tabuleiro.empacotar(estado_objetivo))
+        caminho = self._consultar(tabuleiro, codigo, chave)
+        if caminho is not None:
+            return caminho, 0, time.time() - inicio
+
+        # A busca é feita na consulta canônica: com o vazio do objetivo no
+        # canto, o objetivo canônico é o ordenado e os bancos de padrões servem
+        _, vazio, renomeado = chave
+        objetivo = tabuleiro.objetivo_canonico(vazio)
+        heuristica = self.heuristica
+        if heuristica == 'padroes' and objetivo != tabuleiro.objetivo_padrao:
+            heuristica = 'conflito_linear'
+        caminho, nos_expandidos, _ = self.busca(
+            tabuleiro.desempacotar(renomeado), tabuleiro.desempacotar(objetivo), heuristica)
+        if caminho is None:
+            return None, nos_expandidos, time.time() - inicio
+        movimentos = self._guardar(chave, caminho)
+        return CaminhoPreguicoso(tabuleiro, codigo, movimentos), nos_expandidos, time.time() - inicio
+
+    def limpar(self):
+        self.solucoes.clear()
+
+    def __len__(self):
+        return len(self.solucoes)
+
+    def __contains__(self, consulta):
+        estado_inicial, estado_objetivo = consulta
+        tabuleiro = obter_tabuleiro(len(estado_objetivo))
+        return self.chave(tabuleiro, tabuleiro.empacotar(estado_inicial),
+                          tabuleiro.empacotar(estado_objetivo)) in self.solucoes
@@ -0,0 +1,202 @@
+'''
+Codificação compacta dos estados do quebra-cabeça deslizante N×N.
+
+Cada estado é um inteiro com um número fixo de bits por casa (4 bits até
+o 15-puzzle, 5 bits no 24-puzzle): a peça da posição p (ordem linha a
+linha) ocupa os bits [bits * p, bits * (p + 1)). Assim um estado cabe em
+um único int do Python, pode ser usado diretamente como chave de
+conjuntos/dicionários e mover uma peça é apenas uma soma.
+
+As informações que dependem do tamanho do tabuleiro ficam em um objeto
+Tabuleiro, obtido com obter_tabuleiro(lado).
+'''
+
+from functools import lru_cache
+
+LADO = 3  # Dimensão padrão do tabuleiro (8-puzzle)
+
+# Movimentos do espaço vazio (nome, delta_linha, delta_coluna)
+MOVIMENTOS = [
+    ('Cima', -1, 0),
+    ('Baixo', 1, 0),
+    ('Esquerda', 0, -1),
+    ('Direita', 0, 1)
+]
+
+
+class Tabuleiro:
+    """
+    Dados pré-calculados de um tabuleiro lado×lado.
+
+    Args:
+        lado: Dimensão do tabuleiro (3 para o 8-puzzle, 4 para o 15-puzzle...)
+    """
+
+    def __init__(self, lado):
+        self.lado = lado
+        self.casas = lado * lado  # Número de posições
+        self.bits = max(4, (self.casas - 1).bit_length())  # Bits por casa
+        self.mascara = (1 << self.bits) - 1
+
+        # Para cada posição do vazio, os movimentos válidos (acao, destino);
+        # em `direcoes` a ação vem como índice em MOVIMENTOS (cabe em 2 bits)
+        self.vizinhos = []
+        self.direcoes = []
+        for posicao in range(self.casas):
+            i, j = divmod(posicao, lado)
+            validos = []
+            indices = []
+            for indice, (acao, di, dj) in enumerate(MOVIMENTOS):
+                nova_i, nova_j = i + di, j + dj
+                if 0 <= nova_i < lado and 0 <= nova_j < lado:
+                    validos.append((acao, nova_i * lado + nova_j))
+                    indices.append((indice, nova_i * lado + nova_j))
+            self.vizinhos.append(validos)
+            self.direcoes.append(indices)
+        # Deslocamento do vazio, em posições, para cada movimento
+        self.passos = [di * lado + dj for _, di, dj in MOVIMENTOS]
+
+        # Objetivo ordenado com o vazio no canto inferior direito
+        self.objetivo_padrao = self.empacotar(
+            [[(i * lado + j + 1) % self.casas for j in range(lado)] for i in range(lado)])
+
+    def empacotar(self, estado):
+        """
+        Converte uma matriz lado×lado no inteiro empacotado.
+
+        Args:
+            estado: Matriz (lista de listas) com as peças
+
+        Returns:
+            Inteiro com `bits` bits por casa
+        """
+        codigo = 0
+        deslocamento = 0
+        for linha in estado:
+            for valor in linha:
+                codigo |= valor << deslocamento
+                deslocamento += self.bits
+        return codigo
+
+    def desempacotar(self, codigo):
+        """
+        Converte um inteiro empacotado de volta na matriz lado×lado.
+        """
+        valores = [(codigo >> (self.bits * p)) & self.mascara for p in range(self.casas)]
+        return [valores[i:i + self.lado] for i in range(0, self.casas, self.lado)]
+
+    def peca_em(self, codigo, posicao):
+        """
+        Retorna a peça que ocupa uma posição do estado empacotado.
+        """
+        return (codigo >> (self.bits * posicao)) & self.mascara
+
+    def posicao_vazio(self, codigo):
+        """
+        Localiza o espaço vazio (0) no estado empacotado.
+
+        Returns:
+            Índice da posição, ou -1 se não houver vazio
+        """
+        for posicao in range(self.casas):
+            if not (codigo >> (self.bits * posicao)) & self.mascara:
+                return posicao
+        return -1
+
+    def mover(self, codigo, vazio, destino):
+        """
+        Desliza a peça de `destino` para a posição `vazio`.
+
+        Args:
+            codigo: Estado empacotado
+            vazio: Posição atual do espaço vazio
+            destino: Posição da peça que será movida (nova posição do vazio)
+
+        Returns:
+            Tupla (novo_codigo, peca) com o estado resultante e a peça movida
+        """
+        peca = (codigo >> (self.bits * destino)) & self.mascara
+        return codigo - (peca << (self.bits * destino)) + (peca << (self.bits * vazio)), peca
+
+    def contar_inversoes(self, codigo):
+        """
+        Conta os pares de peças fora de ordem (ignorando o vazio).
+        """
+        pecas = [self.peca_em(codigo, p) for p in range(self.casas) if self.peca_em(codigo, p)]
+        inversoes = 0
+        for i, peca in enumerate(pecas):
+            for outra in pecas[i + 1:]:
+                if peca > outra:
+                    inversoes += 1
+        return inversoes
+
+    def paridade(self, codigo):
+        """
+        Invariante de paridade do estado. Com lado ímpar cada movimento
+        preserva a paridade das inversões; com lado par um movimento vertical
+        muda as inversões em lado - 1 (ímpar) e a linha do vazio em 1, então
+        a soma das duas é que se mantém.
+        """
+        inversoes = self.contar_inversoes(codigo)
+        if self.lado % 2 == 0:
+            inversoes += self.posicao_vazio(codigo) // self.lado
+        return inversoes % 2
+
+    def eh_soluvel(self, codigo, objetivo):
+        """
+        Verifica se `objetivo` é alcançável a partir de `codigo`.
+        """
+        return self.paridade(codigo) == self.paridade(objetivo)
+
+    def objetivo_canonico(self, vazio):
+        """
+        Objetivo com as peças 1 a N²-1 em ordem e o vazio na posição `vazio`.
+        """
+        pecas = list(range(1, self.casas))
+        pecas.insert(vazio, 0)
+        codigo = 0
+        for posicao, peca in enumerate(pecas):
+            codigo |= peca << (self.bits * posicao)
+        return codigo
+
+    def renomear(self, codigo, objetivo):
+        """
+        Renomeia as peças de `codigo` de forma que `objetivo` vire o objetivo
+        canônico com o vazio na mesma posição. Os movimentos do vazio não
+        dependem dos números das peças, então a solução do estado renomeado
+        vale para o original.
+
+        Returns:
+            Tupla (codigo_renomeado, vazio_do_objetivo)
+        """
+        vazio = self.posicao_vazio(objetivo)
+        canonico = self.objetivo_canonico(vazio)
+        nome = [0] * self.casas  # nome[peca do objetivo] = peca do objetivo canônico
+        for posicao in range(self.casas):
+            nome[self.peca_em(objetivo, posicao)] = self.peca_em(canonico, posicao)
+        renomeado = 0
+        for posicao in range(self.casas):
+            renomeado |= nome[self.peca_em(codigo, posicao)] << (self.bits * posicao)
+        return renomeado, vazio
+
+
+@lru_cache(maxsize=None)
+def obter_tabuleiro(lado=LADO):
+    """
+    Retorna o Tabuleiro (compartilhado) de uma dimensão.
+    """
+    return Tabuleiro(lado)
+
+
+def empacotar(estado):
+    """
+    Empacota uma matriz quadrada, deduzindo o lado pelo número de linhas.
+    """
+    return obter_tabuleiro(len(estado)).empacotar(estado)
+
+
+def desempacotar(codigo, lado=LADO):
+    """
+    Desempacota um estado de um tabuleiro lado×lado.
+    """
+    return obter_tabuleiro(lado).desempacotar(codigo)
@@ -0,0 +1,175 @@
+'''
+Estatísticas e ganchos de observação da busca A*.
+
+Passe um objeto EstatisticasBusca para busca_a_estrela e ele é preenchido
+durante a busca:
+
+    estatisticas = EstatisticasBusca(intervalo_progresso=10000, ao_progresso=print)
+    busca_a_estrela(inicial, objetivo, estatisticas=estatisticas)
+    estatisticas.salvar_json('execucao.json')
+
+Sem o objeto (o padrão), a busca só faz um teste `is not None` por nó.
+'''
+
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows não tem o módulo resource
+    resource = None
+
+
+def pico_memoria_kb():
+    """
+    Pico de memória residente (RSS) do processo em KB, ou None se indisponível.
+    """
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # No macOS ru_maxrss vem em bytes; no Linux, em KB
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+class EstatisticasBusca:
+    """
+    Métricas de uma execução da busca, com ganchos opcionais.
+
+    Args:
+        intervalo_progresso: A cada quantos nós expandidos gerar um retrato do
+            progresso (0 desativa)
+        ao_progresso: Função chamada com o dicionário de cada retrato
+        ao_expandir: Função chamada com cada nó expandido
+        ao_gerar: Função chamada com cada sucessor gerado
+    """
+
+    def __init__(self, intervalo_progresso=0, ao_progresso=None, ao_expandir=None, ao_gerar=None):
+        self.intervalo_progresso = intervalo_progresso
+        self.ao_progresso = ao_progresso
+        self.ao_expandir = ao_expandir
+        self.ao_gerar = ao_gerar
+
+        self.nos_gerados = 0
+        self.nos_expandidos = 0
+        self.duplicados_descartados = 0  # Sucessores já conhecidos por um caminho tão barato
+        self.entradas_obsoletas = 0  # Entradas removidas da fila por remoção preguiçosa
+        self.pico_aberta = 0  # Maior tamanho da fronteira
+        self.estados_armazenados = 0  # Estados no mapa de melhor g ao final
+        self.nos_armazenados = 0  # Nós no pool ao final (ele só cresce: é o pico)
+        self.pico_rss_kb = None
+        self.tempo = 0.0
+        self.nos_por_segundo = 0.0
+        self.custo_solucao = None
+        self.limite_subotimo = None  # A solução custa no máximo isto vezes a ótima
+        self.camadas_f = {}  # prioridade -> {'expandidos': n, 'tempo': segundos}
+        self.progresso = []  # Retratos periódicos
+
+        self._inicio = None
+        self._f_atual = None
+        self._inicio_camada = None
+
+    def iniciar(self):
+        self._inicio = time.perf_counter()
+        self._inicio_camada = self._inicio
+
+    def registrar_expansao(self, no, tamanho_aberta, prioridade=None):
+        """
+        Chamado pela busca a cada nó expandido.
+
+        Args:
+            prioridade: Chave de ordenação da fronteira para o nó (g + w·h no
+                A* ponderado); padrão: no.f
+        """
+        self.nos_expandidos += 1
+        if tamanho_aberta > self.pico_aberta:
+            self.pico_aberta = tamanho_aberta
+
+        # Tempo por camada de prioridade: fecha a anterior quando ela muda
+        f = no.f if prioridade is None else prioridade
+        if f != self._f_atual:
+            self._fechar_camada()
+            self._f_atual = f
+        self.camadas_f.setdefault(f, {'expandidos': 0, 'tempo': 0.0})['expandidos'] += 1
+
+        if self.ao_expandir is not None:
+            self.ao_expandir(no)
+        if self.intervalo_progresso and self.nos_expandidos % self.intervalo_progresso == 0:
+            retrato = self.retrato(f)
+            self.progresso.append(retrato)
+            if self.ao_progresso is not None:
+                self.ao_progresso(retrato)
+
+    def registrar_sucessor(self, sucessor, inserido):
+        """
+        Chamado pela busca para cada sucessor gerado.
+        """
+        self.nos_gerados += 1
+        if not inserido:
+            self.duplicados_descartados += 1
+        if self.ao_gerar is not None:
+            self.ao_gerar(sucessor)
+
+    def registrar_obsoleta(self):
+        self.entradas_obsoletas += 1
+
+    def _fechar_camada(self):
+        agora = time.perf_counter()
+        if self._f_atual is not None:
+            self.camadas_f[self._f_atual]['tempo'] += agora - self._inicio_camada
+        self._inicio_camada = agora
+
+    def retrato(self, f_atual=None):
+        """
+        Dicionário com o estado atual da busca.
+        """
+        decorrido = time.perf_counter() - self._inicio
+        return {
+            'tempo': decorrido,
+            'nos_expandidos': self.nos_expandidos,
+            'nos_gerados': self.nos_gerados,
+            'pico_aberta': self.pico_aberta,
+            'f_atual': f_atual,
+            'nos_por_segundo': self.nos_expandidos / decorrido if decorrido else 0.0,
+            'pico_rss_kb': pico_memoria_kb(),
+        }
+
+    def finalizar(self, estados_armazenados, custo_solucao=None, limite_subotimo=1,
+                  nos_armazenados=0):
+        """
+        Chamado pela busca ao terminar, com ou sem solução.
+        """
+        self._fechar_camada()
+        self.tempo = time.perf_counter() - self._inicio
+        self.nos_por_segundo = self.nos_expandidos / self.tempo if self.tempo else 0.0
+        self.estados_armazenados = estados_armazenados
+        self.nos_armazenados = nos_armazenados
+        self.custo_solucao = custo_solucao
+        self.limite_subotimo = limite_subotimo if custo_solucao is not None else None
+        self.pico_rss_kb = pico_memoria_kb()
+
+    def para_dicionario(self):
+        return {
+            'nos_gerados': self.nos_gerados,
+            'nos_expandidos': self.nos_expandidos,
+            'duplicados_descartados': self.duplicados_descartados,
+            'entradas_obsoletas': self.entradas_obsoletas,
+            'pico_aberta': self.pico_aberta,
+            'estados_armazenados': self.estados_armazenados,
+            'nos_armazenados': self.nos_armazenados,
+            'pico_rss_kb': self.pico_rss_kb,
+            'tempo': self.tempo,
+            'nos_por_segundo': self.nos_por_segundo,
+            'custo_solucao': self.custo_solucao,
+            'limite_subotimo': self.limite_subotimo,
+            # Chaves JSON precisam ser texto
+            'camadas_f': {str(f): dados for f, dados in sorted(self.camadas_f.items())},
+            'progresso': self.progresso,
+        }
+
+    def para_json(self, **opcoes):
+        return json.dumps(self.para_dicionario(), **opcoes)
+
+    def salvar_json(self, caminho):
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(self.para_json(indent=2))
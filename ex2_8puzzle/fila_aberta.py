@@ -0,0 +1,141 @@
+'''
+Filas de prioridade para a lista aberta (fronteira) do A*.
+
+Todas as filas têm a mesma interface:
+    inserir(f, chave, item): adiciona um item com prioridade f e chave de desempate
+    remover(): retira o item de menor (f, chave); entre iguais, o mais antigo (FIFO)
+    len(fila): número de itens
+
+FilaBaldes aproveita que no quebra-cabeça f e h são inteiros pequenos: guarda
+um vetor de baldes indexado por f e, dentro de cada f, pela chave (h), com
+inserção e remoção O(1) amortizado. FilaHeap usa heapq e aceita prioridades
+quaisquer (por exemplo f não inteiro no A* ponderado).
+'''
+
+import heapq
+from collections import deque
+
+
+class FilaHeap:
+    """
+    Fila de prioridade sobre heapq, com tuplas (f, chave, ordem de chegada, item).
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.contador = 0  # Ordem de chegada, para o desempate FIFO
+
+    def inserir(self, f, chave, item):
+        heapq.heappush(self.heap, (f, chave, self.contador, item))
+        self.contador += 1
+
+    def remover(self):
+        return heapq.heappop(self.heap)[3]
+
+    def menor_f(self):
+        return self.heap[0][0]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class FilaBaldes:
+    """
+    Fila de baldes indexada por f (inteiro >= 0) e, dentro de cada f, pela
+    chave (inteiro >= 0). Cada balde é uma deque, o que dá a ordem FIFO.
+
+    Guarda uma referência ao balde do menor (f, chave) ocupado, então
+    inserir e remover são uma indexação e um append/popleft; os ponteiros só
+    andam quando esse balde esvazia. Sozinha, com poucos itens e prioridades
+    sorteadas, ela não é mais rápida que FilaHeap (o heapq é C); compensa
+    quando a fila é grande e os f andam aos poucos, como no A* do
+    quebra-cabeça (ver `python benchmark.py filas`).
+    """
+
+    def __init__(self):
+        self.baldes = []  # baldes[f][chave] = deque de itens
+        self.tamanhos = []  # Número de itens em cada f
+        self.f_min = 0  # Menor f ocupado (limite inferior se o balde atual esvaziou)
+        self.chave_min = 0  # Menor chave ocupada em f_min (idem)
+        self.balde_min = None  # baldes[f_min][chave_min]
+        self.tamanho = 0
+
+    def _criar(self, f, chave):
+        """
+        Cria os baldes que faltam até baldes[f][chave].
+        """
+        if f >= len(self.baldes):
+            faltam = f + 1 - len(self.baldes)
+            self.baldes.extend([] for _ in range(faltam))
+            self.tamanhos.extend([0] * faltam)
+        camada = self.baldes[f]
+        if chave >= len(camada):
+            camada.extend(deque() for _ in range(chave + 1 - len(camada)))
+        return camada[chave]
+
+    def inserir(self, f, chave, item):
+        try:
+            balde = self.baldes[f][chave]
+        except IndexError:
+            balde = self._criar(f, chave)
+        balde.append(item)
+        self.tamanhos[f] += 1
+        # Com heurística inconsistente f pode ser menor que o mínimo atual
+        if not self.tamanho or f < self.f_min or (f == self.f_min and chave < self.chave_min):
+            self.f_min = f
+            self.chave_min = chave
+            self.balde_min = balde
+        self.tamanho += 1
+
+    def _avancar(self):
+        """
+        Move os ponteiros até o primeiro balde não vazio.
+        """
+        tamanhos = self.tamanhos
+        f = self.f_min
+        chave = self.chave_min
+        if not tamanhos[f]:
+            f += 1
+            while not tamanhos[f]:
+                f += 1
+            chave = 0
+        camada = self.baldes[f]
+        while not camada[chave]:
+            chave += 1
+        self.f_min = f
+        self.chave_min = chave
+        self.balde_min = camada[chave]
+        return self.balde_min
+
+    def remover(self):
+        balde = self.balde_min
+        if not balde:
+            if not self.tamanho:
+                raise IndexError("remover de fila vazia")
+            balde = self._avancar()
+        self.tamanhos[self.f_min] -= 1
+        self.tamanho -= 1
+        return balde.popleft()
+
+    def menor_f(self):
+        if not self.balde_min:
+            self._avancar()
+        return self.f_min
+
+    def __len__(self):
+        return self.tamanho
+
+
+FILAS = {
+    'heap': FilaHeap,
+    'baldes': FilaBaldes,
+}
+
+
+def criar_fila(nome='baldes'):
+    """
+    Cria uma fila vazia pelo nome ('heap' ou 'baldes').
+    """
+    if nome not in FILAS:
+        raise ValueError(f"Fila desconhecida: {nome}")
+    return FILAS[nome]()
@@ -0,0 +1,344 @@
+'''
+A* paralelo distribuído por hash (HDA*).
+
+Cada estado tem um processo dono, escolhido pelo hash do inteiro
+empacotado. Cada processo guarda a fronteira e o mapa de melhor g apenas
+dos seus estados: ao expandir um nó, os sucessores de outros donos são
+acumulados e enviados em lotes pela fila de entrada do dono.
+
+A solução encontrada primeiro não é necessariamente ótima. O menor custo
+conhecido (incumbente) é compartilhado; cada processo só expande nós com
+f menor que ele, e a busca termina quando nenhum processo tem trabalho e
+não há mensagens em trânsito. Isso é detectado pelo coordenador com o
+método dos quatro contadores: duas leituras dos totais de lotes enviados
+e recebidos, iguais entre si, com todos os processos ociosos entre elas.
+Se um processo morre, o coordenador encerra os outros e levanta
+ErroTrabalhador em vez de esperar para sempre.
+
+    caminho, nos_expandidos, tempo = busca_hda(inicial, objetivo, processos=8)
+
+Para medir a escalabilidade (aceleração e eficiência por número de
+processos) em instâncias do 15-puzzle:
+
+    python hda.py [instâncias] [passos]
+'''
+
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+from estado import obter_tabuleiro
+from fila_aberta import criar_fila
+from heuristicas import obter_heuristica
+from pool_nos import CaminhoPreguicoso
+
+INFINITO = 2 ** 31 - 1
+MASCARA_64 = (1 << 64) - 1
+ESPERA_RESPOSTA = 0.1  # Segundos entre verificações dos processos enquanto espera
+
+
+class ErroTrabalhador(RuntimeError):
+    """
+    Um processo da busca terminou antes da hora (exceção ou sinal).
+    """
+
+
+def _conferir_trabalhadores(trabalhadores):
+    """
+    Raises:
+        ErroTrabalhador: se algum processo já terminou
+    """
+    for i, trabalhador in enumerate(trabalhadores):
+        if trabalhador.exitcode is not None:
+            raise ErroTrabalhador(
+                f"O processo {i} do HDA* terminou com código {trabalhador.exitcode}")
+
+
+def dono(codigo, processos):
+    """
+    Processo dono de um estado. O hash multiplicativo espalha os bits
+    altos do código, que variam pouco entre estados vizinhos.
+    """
+    return (((hash(codigo) * 0x9E3779B97F4A7C15) & MASCARA_64) >> 32) % processos
+
+
+def _trabalhador(indice, processos, lado, heuristica, objetivo, caixas, respostas, incumbente,
+                 parar, enviados, recebidos, ociosos, expandidos, inicial, tamanho_lote):
+    """
+    Laço de um processo: recebe lotes de nós, expande os seus e envia os
+    sucessores aos donos. Depois da parada, responde às consultas de pais
+    usadas para reconstruir o caminho.
+
+    Cada nó trafega como a tupla (codigo, g, h, vazio, pai, movimento).
+    """
+    tabuleiro = obter_tabuleiro(lado)
+    avaliador = obter_heuristica(heuristica, objetivo, tabuleiro)
+    mover, atualizar, direcoes = tabuleiro.mover, avaliador.atualizar, tabuleiro.direcoes
+    caixa = caixas[indice]
+    coordenador = multiprocessing.parent_process()
+    aberta = criar_fila('baldes')
+    melhor_g = {}
+    pais = {}  # codigo -> (codigo do pai, índice do movimento)
+    saida = [[] for _ in range(processos)]  # Lotes a enviar para cada dono
+
+    def receber(no):
+        codigo, g, h, vazio, pai, d = no
+        if g < melhor_g.get(codigo, g + 1):
+            melhor_g[codigo] = g
+            pais[codigo] = (pai, d)
+            if codigo == objetivo:
+                with incumbente.get_lock():
+                    if g < incumbente.value:
+                        incumbente.value = g
+            aberta.inserir(g + h, h, (codigo, g, h, vazio))
+
+    def entregar(mensagem):
+        # Fica ativo antes de contar o lote como recebido (ver detecção de término)
+        ociosos[indice] = 0
+        for no in mensagem:
+            receber(no)
+        recebidos[indice] += 1
+
+    def enviar_tudo():
+        for destino, lote in enumerate(saida):
+            if lote:
+                enviados[indice] += 1
+                caixas[destino].put(lote)
+                saida[destino] = []
+
+    if inicial is not None:
+        receber(inicial)
+
+    # Lotes de nós chegam como listas; mensagens de controle, como tuplas
+    controle = None
+    while controle is None and not parar.value:
+        while True:
+            try:
+                mensagem = caixa.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(mensagem, tuple):
+                controle = mensagem
+                break
+            entregar(mensagem)
+        if controle is not None:
+            break
+
+        limite = incumbente.value
+        feitos = 0
+        while aberta and feitos < tamanho_lote and aberta.menor_f() < limite:
+            codigo, g, h, vazio = aberta.remover()
+            if g > melhor_g[codigo]:
+                continue  # Remoção preguiçosa
+            feitos += 1
+            g_sucessor = g + 1
+            for d, destino in direcoes[vazio]:
+                novo, peca = mover(codigo, vazio, destino)
+                h_sucessor = atualizar(h, novo, peca, destino, vazio)
+                if g_sucessor + h_sucessor >= limite:
+                    continue  # Não pode melhorar o incumbente
+                no = (novo, g_sucessor, h_sucessor, destino, codigo, d)
+                alvo = dono(novo, processos)
+                if alvo == indice:
+                    receber(no)
+                else:
+                    saida[alvo].append(no)
+        expandidos[indice] += feitos
+        enviar_tudo()
+
+        if not feitos:
+            # Sem nó com f abaixo do incumbente: fica ocioso até chegar um lote
+            ociosos[indice] = 1
+            try:
+                mensagem = caixa.get(timeout=0.005)
+            except queue.Empty:
+                if not coordenador.is_alive():
+                    return
+                continue
+            if isinstance(mensagem, tuple):
+                controle = mensagem
+            else:
+                entregar(mensagem)
+
+    # Fase de reconstrução: consultas ('pai', codigo) até receber ('fim',);
+    # lotes que ainda estavam na fila são descartados
+    while True:
+        if controle is not None:
+            mensagem, controle = controle, None
+        else:
+            try:
+                mensagem = caixa.get(timeout=ESPERA_RESPOSTA)
+            except queue.Empty:
+                if not coordenador.is_alive():
+                    return
+                continue
+        if isinstance(mensagem, tuple):
+            if mensagem[0] == 'fim':
+                break
+            respostas.put(pais[mensagem[1]])
+
+
+def busca_hda(estado_inicial, estado_objetivo, heuristica='manhattan', processos=None,
+              tamanho_lote=64):
+    """
+    A* paralelo com distribuição dos estados por hash (HDA*).
+
+    Args:
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (define o N)
+        heuristica: Nome da heurística ('manhattan', 'conflito_linear' ou 'padroes')
+        processos: Número de processos de busca (padrão: número de núcleos)
+        tamanho_lote: Nós expandidos por processo entre duas leituras da fila
+            de entrada; os sucessores gerados nesse intervalo vão em um lote
+            por dono
+
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo) com a solução ótima,
+        ou (None, nos_expandidos, tempo) se não houver solução
+
+    Raises:
+        ErroTrabalhador: se algum processo da busca morrer
+    """
+    inicio = time.time()
+    processos = processos or os.cpu_count() or 1
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    objetivo = tabuleiro.empacotar(estado_objetivo)
+    codigo_inicial = tabuleiro.empacotar(estado_inicial)
+    if not tabuleiro.eh_soluvel(codigo_inicial, objetivo):
+        return None, 0, time.time() - inicio
+    # Carrega a heurística antes de criar os processos (e valida o nome)
+    h_inicial = obter_heuristica(heuristica, objetivo, tabuleiro).calcular(codigo_inicial)
+    no_inicial = (codigo_inicial, 0, h_inicial, tabuleiro.posicao_vazio(codigo_inicial), None, 0)
+
+    contexto = multiprocessing.get_context()
+    caixas = [contexto.Queue() for _ in range(processos)]
+    respostas = contexto.Queue()
+    incumbente = contexto.Value('i', INFINITO)
+    parar = contexto.Value('b', 0, lock=False)
+    enviados = contexto.Array('q', processos, lock=False)
+    recebidos = contexto.Array('q', processos, lock=False)
+    ociosos = contexto.Array('b', processos, lock=False)
+    expandidos = contexto.Array('q', processos, lock=False)
+
+    dono_inicial = dono(codigo_inicial, processos)
+    trabalhadores = [
+        contexto.Process(target=_trabalhador, daemon=True, args=(
+            i, processos, tabuleiro.lado, heuristica, objetivo, caixas, respostas, incumbente,
+            parar, enviados, recebidos, ociosos, expandidos,
+            no_inicial if i == dono_inicial else None, tamanho_lote))
+        for i in range(processos)]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+
+    try:
+        # Detecção de término: recebidos, enviados, todos ociosos, e de novo
+        # recebidos e enviados, sem mudança. Um processo só volta a trabalhar
+        # ao receber um lote, então nesse ponto não há mais nada a fazer.
+        while True:
+            time.sleep(0.002)
+            _conferir_trabalhadores(trabalhadores)
+            recebidos_antes, enviados_antes = sum(recebidos), sum(enviados)
+            if recebidos_antes != enviados_antes or not all(ociosos):
+                continue
+            if sum(recebidos) == recebidos_antes and sum(enviados) == enviados_antes:
+                break
+        parar.value = 1
+
+        caminho = None
+        if incumbente.value < INFINITO:
+            # Segue os pais, perguntando a cada dono
+            movimentos = bytearray()
+            codigo = objetivo
+            while codigo != codigo_inicial:
+                caixas[dono(codigo, processos)].put(('pai', codigo))
+                while True:
+                    try:
+                        codigo, d = respostas.get(timeout=ESPERA_RESPOSTA)
+                        break
+                    except queue.Empty:
+                        _conferir_trabalhadores(trabalhadores)
+                movimentos.append(d)
+            movimentos.reverse()
+            caminho = CaminhoPreguicoso(tabuleiro, codigo_inicial, movimentos)
+    finally:
+        parar.value = 1
+        for caixa in caixas:
+            caixa.put(('fim',))
+        for trabalhador in trabalhadores:
+            trabalhador.join(timeout=5)
+            if trabalhador.is_alive():
+                trabalhador.terminate()
+
+    return caminho, sum(expandidos), time.time() - inicio
+
+
+def medir_escalabilidade(instancias, processos=None, heuristica='manhattan'):
+    """
+    Compara o A* serial com o HDA* nas mesmas instâncias.
+
+    Args:
+        instancias: Lista de pares (estado inicial, estado objetivo)
+        processos: Números de processos a medir (padrão: 1, 2, 4... até
+            os.cpu_count())
+
+    Returns:
+        list: Um dict por número de processos (0 é o A* serial), com tempo,
+        nós expandidos, aceleração (tempo serial / tempo do HDA*), eficiência
+        (aceleração / processos) e se todas as soluções têm o custo da serial
+    """
+    from main import busca_a_estrela
+
+    if processos is None:
+        processos = [1]
+        while processos[-1] * 2 <= (os.cpu_count() or 1):
+            processos.append(processos[-1] * 2)
+
+    inicio = time.perf_counter()
+    nos_serial = 0
+    custos = []
+    for estado, objetivo in instancias:
+        caminho, nos, _ = busca_a_estrela(estado, objetivo, heuristica)
+        nos_serial += nos
+        custos.append(len(caminho))
+    tempo_serial = time.perf_counter() - inicio
+
+    medidas = [{'processos': 0, 'tempo': tempo_serial, 'nos': nos_serial,
+                'aceleracao': 1.0, 'eficiencia': 1.0, 'mesmo_custo': True}]
+    for n in processos:
+        inicio = time.perf_counter()
+        nos_paralelo = 0
+        mesmo_custo = True
+        for (estado, objetivo), custo in zip(instancias, custos):
+            caminho, nos, _ = busca_hda(estado, objetivo, heuristica, n)
+            nos_paralelo += nos
+            mesmo_custo = mesmo_custo and len(caminho) == custo
+        tempo = time.perf_counter() - inicio
+        aceleracao = tempo_serial / tempo if tempo > 0 else 0.0
+        medidas.append({'processos': n, 'tempo': tempo, 'nos': nos_paralelo,
+                        'aceleracao': aceleracao, 'eficiencia': aceleracao / n,
+                        'mesmo_custo': mesmo_custo})
+    return medidas
+
+
+def main():
+    """
+    Mostra a escalabilidade do HDA* em instâncias aleatórias do 15-puzzle.
+    """
+    from benchmark import gerar_instancias
+
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    passos = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    print(f"{quantidade} instâncias 4x4 ({passos} passos), {os.cpu_count()} processadores")
+    print(f"{'processos':>9} {'tempo (s)':>10} {'nós':>10} {'aceleração':>11} {'eficiência':>11} {'mesmo custo':>12}")
+    for medida in medir_escalabilidade(gerar_instancias(4, quantidade, passos)):
+        processos = medida['processos'] or 'serial'
+        print(f"{processos:>9} {medida['tempo']:>10.3f} {medida['nos']:>10} "
+              f"{medida['aceleracao']:>11.2f} {medida['eficiencia']:>11.2f} "
+              f"{'sim' if medida['mesmo_custo'] else 'não':>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+'''
+Heuristicas admissíveis para o quebra-cabeça deslizante N×N.
+
+Toda heurística guarda o Tabuleiro para o qual foi criada e expõe dois métodos:
+    calcular(codigo): valor h(n) do estado empacotado, calculado do zero
+    atualizar(h, codigo, peca, de, para): novo h(n) depois que `peca`
+        deslizou da posição `de` para `para`, resultando em `codigo`
+
+As heurísticas são escolhidas pelo nome com obter_heuristica().
+'''
+
+from bisect import bisect_left
+
+from estado import obter_tabuleiro
+
+
+def posicoes_objetivo(objetivo, tabuleiro):
+    """
+    Retorna uma lista indexada pela peça com a posição dela no objetivo.
+    """
+    posicoes = [0] * tabuleiro.casas
+    for posicao in range(tabuleiro.casas):
+        posicoes[tabuleiro.peca_em(objetivo, posicao)] = posicao
+    return posicoes
+
+
+class Manhattan:
+    """
+    Soma das distâncias de Manhattan de cada peça até sua posição no objetivo.
+    """
+    nome = 'manhattan'
+
+    def __init__(self, objetivo=None, tabuleiro=None):
+        self.tabuleiro = tabuleiro = tabuleiro or obter_tabuleiro()
+        if objetivo is None:
+            objetivo = tabuleiro.objetivo_padrao
+        lado = tabuleiro.lado
+        self.alvo = alvo = posicoes_objetivo(objetivo, tabuleiro)
+        # distancia[peca][posicao], com zeros para o vazio
+        self.distancia = [
+            [0] * tabuleiro.casas if peca == 0 else
+            [abs(p // lado - alvo[peca] // lado) + abs(p % lado - alvo[peca] % lado)
+             for p in range(tabuleiro.casas)]
+            for peca in range(tabuleiro.casas)
+        ]
+
+    def calcular(self, codigo):
+        bits, mascara = self.tabuleiro.bits, self.tabuleiro.mascara
+        distancia = 0
+        for posicao in range(self.tabuleiro.casas):
+            distancia += self.distancia[codigo & mascara][posicao]
+            codigo >>= bits
+        return distancia
+
+    def atualizar(self, h, codigo, peca, de, para):
+        distancias = self.distancia[peca]
+        return h - distancias[de] + distancias[para]
+
+
+class ConflitoLinear(Manhattan):
+    """
+    Manhattan mais 2 movimentos para cada peça que precisa sair da sua linha
+    (ou coluna) objetivo para deixar outra passar. O número mínimo de peças
+    a remover de uma linha é o total menos a maior subsequência crescente
+    das posições objetivo.
+
+    Um movimento horizontal não muda a ordem das peças na linha, só as duas
+    colunas envolvidas; um vertical, só as duas linhas. A atualização
+    recalcula apenas essas duas linhas do tabuleiro, não ele inteiro.
+    """
+    nome = 'conflito_linear'
+
+    def __init__(self, objetivo=None, tabuleiro=None):
+        super().__init__(objetivo, tabuleiro)
+        lado = self.tabuleiro.lado
+        self.linhas = [[i * lado + j for j in range(lado)] for i in range(lado)]
+        self.colunas = [[i * lado + j for i in range(lado)] for j in range(lado)]
+
+    def _conflitos(self, codigo, casas, eixo, indice, troca=-1, peca_troca=0):
+        """
+        Conta as peças a remover de uma linha (eixo 0) ou coluna (eixo 1).
+
+        Args:
+            casas: Posições da linha/coluna, em ordem
+            eixo: 0 para linha, 1 para coluna
+            indice: Número da linha/coluna
+            troca, peca_troca: Considera `peca_troca` na posição `troca`
+                (usado para avaliar o estado anterior ao movimento)
+        """
+        lado, bits, mascara = self.tabuleiro.lado, self.tabuleiro.bits, self.tabuleiro.mascara
+        crescente = []  # Menores finais das subsequências crescentes
+        total = 0
+        for posicao in casas:
+            peca = peca_troca if posicao == troca else (codigo >> (bits * posicao)) & mascara
+            if not peca:
+                continue
+            linha, coluna = divmod(self.alvo[peca], lado)
+            if (linha, coluna)[eixo] != indice:
+                continue
+            total += 1
+            chave = coluna if eixo == 0 else linha
+            i = bisect_left(crescente, chave)
+            if i == len(crescente):
+                crescente.append(chave)
+            else:
+                crescente[i] = chave
+        return total - len(crescente)
+
+    def calcular(self, codigo):
+        conflitos = 0
+        for i, casas in enumerate(self.linhas):
+            conflitos += self._conflitos(codigo, casas, 0, i)
+        for j, casas in enumerate(self.colunas):
+            conflitos += self._conflitos(codigo, casas, 1, j)
+        return super().calcular(codigo) + 2 * conflitos
+
+    def atualizar(self, h, codigo, peca, de, para):
+        h = super().atualizar(h, codigo, peca, de, para)
+        lado = self.tabuleiro.lado
+        if de // lado == para // lado:
+            # Movimento horizontal: mudam as colunas de origem e destino
+            eixo, grupos, a, b = 1, self.colunas, de % lado, para % lado
+        else:
+            # Movimento vertical: mudam as linhas de origem e destino
+            eixo, grupos, a, b = 0, self.linhas, de // lado, para // lado
+        antes = (self._conflitos(codigo, grupos[a], eixo, a, de, peca) +
+                 self._conflitos(codigo, grupos[b], eixo, b, para, 0))
+        depois = (self._conflitos(codigo, grupos[a], eixo, a) +
+                  self._conflitos(codigo, grupos[b], eixo, b))
+        return h + 2 * (depois - antes)
+
+
+def obter_heuristica(nome='manhattan', objetivo=None, tabuleiro=None):
+    """
+    Cria a heurística pelo nome.
+
+    Args:
+        nome: 'manhattan', 'conflito_linear' ou 'padroes' (bancos de padrões aditivos)
+        objetivo: Estado objetivo empacotado (padrão: objetivo ordenado)
+        tabuleiro: Tabuleiro do problema (padrão: 3x3)
+
+    Returns:
+        Objeto com os métodos calcular() e atualizar()
+    """
+    tabuleiro = tabuleiro or obter_tabuleiro()
+    if objetivo is None:
+        objetivo = tabuleiro.objetivo_padrao
+    if nome == 'manhattan':
+        return Manhattan(objetivo, tabuleiro)
+    if nome == 'conflito_linear':
+        return ConflitoLinear(objetivo, tabuleiro)
+    if nome == 'padroes':
+        # Importado aqui para não exigir os arquivos .bin de quem usa só Manhattan
+        from padroes import carregar_padroes
+        if objetivo != tabuleiro.objetivo_padrao:
+            raise ValueError("Os bancos de padrões só existem para o objetivo ordenado")
+        return carregar_padroes(tabuleiro.lado)
+    raise ValueError(f"Heurística desconhecida: {nome}")
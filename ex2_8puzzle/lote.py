@@ -0,0 +1,273 @@
+'''
+Resolução em lote de instâncias do quebra-cabeça deslizante.
+
+Lê instâncias em JSON Lines (de um arquivo ou da entrada padrão), uma por
+linha, no formato:
+
+    {"id": "a1", "estado": [[7, 2, 4], [5, 0, 6], [8, 3, 1]]}
+    {"id": "a2", "estado": [[...]], "objetivo": [[...]]}
+
+(uma linha que seja só a matriz também é aceita). Instâncias sem solução
+são rejeitadas pela paridade antes de qualquer busca; as demais são
+distribuídas entre processos, com um número limitado de tarefas pendentes
+para que a memória não cresça com o tamanho da entrada. Cada resultado é
+escrito na saída, também em JSON Lines, assim que fica pronto. Com --cache,
+instâncias repetidas ou equivalentes (ver cache_solucoes.py) são respondidas
+pelo processo principal sem nova busca.
+
+Exemplo:
+
+    python lote.py instancias.jsonl --algoritmo ida_estrela --heuristica padroes
+    python lote.py instancias.jsonl --algoritmo ara --prazo 0.2
+    python lote.py instancias.jsonl --algoritmo a_estrela --cache 10000
+    cat instancias.jsonl | python lote.py - --processos 8 > resultados.jsonl
+'''
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from estado import obter_tabuleiro
+
+
+def resolvedor(algoritmo, prazo=1.0):
+    """
+    Retorna a função de busca pelo nome do algoritmo.
+    """
+    if algoritmo == 'ara':
+        from main import busca_ara
+        return lambda inicial, objetivo, heuristica: busca_ara(inicial, objetivo, heuristica, prazo)
+    if algoritmo == 'a_estrela':
+        from main import busca_a_estrela
+        return busca_a_estrela
+    if algoritmo == 'ida_estrela':
+        from main import busca_ida_estrela
+        return busca_ida_estrela
+    if algoritmo == 'bidirecional':
+        from bidirecional import busca_bidirecional
+        return busca_bidirecional
+    if algoritmo == 'tabela':
+        from tabela_distancias import resolver_por_tabela
+        return lambda inicial, objetivo, heuristica: resolver_por_tabela(inicial, objetivo)
+    raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+
+
+def resolver_instancia(identificador, estado, objetivo, algoritmo, heuristica, com_estatisticas=False,
+                       prazo=1.0):
+    """
+    Resolve uma instância (executada dentro de um processo do pool).
+
+    Returns:
+        Dicionário com o resultado, pronto para virar uma linha JSON
+    """
+    if com_estatisticas and algoritmo == 'a_estrela':
+        from main import busca_a_estrela
+        from estatisticas import EstatisticasBusca
+        estatisticas = EstatisticasBusca()
+        caminho, nos_expandidos, tempo = busca_a_estrela(estado, objetivo, heuristica,
+                                                         estatisticas=estatisticas)
+    else:
+        estatisticas = None
+        # O ARA* devolve também o limite de subotimalidade da solução
+        caminho, nos_expandidos, tempo, *limite = resolvedor(algoritmo, prazo)(estado, objetivo,
+                                                                               heuristica)
+    resultado = {'id': identificador, 'nos_expandidos': nos_expandidos, 'tempo': tempo}
+    if estatisticas is None and limite and caminho is not None:
+        resultado['limite_subotimo'] = limite[0]
+    if estatisticas is not None:
+        resultado['estatisticas'] = estatisticas.para_dicionario()
+    if caminho is None:
+        resultado['status'] = 'sem_solucao'
+    else:
+        resultado['status'] = 'resolvido'
+        resultado['movimentos'] = len(caminho)
+        # Os resolvedores de busca devolvem um CaminhoPreguicoso, que dá as
+        # ações sem montar as matrizes de cada passo
+        acoes = getattr(caminho, 'acoes', None)
+        resultado['acoes'] = acoes if acoes is not None else [acao for acao, _ in caminho]
+    return resultado
+
+
+def validar(estado, objetivo, algoritmo=None):
+    """
+    Confere se as matrizes são quadradas, do mesmo tamanho e com as peças 0..N²-1,
+    e se o algoritmo resolve esse tamanho (a tabela de distâncias só existe
+    para o 3x3).
+
+    Raises:
+        ValueError: se a instância for inválida
+    """
+    lado = len(estado)
+    for matriz in (estado, objetivo):
+        if len(matriz) != lado or any(len(linha) != lado for linha in matriz):
+            raise ValueError("as matrizes devem ser quadradas e do mesmo tamanho")
+        if sorted(valor for linha in matriz for valor in linha) != list(range(lado * lado)):
+            raise ValueError(f"as peças devem ser os números de 0 a {lado * lado - 1}")
+    if algoritmo == 'tabela' and lado != 3:
+        raise ValueError(f"o algoritmo 'tabela' só resolve o 8-puzzle (3x3), não {lado}x{lado}")
+
+
+def ler_instancias(arquivo, algoritmo=None):
+    """
+    Gera tuplas (id, estado, objetivo, erro) a partir das linhas do arquivo.
+    Linhas em branco são ignoradas; o id padrão é o número da linha.
+
+    Args:
+        algoritmo: Algoritmo que vai resolver as instâncias, para rejeitar
+            tamanhos que ele não resolve
+    """
+    for numero, linha in enumerate(arquivo, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            dados = json.loads(linha)
+            if isinstance(dados, list):
+                dados = {'estado': dados}
+            estado = dados['estado']
+            lado = len(estado)
+            objetivo = dados.get('objetivo') or obter_tabuleiro(lado).desempacotar(
+                obter_tabuleiro(lado).objetivo_padrao)
+            validar(estado, objetivo, algoritmo)
+            yield dados.get('id', numero), estado, objetivo, None
+        except (ValueError, KeyError, TypeError) as erro:
+            yield numero, None, None, str(erro)
+
+
+def escrever(saida, resultado):
+    saida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+    saida.flush()
+
+
+def resolver_lote(arquivo, saida, algoritmo='ida_estrela', heuristica='manhattan',
+                  processos=None, max_pendentes=None, com_estatisticas=False, prazo=1.0,
+                  tamanho_cache=0):
+    """
+    Resolve todas as instâncias do arquivo, escrevendo os resultados na saída
+    na ordem em que terminam.
+
+    Args:
+        arquivo: Arquivo de texto com as instâncias em JSON Lines
+        saida: Arquivo de texto onde os resultados são escritos
+        algoritmo: 'a_estrela', 'ida_estrela', 'ara', 'bidirecional' ou 'tabela'
+        heuristica: Nome da heurística (ver heuristicas.py)
+        processos: Número de processos (padrão: número de núcleos)
+        max_pendentes: Máximo de instâncias enviadas e não concluídas
+            (padrão: 4 por processo)
+        com_estatisticas: Inclui as métricas de EstatisticasBusca em cada
+            resultado (só no A*)
+        prazo: Tempo em segundos que o ARA* tem para refinar cada solução
+        tamanho_cache: Capacidade do cache de soluções (0 desativa). Não é
+            usado com o ARA*, cujas soluções podem não ser ótimas
+
+    Returns:
+        Dicionário com os totais por status e o tempo total
+    """
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = max_pendentes or 4 * processos
+    totais = {'resolvido': 0, 'sem_solucao': 0, 'insoluvel': 0, 'erro': 0}
+    inicio = time.time()
+    cache = None
+    if tamanho_cache and algoritmo != 'ara':
+        from cache_solucoes import CacheSolucoes
+        cache = CacheSolucoes(tamanho_cache)
+
+    def concluir(futuros):
+        for futuro in futuros:
+            try:
+                resultado = futuro.result()
+            except Exception as erro:
+                resultado = {'id': pendentes[futuro], 'status': 'erro', 'mensagem': str(erro)}
+            totais[resultado['status']] += 1
+            escrever(saida, resultado)
+            if cache is not None and resultado['status'] == 'resolvido':
+                cache.guardar(*consultas[futuro], resultado['acoes'])
+            del pendentes[futuro]
+            consultas.pop(futuro, None)
+
+    pendentes = {}  # futuro -> id da instância
+    consultas = {}  # futuro -> (estado, objetivo), para guardar no cache
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        for identificador, estado, objetivo, erro in ler_instancias(arquivo, algoritmo):
+            if erro is not None:
+                totais['erro'] += 1
+                escrever(saida, {'id': identificador, 'status': 'erro', 'mensagem': erro})
+                continue
+
+            # Rejeita pela paridade, sem gastar uma busca
+            tabuleiro = obter_tabuleiro(len(estado))
+            if not tabuleiro.eh_soluvel(tabuleiro.empacotar(estado), tabuleiro.empacotar(objetivo)):
+                totais['insoluvel'] += 1
+                escrever(saida, {'id': identificador, 'status': 'insoluvel'})
+                continue
+
+            if cache is not None:
+                caminho = cache.consultar(estado, objetivo)
+                if caminho is not None:
+                    totais['resolvido'] += 1
+                    escrever(saida, {'id': identificador, 'nos_expandidos': 0, 'tempo': 0.0,
+                                     'status': 'resolvido', 'movimentos': len(caminho),
+                                     'acoes': caminho.acoes, 'cache': True})
+                    continue
+
+            # Limita o trabalho em andamento: espera algum terminar antes de enviar mais
+            while len(pendentes) >= max_pendentes:
+                prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                concluir(prontos)
+
+            futuro = executor.submit(resolver_instancia, identificador, estado, objetivo,
+                                     algoritmo, heuristica, com_estatisticas, prazo)
+            pendentes[futuro] = identificador
+            if cache is not None:
+                consultas[futuro] = (estado, objetivo)
+
+        while pendentes:
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            concluir(prontos)
+
+    totais['tempo'] = time.time() - inicio
+    return totais
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve instâncias do quebra-cabeça em lote.")
+    parser.add_argument('entrada', nargs='?', default='-',
+                        help="arquivo JSON Lines com as instâncias ('-' para a entrada padrão)")
+    parser.add_argument('--algoritmo', default='ida_estrela',
+                        choices=['a_estrela', 'ida_estrela', 'ara', 'bidirecional', 'tabela'])
+    parser.add_argument('--heuristica', default='manhattan',
+                        choices=['manhattan', 'conflito_linear', 'padroes'])
+    parser.add_argument('--processos', type=int, default=None,
+                        help="número de processos (padrão: número de núcleos)")
+    parser.add_argument('--max-pendentes', type=int, default=None,
+                        help="máximo de instâncias em andamento (padrão: 4 por processo)")
+    parser.add_argument('--estatisticas', action='store_true',
+                        help="inclui as métricas detalhadas da busca em cada resultado (A*)")
+    parser.add_argument('--cache', type=int, default=0,
+                        help="capacidade do cache de soluções entre instâncias (0 desativa)")
+    parser.add_argument('--prazo', type=float, default=1.0,
+                        help="segundos que o ARA* tem para refinar cada solução (padrão: 1)")
+    args = parser.parse_args()
+
+    if args.entrada == '-':
+        totais = resolver_lote(sys.stdin, sys.stdout, args.algoritmo, args.heuristica,
+                               args.processos, args.max_pendentes, args.estatisticas, args.prazo,
+                               args.cache)
+    else:
+        with open(args.entrada, encoding='utf-8') as arquivo:
+            totais = resolver_lote(arquivo, sys.stdout, args.algoritmo, args.heuristica,
+                                   args.processos, args.max_pendentes, args.estatisticas, args.prazo,
+                                   args.cache)
+
+    # O resumo vai para a saída de erros para não misturar com os resultados
+    print(f"Resolvidas: {totais['resolvido']}, insolúveis: {totais['insoluvel']}, "
+          f"erros: {totais['erro']}, tempo total: {totais['tempo']:.2f} segundos",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
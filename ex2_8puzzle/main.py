@@ -1,33 +1,86 @@
-import heapq
-import numpy as np
-from copy import deepcopy
 import time
+from functools import lru_cache
+from estado import LADO, MOVIMENTOS, obter_tabuleiro
+from fila_aberta import FilaHeap, criar_fila
+from heuristicas import Manhattan, obter_heuristica
+from pool_nos import CaminhoPreguicoso, NoPool, PoolNos
+
+@lru_cache(maxsize=None)
+def manhattan_padrao(lado=LADO):
+    """
+    Heurística padrão (Manhattan para o objetivo ordenado) de um tabuleiro lado×lado.
+    """
+    return Manhattan(tabuleiro=obter_tabuleiro(lado))
+
+# Chaves de desempate entre nós de mesmo f (menor chave sai primeiro). São
+# inteiros não negativos para servir de índice na fila de baldes; com
+# f = g + h, menor h no mesmo f é o mesmo que maior g (vale também no A*
+# ponderado, f = g + w·h com w > 0). Recebem (g, h).
+DESEMPATES = {
+    'maior_g': lambda custo, heuristica: heuristica,
+    'menor_h': lambda custo, heuristica: heuristica,
+    'fifo': lambda custo, heuristica: 0,
+}
+
+class BuscaCancelada(Exception):
+    """
+    Levantada pelas buscas quando a função `cancelar` pede a interrupção.
+    """
+
+# A cada quantos nós expandidos as buscas consultam a função `cancelar`
+INTERVALO_CANCELAMENTO = 1024
 
 class Puzzle:
     """
     Inicializa um nó do quebra-cabeça.
         
     Args:
-        estado: Matriz 3x3 representando as posições das peças
+        estado: Matriz N×N ou inteiro empacotado (ver estado.py) com as posições das peças
         pai: Nó pai de onde este nó foi gerado
         acao: Ação tomada para chegar a este estado ("Cima", "Baixo", "Esquerda", "Direita")
         custo: Custo g(n) - número de movimentos desde o início
+        vazio: Posição do espaço vazio, se já conhecida
+        heuristica: Valor h(n), se já conhecido (calculado incrementalmente pelo pai)
+        avaliador: Heurística usada (ver heuristicas.py); por padrão a do pai ou Manhattan.
+            O tabuleiro (e portanto o tamanho N) vem da heurística.
     """
+
+    # Sem __dict__ por nó: os atributos ficam em posições fixas
+    __slots__ = ('avaliador', 'codigo', 'vazio', 'pai', 'acao', 'custo', 'heuristica', 'f')
     
-    def __init__(self, estado, pai=None, acao=None, custo=0):    
-        self.estado = estado  # Configuração atual do tabuleiro
+    def __init__(self, estado, pai=None, acao=None, custo=0, vazio=None, heuristica=None,
+                 avaliador=None):    
+        if avaliador is None:
+            avaliador = pai.avaliador if pai else manhattan_padrao(
+                LADO if isinstance(estado, int) else len(estado))
+        self.avaliador = avaliador  # Heurística escolhida para a busca
+        tabuleiro = avaliador.tabuleiro
+        # Configuração atual do tabuleiro, empacotada em um inteiro
+        self.codigo = estado if isinstance(estado, int) else tabuleiro.empacotar(estado)
+        self.vazio = tabuleiro.posicao_vazio(self.codigo) if vazio is None else vazio  # Posição do 0
         self.pai = pai  # Nó pai, para reconstruir o caminho da solução
         self.acao = acao  # Movimento que gerou este estado
         self.custo = custo  # g(n): custo do caminho até aqui
-        self.heuristica = self.calcular_manhattan()  # h(n): estimativa até o objetivo TODO: VERIFICAR
+        # h(n): estimativa até o objetivo
+        self.heuristica = avaliador.calcular(self.codigo) if heuristica is None else heuristica
         self.f = self.custo + self.heuristica  # f(n) = g(n) + h(n) para A*
 
+    @property
+    def estado(self):
+        """
+        Matriz N×N do estado, reconstruída a partir do inteiro empacotado.
+        """
+        return self.avaliador.tabuleiro.desempacotar(self.codigo)
+
     """
     Define como comparar dois nós (usado pela fila de prioridade).
-    Nós são ordenados pelo valor de f = g + h.
+    Nós são ordenados pelo valor de f = g + h; em caso de empate, o de maior
+    g (mais perto do objetivo) vem primeiro.
     """
     def __lt__(self, outro):
-        return self.f < outro.f
+        if self.f != outro.f:
+            return self.f < outro.f
+        return self.custo > outro.custo
     
     """
     Encontra a posição (linha, coluna) de um valor específico no tabuleiro.
@@ -39,10 +92,12 @@ class Puzzle:
         Tupla (linha, coluna) com a posição
     """
     def encontrar_posicao(self, valor):
-        for i in range(3):
-            for j in range(3):
-                if self.estado[i][j] == valor:
-                    return i, j
+        tabuleiro = self.avaliador.tabuleiro
+        if valor == 0:
+            return divmod(self.vazio, tabuleiro.lado)
+        for posicao in range(tabuleiro.casas):
+            if tabuleiro.peca_em(self.codigo, posicao) == valor:
+                return divmod(posicao, tabuleiro.lado)
         return -1, -1  # Valor não encontrado (não deveria acontecer)
     
 
@@ -54,146 +109,454 @@ class Puzzle:
         Soma total das distâncias de Manhattan
     """
     def calcular_manhattan(self):
-        distancia = 0
-        for i in range(3):
-            for j in range(3):
-                valor = self.estado[i][j]
-                if valor != 0:  # Ignora o espaço vazio
-                    # Calcula onde o valor deveria estar no estado objetivo
-                    linha_objetivo = (valor - 1) // 3
-                    coluna_objetivo = (valor - 1) % 3
-                    # Soma a distância Manhattan (|x1 - x2| + |y1 - y2|)
-                    distancia += abs(i - linha_objetivo) + abs(j - coluna_objetivo)
-        return distancia
+        # Usa o objetivo da heurística do nó, se ela já for Manhattan
+        manhattan = self.avaliador
+        if not isinstance(manhattan, Manhattan):
+            manhattan = manhattan_padrao(manhattan.tabuleiro.lado)
+        return manhattan.calcular(self.codigo)
     
-        """
-        Gera todos os estados sucessores possíveis movendo o espaço vazio.
-        
-        Returns:
-            Lista de nós Puzzle que podem ser alcançados com um movimento
-        """
+    """
+    Gera todos os estados sucessores possíveis movendo o espaço vazio.
+    A heurística de cada sucessor é atualizada apenas pela peça movida.
+    
+    Returns:
+        Lista de nós Puzzle que podem ser alcançados com um movimento
+    """
     def gerar_sucessores(self):
-        i, j = self.encontrar_posicao(0)  # Encontra o espaço vazio (0)
         sucessores = []
         
-        # Define os quatro movimentos possíveis (nome, delta_linha, delta_coluna)
-        movimentos = [
-            ('Cima', -1, 0),      # Mover o espaço vazio para cima
-            ('Baixo', 1, 0),      # Mover o espaço vazio para baixo
-            ('Esquerda', 0, -1),  # Mover o espaço vazio para a esquerda
-            ('Direita', 0, 1)     # Mover o espaço vazio para a direita
-        ]
-        
-        for acao, di, dj in movimentos:
-            nova_i, nova_j = i + di, j + dj
+        # Movimentos válidos a partir da posição atual do vazio (pré-calculados)
+        tabuleiro = self.avaliador.tabuleiro
+        for acao, destino in tabuleiro.vizinhos[self.vazio]:
+            # Troca a posição do espaço vazio com a peça adjacente
+            novo_codigo, peca = tabuleiro.mover(self.codigo, self.vazio, destino)
+            heuristica = self.avaliador.atualizar(self.heuristica, novo_codigo, peca, destino, self.vazio)
             
-            # Verifica se o movimento é válido (dentro dos limites do tabuleiro)
-            if 0 <= nova_i < 3 and 0 <= nova_j < 3:
-                # Cria uma cópia profunda do estado atual
-                novo_estado = deepcopy(self.estado)
-                # Troca a posição do espaço vazio com a peça adjacente
-                novo_estado[i][j], novo_estado[nova_i][nova_j] = novo_estado[nova_i][nova_j], novo_estado[i][j]
-                
-                # Cria um novo nó com o estado resultante, incrementando o custo
-                sucessor = Puzzle(novo_estado, self, acao, self.custo + 1)
-                sucessores.append(sucessor)
+            # Cria um novo nó com o estado resultante, incrementando o custo
+            sucessor = Puzzle(novo_codigo, self, acao, self.custo + 1, destino, heuristica,
+                              self.avaliador)
+            sucessores.append(sucessor)
                 
         return sucessores
     
+    """
+    Move o espaço vazio para `destino` no próprio nó, sem criar cópias.
+    Usado pela busca IDA*; a heurística é atualizada apenas pela peça movida.
+    
+    Args:
+        destino: Posição para onde o vazio vai
+    
+    Returns:
+        Posição anterior do vazio, usada para desfazer o movimento
+    """
+    def aplicar_movimento(self, destino):
+        origem = self.vazio
+        self.codigo, peca = self.avaliador.tabuleiro.mover(self.codigo, origem, destino)
+        self.heuristica = self.avaliador.atualizar(self.heuristica, self.codigo, peca, destino, origem)
+        self.vazio = destino
+        self.custo += 1
+        self.f = self.custo + self.heuristica
+        return origem
+    
+    """
+    Desfaz um movimento feito por aplicar_movimento.
+    
+    Args:
+        origem: Posição do vazio antes do movimento
+    """
+    def desfazer_movimento(self, origem):
+        self.aplicar_movimento(origem)
+        self.custo -= 2
+        self.f = self.custo + self.heuristica
+    
     """
     Verifica se este estado é o objetivo.
     
     Args:
-        estado_objetivo: Estado objetivo para comparação
+        estado_objetivo: Estado objetivo para comparação (matriz ou inteiro empacotado)
     
     Returns:
         True se este estado for igual ao objetivo, False caso contrário
     """
     def eh_objetivo(self, estado_objetivo):
-        return self.estado == estado_objetivo
+        if not isinstance(estado_objetivo, int):
+            estado_objetivo = self.avaliador.tabuleiro.empacotar(estado_objetivo)
+        return self.codigo == estado_objetivo
     
     """
     Define a igualdade entre dois nós (baseada apenas no estado).
     """
     def __eq__(self, outro):
-        return self.estado == outro.estado
+        return self.codigo == outro.codigo
     
     def __hash__(self):
         """
         Função hash para permitir que estados sejam usados em conjuntos e dicionários.
         """
-        return hash(str(self.estado))
+        return hash(self.codigo)
 
     """
     Implementa o algoritmo A* para encontrar o caminho ótimo.
 
     Args:
-        estado_inicial: Matriz 3x3 representando o estado inicial
-        estado_objetivo: Matriz 3x3 representando o estado objetivo
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (define o N)
+        heuristica: Nome da heurística ('manhattan', 'conflito_linear' ou 'padroes')
+        desempate: Critério entre nós de mesmo f: 'maior_g', 'menor_h' ou 'fifo'.
+            Os dois primeiros também usam a ordem de chegada (FIFO) como último critério.
+        fila: Estrutura da fronteira: 'baldes' (vetor de baldes por f, O(1)) ou 'heap'.
+            Com peso não inteiro f deixa de ser inteiro e a fila de heap é usada.
+        estatisticas: EstatisticasBusca opcional (ver estatisticas.py), preenchida
+            durante a busca; sem ela nenhuma métrica extra é coletada
+        peso: Peso w do A* ponderado, f = g + w·h. Com w > 1 a busca expande
+            menos nós e a solução custa no máximo w vezes a ótima (w = 1 é o A*)
+        cancelar: Função opcional sem argumentos consultada periodicamente;
+            se retornar True a busca é interrompida com BuscaCancelada
 
     Returns:
         Tupla (caminho, nos_expandidos, tempo) com a solução encontrada,
-        ou (None, nos_expandidos, tempo) se não houver solução
+        ou (None, nos_expandidos, tempo) se não houver solução. O caminho é
+        um CaminhoPreguicoso (ver pool_nos.py): uma sequência de pares
+        (acao, estado) cujos estados são montados só quando acessados
     """
-def busca_a_estrela(estado_inicial, estado_objetivo):
+def busca_a_estrela(estado_inicial, estado_objetivo, heuristica='manhattan', desempate='maior_g',
+                    fila='baldes', estatisticas=None, peso=1, cancelar=None):
+    if desempate not in DESEMPATES:
+        raise ValueError(f"Critério de desempate desconhecido: {desempate}")
+    chave_desempate = DESEMPATES[desempate]
+    if peso < 1:
+        raise ValueError("O peso do A* ponderado deve ser >= 1")
+    if float(peso).is_integer():
+        peso = int(peso)
+    elif fila == 'baldes':
+        fila = 'heap'  # Os baldes são indexados por f inteiro
+    
     # Inicialização das estruturas de dados
-    fronteira = []  # Fila de prioridade (heap) para a fronteira
-    no_inicial = Puzzle(estado_inicial)  # Cria o nó inicial
-    heapq.heappush(fronteira, no_inicial)  # Adiciona o nó inicial à fronteira
-    explorados = set()  # Conjunto de estados já explorados
-    estados_fronteira = {str(estado_inicial)}  # Estados atualmente na fronteira
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    objetivo = tabuleiro.empacotar(estado_objetivo)  # Estados são comparados já empacotados
+    avaliador = obter_heuristica(heuristica, objetivo, tabuleiro)
+    codigo_inicial = tabuleiro.empacotar(estado_inicial)
+    h_inicial = avaliador.calcular(codigo_inicial)
+    # Os nós ficam em arrays compactos (ver pool_nos.py); a fronteira guarda só índices
+    pool = PoolNos(tabuleiro)
+    pool.adicionar(codigo_inicial, -1, 0, 0, tabuleiro.posicao_vazio(codigo_inicial), h_inicial)
+    fronteira = criar_fila(fila)  # Fila de prioridade por (f, desempate, ordem de chegada)
+    fronteira.inserir(peso * h_inicial, chave_desempate(0, h_inicial), 0)
+    # Menor custo g já encontrado para cada estado (na fronteira ou explorado)
+    melhor_g = {codigo_inicial: 0}
+    
+    # Campos do pool usados no laço
+    codigos, custos, heuristicas, vazios = pool.codigos, pool.custos, pool.heuristicas, pool.vazios
+    direcoes = tabuleiro.direcoes
+    mover = tabuleiro.mover
+    atualizar = avaliador.atualizar
     
     # Métricas para análise do algoritmo
     nos_expandidos = 0
     
     inicio = time.time()  # Marca o tempo de início
+    if estatisticas is not None:
+        estatisticas.iniciar()
     
     # Loop principal da busca - implementa o pseudocódigo fornecido
     while fronteira:
-        # Se a fronteira estiver vazia, não há solução
-        if not fronteira:
-            return None, nos_expandidos, time.time() - inicio
-        
         # Remove o nó com menor f(n) da fronteira (passo 1 do pseudocódigo)
-        no_atual = heapq.heappop(fronteira)
-        estados_fronteira.remove(str(no_atual.estado))
+        atual = fronteira.remover()
+        codigo = codigos[atual]
+        custo = custos[atual]
+        
+        # Remoção preguiçosa: entradas superadas por um caminho mais barato
+        # continuam na fila e são descartadas aqui
+        if custo > melhor_g[codigo]:
+            if estatisticas is not None:
+                estatisticas.registrar_obsoleta()
+            continue
         
         # Verifica se chegou ao objetivo (passo 2 do pseudocódigo)
-        if no_atual.eh_objetivo(estado_objetivo):
+        if codigo == objetivo:
             fim = time.time()
             tempo = fim - inicio
             
-            # Reconstrói o caminho da solução seguindo os nós pais
-            caminho = []
-            while no_atual.pai:
-                caminho.append((no_atual.acao, no_atual.estado))
-                no_atual = no_atual.pai
-            caminho.reverse()  # Inverte para obter do início ao fim
+            # Reconstrói o caminho seguindo os índices dos pais; as matrizes
+            # de cada passo só são montadas quando o caminho é percorrido
+            caminho = pool.caminho(atual)
             
+            if estatisticas is not None:
+                estatisticas.finalizar(len(melhor_g), len(caminho), peso, len(pool))
             return caminho, nos_expandidos, tempo
         
-        # Adiciona o nó atual ao conjunto de explorados (último passo do pseudocódigo)
-        explorados.add(str(no_atual.estado))
         nos_expandidos += 1
+        if cancelar is not None and not nos_expandidos % INTERVALO_CANCELAMENTO and cancelar():
+            raise BuscaCancelada()
+        if estatisticas is not None:
+            estatisticas.registrar_expansao(pool.no(atual), len(fronteira),
+                                            custo + peso * heuristicas[atual])
         
         # Expande o nó atual e adiciona sucessores à fronteira (passo 3 do pseudocódigo)
-        for sucessor in no_atual.gerar_sucessores():
-            estado_str = str(sucessor.estado)
+        vazio = vazios[atual]
+        h = heuristicas[atual]
+        custo_sucessor = custo + 1
+        for d, destino in direcoes[vazio]:
+            novo_codigo, peca = mover(codigo, vazio, destino)
+            h_sucessor = atualizar(h, novo_codigo, peca, destino, vazio)
             
-            # Verifica se o estado não foi explorado e não está na fronteira
-            if estado_str not in explorados and estado_str not in estados_fronteira:
-                heapq.heappush(fronteira, sucessor)
-                estados_fronteira.add(estado_str)
+            # Só entra na fronteira se for um estado novo ou um caminho mais barato
+            # até ele; com heurística inconsistente isso também reabre explorados
+            inserido = custo_sucessor < melhor_g.get(novo_codigo, custo_sucessor + 1)
+            if inserido:
+                melhor_g[novo_codigo] = custo_sucessor
+                indice = pool.adicionar(novo_codigo, atual, d, custo_sucessor, destino, h_sucessor)
+                fronteira.inserir(custo_sucessor + peso * h_sucessor,
+                                  chave_desempate(custo_sucessor, h_sucessor), indice)
+            if estatisticas is not None:
+                estatisticas.registrar_sucessor(
+                    pool.no(indice) if inserido else
+                    NoPool(-1, novo_codigo, destino, custo_sucessor, h_sucessor, d), inserido)
     
     # Se saiu do loop sem encontrar solução, não há solução
+    if estatisticas is not None:
+        estatisticas.finalizar(len(melhor_g), nos_armazenados=len(pool))
     return None, nos_expandidos, time.time() - inicio
 
+def busca_ara(estado_inicial, estado_objetivo, heuristica='manhattan', prazo=1.0,
+              peso_inicial=3.0, decremento=0.5, ao_melhorar=None, cancelar=None):
+    """
+    A* anytime com repetição (ARA*).
+    
+    Começa com um A* ponderado de peso alto, que acha uma solução depressa, e
+    repete a busca com pesos menores até chegar a w = 1 ou acabar o prazo.
+    Cada rodada reaproveita o trabalho da anterior: só os estados da
+    fronteira e os que melhoraram depois de fechados (inconsistentes) voltam
+    para a fila.
+    
+    O limite de subotimalidade de cada solução é min(w, custo / L), onde L é
+    o menor g + h entre os estados ainda abertos ou inconsistentes ao fim de
+    uma rodada completa, um limite inferior para o custo ótimo.
+    
+    Args:
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (define o N)
+        heuristica: Nome da heurística ('manhattan', 'conflito_linear' ou 'padroes')
+        prazo: Tempo em segundos depois do qual a busca para de refinar. Só vale
+            depois da primeira solução, para que sempre haja uma resposta
+        peso_inicial: Peso da primeira rodada
+        decremento: Quanto o peso diminui a cada rodada
+        ao_melhorar: Função opcional chamada com (caminho, limite, tempo) a cada
+            solução melhor ou com limite mais apertado
+        cancelar: Função opcional sem argumentos consultada periodicamente;
+            se retornar True a busca é interrompida com BuscaCancelada
+    
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo, limite) com a melhor solução e
+        seu limite de subotimalidade (1 indica solução ótima), ou
+        (None, nos_expandidos, tempo, None) se não houver solução
+    """
+    inicio = time.time()
+    fim_prazo = inicio + prazo
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    objetivo = tabuleiro.empacotar(estado_objetivo)
+    avaliador = obter_heuristica(heuristica, objetivo, tabuleiro)
+    codigo_inicial = tabuleiro.empacotar(estado_inicial)
+    nos_expandidos = 0
+    
+    # Sem o teste de paridade a primeira rodada esgotaria metade do espaço de estados
+    if not tabuleiro.eh_soluvel(codigo_inicial, objetivo):
+        return None, nos_expandidos, time.time() - inicio, None
+    
+    h_inicial = avaliador.calcular(codigo_inicial)
+    pool = PoolNos(tabuleiro)
+    pool.adicionar(codigo_inicial, -1, 0, 0, tabuleiro.posicao_vazio(codigo_inicial), h_inicial)
+    codigos, custos, heuristicas, vazios = pool.codigos, pool.custos, pool.heuristicas, pool.vazios
+    # Estado -> índice no pool do nó com o menor g conhecido
+    melhor = {codigo_inicial: 0}
+    
+    peso = peso_inicial
+    aberta = FilaHeap()  # f não é inteiro com pesos fracionários
+    aberta.inserir(peso * h_inicial, h_inicial, 0)
+    fechados = set()
+    inconsistentes = set()  # Estados fechados cujo g melhorou nesta rodada
+    
+    def melhorar_caminho():
+        """
+        Expande enquanto algum aberto puder melhorar a solução atual.
+        
+        Returns:
+            False se o prazo acabou no meio da rodada, True caso contrário
+        """
+        nonlocal nos_expandidos
+        while aberta:
+            if objetivo in melhor and custos[melhor[objetivo]] <= aberta.menor_f():
+                return True
+            if not nos_expandidos % INTERVALO_CANCELAMENTO:
+                if cancelar is not None and cancelar():
+                    raise BuscaCancelada()
+                if objetivo in melhor and time.time() > fim_prazo:
+                    return False
+            indice = aberta.remover()
+            codigo = codigos[indice]
+            # Entradas superadas por um caminho melhor ou já expandidas nesta rodada
+            if melhor[codigo] != indice or codigo in fechados:
+                continue
+            fechados.add(codigo)
+            nos_expandidos += 1
+            
+            vazio = vazios[indice]
+            h = heuristicas[indice]
+            custo_sucessor = custos[indice] + 1
+            for d, destino in tabuleiro.direcoes[vazio]:
+                novo_codigo, peca = tabuleiro.mover(codigo, vazio, destino)
+                anterior = melhor.get(novo_codigo)
+                if anterior is not None and custos[anterior] <= custo_sucessor:
+                    continue
+                h_sucessor = avaliador.atualizar(h, novo_codigo, peca, destino, vazio)
+                novo = pool.adicionar(novo_codigo, indice, d, custo_sucessor, destino, h_sucessor)
+                melhor[novo_codigo] = novo
+                if novo_codigo in fechados:
+                    inconsistentes.add(novo_codigo)
+                else:
+                    aberta.inserir(custo_sucessor + peso * h_sucessor, h_sucessor, novo)
+        return True
+    
+    def pendentes():
+        """
+        Índices dos nós atuais ainda abertos ou inconsistentes.
+        """
+        vistos = set()
+        for _, _, _, indice in aberta.heap:
+            codigo = codigos[indice]
+            if melhor[codigo] == indice and codigo not in fechados and codigo not in vistos:
+                vistos.add(codigo)
+                yield indice
+        for codigo in inconsistentes:
+            yield melhor[codigo]
+    
+    caminho = None
+    custo = None
+    limite = None
+    limite_inferior = h_inicial  # Nunca maior que o custo ótimo
+    while True:
+        concluida = melhorar_caminho()
+        if objetivo not in melhor:
+            break  # Espaço esgotado sem solução (não ocorre com a paridade conferida)
+        
+        novo_custo = custos[melhor[objetivo]]
+        novo_limite = novo_custo / limite_inferior if limite_inferior else 1.0
+        if concluida:
+            restantes = [custos[i] + heuristicas[i] for i in pendentes()]
+            if restantes:
+                limite_inferior = max(limite_inferior, min(restantes))
+            else:
+                limite_inferior = novo_custo  # Nada mais a explorar: a solução é ótima
+            novo_limite = min(peso, novo_custo / limite_inferior) if limite_inferior else 1.0
+        novo_limite = max(1.0, novo_limite)
+        if limite is not None:
+            novo_limite = min(novo_limite, limite)
+        if custo is None or novo_custo < custo or novo_limite < limite:
+            custo, limite = novo_custo, novo_limite
+            caminho = pool.caminho(melhor[objetivo])
+            if ao_melhorar is not None:
+                ao_melhorar(caminho, limite, time.time() - inicio)
+        
+        if not concluida or limite == 1.0 or time.time() > fim_prazo:
+            break
+        
+        # Próxima rodada: peso menor, fronteira = abertos + inconsistentes
+        peso = max(1.0, peso - decremento)
+        indices = list(pendentes())
+        aberta = FilaHeap()
+        for indice in indices:
+            aberta.inserir(custos[indice] + peso * heuristicas[indice], heuristicas[indice], indice)
+        fechados = set()
+        inconsistentes = set()
+    
+    return caminho, nos_expandidos, time.time() - inicio, limite
+
+def busca_ida_estrela(estado_inicial, estado_objetivo, heuristica='manhattan', cancelar=None):
+    """
+    Implementa o A* com aprofundamento iterativo (IDA*).
+    
+    Faz buscas em profundidade limitadas por f = g + h, aumentando o limite
+    para o menor f que o excedeu. Um único nó é alterado no lugar e os
+    movimentos são desfeitos na volta da recursão, então a memória usada é
+    proporcional à profundidade da solução.
+    
+    Args:
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (define o N)
+        heuristica: Nome da heurística ('manhattan', 'conflito_linear' ou 'padroes')
+        cancelar: Função opcional sem argumentos consultada periodicamente;
+            se retornar True a busca é interrompida com BuscaCancelada
+    
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo) com a solução encontrada,
+        ou (None, nos_expandidos, tempo) se não houver solução
+    """
+    inicio = time.time()
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    objetivo = tabuleiro.empacotar(estado_objetivo)
+    avaliador = obter_heuristica(heuristica, objetivo, tabuleiro)
+    no = Puzzle(estado_inicial, avaliador=avaliador)
+    nos_expandidos = 0
+    
+    # Estados de paridade diferente nunca se alcançam; o IDA* não pararia
+    if not tabuleiro.eh_soluvel(no.codigo, objetivo):
+        return None, nos_expandidos, time.time() - inicio
+    
+    acoes = []  # Pilha de ações do caminho atual
+    
+    def buscar(limite, anterior):
+        """
+        Busca em profundidade a partir do nó atual.
+        
+        Returns:
+            True se encontrou o objetivo, ou o menor f que excedeu o limite
+        """
+        nonlocal nos_expandidos
+        if no.f > limite:
+            return no.f
+        if no.codigo == objetivo:
+            return True
+        
+        nos_expandidos += 1
+        if cancelar is not None and not nos_expandidos % INTERVALO_CANCELAMENTO and cancelar():
+            raise BuscaCancelada()
+        proximo_limite = float('inf')
+        for acao, destino in tabuleiro.vizinhos[no.vazio]:
+            if destino == anterior:  # Não desfaz o movimento anterior
+                continue
+            origem = no.aplicar_movimento(destino)
+            acoes.append(acao)
+            resultado = buscar(limite, origem)
+            if resultado is True:
+                return True
+            acoes.pop()
+            no.desfazer_movimento(origem)
+            proximo_limite = min(proximo_limite, resultado)
+        return proximo_limite
+    
+    limite = no.heuristica
+    while True:
+        resultado = buscar(limite, -1)
+        if resultado is True:
+            break
+        if resultado == float('inf'):
+            return None, nos_expandidos, time.time() - inicio
+        limite = resultado
+    tempo = time.time() - inicio
+    
+    # O caminho refaz as ações a partir do estado inicial quando for percorrido
+    nomes = [acao for acao, _, _ in MOVIMENTOS]
+    caminho = CaminhoPreguicoso(tabuleiro, tabuleiro.empacotar(estado_inicial),
+                                [nomes.index(acao) for acao in acoes])
+    
+    return caminho, nos_expandidos, tempo
+
 def imprimir_estado(estado):
     """
     Imprime o estado do tabuleiro de forma legível.
     
     Args:
-        estado: Matriz 3x3 representando um estado do tabuleiro
+        estado: Matriz N×N representando um estado do tabuleiro
     """
     for linha in estado:
         print(linha)
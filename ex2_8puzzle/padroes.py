@@ -0,0 +1,232 @@
+'''
+Bancos de padrões disjuntos e aditivos para o quebra-cabeça N×N.
+
+As peças são divididas em grupos disjuntos. Para cada grupo, uma busca
+em largura no espaço abstrato (só as peças do grupo importam) calcula
+quantos movimentos DAS PEÇAS DO GRUPO são necessários para colocá-las no
+lugar. Como cada movimento move uma única peça, a soma dos valores dos
+grupos continua admissível.
+
+As tabelas são geradas uma vez, offline, para cada tamanho de tabuleiro:
+
+    python padroes.py 3
+    python padroes.py 4
+
+e salvas em arquivos binários (1 byte por entrada) no diretório padroes/.
+Na carga elas são mapeadas em memória (mmap), então vários processos de
+busca compartilham a mesma cópia no cache de páginas do sistema.
+'''
+
+import mmap
+import os
+import struct
+import sys
+import time
+from collections import deque
+
+from estado import LADO, obter_tabuleiro
+from heuristicas import posicoes_objetivo
+
+DIRETORIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'padroes')
+
+# Grupos de peças usados por padrão em cada tamanho de tabuleiro
+GRUPOS_PADRAO = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)],
+    5: [(1, 2, 6, 7), (3, 4, 5, 8), (9, 10, 14, 15), (11, 12, 16, 17),
+        (13, 18, 19, 20), (21, 22, 23, 24)],
+}
+
+# Cabeçalho do arquivo: assinatura, lado do tabuleiro, número de peças do grupo
+CABECALHO = struct.Struct('<4sBB')
+ASSINATURA = b'PDB1'
+NAO_VISITADO = 255
+
+
+def tamanho_tabela(k, casas):
+    """
+    Número de arranjos de k peças distintas nas casas do tabuleiro.
+    """
+    tamanho = 1
+    for i in range(k):
+        tamanho *= casas - i
+    return tamanho
+
+
+def indice_arranjo(posicoes, casas):
+    """
+    Ordena (rank) um arranjo parcial: cada posição é numerada entre as
+    casas ainda livres, formando um número em base mista sem lacunas.
+
+    Args:
+        posicoes: Posições das peças do grupo, na ordem do grupo
+        casas: Número de casas do tabuleiro
+
+    Returns:
+        Índice entre 0 e tamanho_tabela(len(posicoes), casas) - 1
+    """
+    indice = 0
+    for i, posicao in enumerate(posicoes):
+        menores = 0
+        for anterior in posicoes[:i]:
+            if anterior < posicao:
+                menores += 1
+        indice = indice * (casas - i) + posicao - menores
+    return indice
+
+
+def construir_tabela(grupo, tabuleiro, objetivo=None):
+    """
+    Calcula a tabela de um grupo por busca em largura a partir do objetivo.
+
+    No espaço abstrato só as peças do grupo existem: uma peça pode deslizar
+    para qualquer casa vizinha livre, como se o vazio estivesse em todas as
+    casas fora do grupo. Cada movimento real altera no máximo um grupo em
+    uma unidade, então a soma dos grupos é admissível e consistente.
+
+    Args:
+        grupo: Tupla com as peças do grupo
+        tabuleiro: Tabuleiro do problema
+        objetivo: Estado objetivo empacotado (padrão: objetivo ordenado)
+
+    Returns:
+        bytearray indexado por indice_arranjo() com o custo mínimo
+    """
+    if objetivo is None:
+        objetivo = tabuleiro.objetivo_padrao
+    casas = tabuleiro.casas
+    alvo = posicoes_objetivo(objetivo, tabuleiro)
+    tabela = bytearray([NAO_VISITADO]) * tamanho_tabela(len(grupo), casas)
+
+    inicio = tuple(alvo[peca] for peca in grupo)
+    tabela[indice_arranjo(inicio, casas)] = 0
+    fila = deque([inicio])
+    while fila:
+        posicoes = fila.popleft()
+        custo = tabela[indice_arranjo(posicoes, casas)] + 1
+        for i, posicao in enumerate(posicoes):
+            for _, destino in tabuleiro.vizinhos[posicao]:
+                if destino in posicoes:
+                    continue
+                novas = posicoes[:i] + (destino,) + posicoes[i + 1:]
+                indice = indice_arranjo(novas, casas)
+                if tabela[indice] == NAO_VISITADO:
+                    tabela[indice] = custo
+                    fila.append(novas)
+    return tabela
+
+
+def salvar_tabela(caminho, lado, grupo, tabela):
+    """
+    Grava a tabela em um arquivo binário compacto.
+    """
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(ASSINATURA, lado, len(grupo)))
+        arquivo.write(bytes(grupo))
+        arquivo.write(tabela)
+
+
+def nome_arquivo(lado, grupo):
+    """
+    Caminho do arquivo de um grupo, por exemplo padroes/3x3_1-2-3-4.bin.
+    """
+    return os.path.join(DIRETORIO, f"{lado}x{lado}_{'-'.join(map(str, grupo))}.bin")
+
+
+class TabelaPadroes:
+    """
+    Tabela de um grupo, mapeada em memória a partir do arquivo.
+    """
+
+    def __init__(self, caminho, lado):
+        with open(caminho, 'rb') as arquivo:
+            self.dados = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        assinatura, lado_arquivo, k = CABECALHO.unpack_from(self.dados, 0)
+        if assinatura != ASSINATURA or lado_arquivo != lado:
+            raise ValueError(f"Arquivo de padrões inválido: {caminho}")
+        self.casas = lado * lado
+        self.grupo = tuple(self.dados[CABECALHO.size:CABECALHO.size + k])
+        self.inicio = CABECALHO.size + k  # Deslocamento do início da tabela
+
+    def valor(self, posicoes):
+        return self.dados[self.inicio + indice_arranjo(posicoes, self.casas)]
+
+
+class HeuristicaPadroes:
+    """
+    Soma dos valores dos bancos de padrões disjuntos.
+    """
+    nome = 'padroes'
+
+    def __init__(self, tabelas, tabuleiro):
+        self.tabelas = tabelas
+        self.tabuleiro = tabuleiro
+        # Para cada peça, o índice da tabela do seu grupo (None para o vazio)
+        self.tabela_da_peca = [None] * tabuleiro.casas
+        for i, tabela in enumerate(tabelas):
+            for peca in tabela.grupo:
+                self.tabela_da_peca[peca] = i
+
+    def _posicoes(self, codigo):
+        bits, mascara = self.tabuleiro.bits, self.tabuleiro.mascara
+        posicoes = [0] * self.tabuleiro.casas
+        for posicao in range(self.tabuleiro.casas):
+            posicoes[codigo & mascara] = posicao
+            codigo >>= bits
+        return posicoes
+
+    def calcular(self, codigo):
+        posicoes = self._posicoes(codigo)
+        return sum(tabela.valor([posicoes[peca] for peca in tabela.grupo])
+                   for tabela in self.tabelas)
+
+    def atualizar(self, h, codigo, peca, de, para):
+        # Só o grupo da peça movida muda de valor
+        tabela = self.tabelas[self.tabela_da_peca[peca]]
+        posicoes = self._posicoes(codigo)
+        depois = [posicoes[p] for p in tabela.grupo]
+        antes = [de if p == peca else posicoes[p] for p in tabela.grupo]
+        return h - tabela.valor(antes) + tabela.valor(depois)
+
+
+_carregadas = {}  # Heurísticas já mapeadas, por lado do tabuleiro
+
+
+def carregar_padroes(lado=LADO):
+    """
+    Mapeia em memória as tabelas dos grupos de um tabuleiro (uma vez por processo).
+
+    Raises:
+        FileNotFoundError: se as tabelas ainda não foram geradas
+    """
+    if lado not in _carregadas:
+        tabelas = []
+        for grupo in GRUPOS_PADRAO[lado]:
+            caminho = nome_arquivo(lado, grupo)
+            if not os.path.exists(caminho):
+                raise FileNotFoundError(
+                    f"{caminho} não encontrado; gere as tabelas com: python padroes.py {lado}")
+            tabelas.append(TabelaPadroes(caminho, lado))
+        _carregadas[lado] = HeuristicaPadroes(tabelas, obter_tabuleiro(lado))
+    return _carregadas[lado]
+
+
+def main():
+    """
+    Gera e salva as tabelas de todos os grupos padrão de um tamanho de tabuleiro.
+    """
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else LADO
+    tabuleiro = obter_tabuleiro(lado)
+    os.makedirs(DIRETORIO, exist_ok=True)
+    for grupo in GRUPOS_PADRAO[lado]:
+        inicio = time.time()
+        tabela = construir_tabela(grupo, tabuleiro)
+        caminho = nome_arquivo(lado, grupo)
+        salvar_tabela(caminho, lado, grupo, tabela)
+        print(f"{caminho}: {len(tabela)} entradas, máximo {max(tabela)}, "
+              f"{time.time() - inicio:.2f} segundos")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
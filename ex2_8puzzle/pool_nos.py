@@ -0,0 +1,191 @@
+'''
+Armazenamento compacto dos nós da busca e caminho reconstruído sob demanda.
+
+Em vez de um objeto Puzzle (com __dict__) por nó gerado, PoolNos guarda
+cada campo em um array tipado: o nó é só um índice. O pai é o índice do
+nó pai e a ação é o índice do movimento em MOVIMENTOS, que cabe em 2 bits
+(4 ações por byte).
+
+A solução é devolvida como um CaminhoPreguicoso: uma sequência de pares
+(acao, estado) que guarda apenas o estado inicial e os movimentos, e
+reconstrói a matriz de cada passo só quando ela é pedida.
+'''
+
+from array import array
+from collections.abc import Sequence
+
+from estado import MOVIMENTOS
+
+
+class NoPool:
+    """
+    Visão de leitura de um nó do pool, com os mesmos campos de um Puzzle
+    (codigo, vazio, custo, heuristica, f, acao). Só é criada quando alguém
+    precisa de um objeto, como os ganchos de estatisticas.py.
+    """
+
+    __slots__ = ('indice', 'codigo', 'vazio', 'custo', 'heuristica', 'f', 'acao')
+
+    def __init__(self, indice, codigo, vazio, custo, heuristica, acao):
+        self.indice = indice  # Posição no pool (-1 se o nó não foi guardado)
+        self.codigo = codigo
+        self.vazio = vazio
+        self.custo = custo
+        self.heuristica = heuristica
+        self.f = custo + heuristica
+        self.acao = MOVIMENTOS[acao][0] if acao >= 0 else None
+
+
+class PoolNos:
+    """
+    Nós da busca guardados em arrays paralelos, indexados pela ordem de inserção.
+
+    Args:
+        tabuleiro: Tabuleiro dos estados guardados
+    """
+
+    def __init__(self, tabuleiro):
+        self.tabuleiro = tabuleiro
+        # Estados de até 64 bits (até o 15-puzzle) cabem em um array de uint64
+        if tabuleiro.bits * tabuleiro.casas <= 64:
+            self.codigos = array('Q')
+        else:
+            self.codigos = []
+        self.pais = array('i')  # Índice do pai (-1 na raiz)
+        self.custos = array('H')  # g(n)
+        self.heuristicas = array('H')  # h(n)
+        self.vazios = array('B')  # Posição do vazio
+        self.acoes = bytearray()  # Movimento que gerou o nó, 2 bits por nó
+
+    def adicionar(self, codigo, pai, acao, custo, vazio, heuristica):
+        """
+        Guarda um nó e retorna seu índice.
+
+        Args:
+            acao: Índice do movimento em MOVIMENTOS (ignorado na raiz)
+        """
+        indice = len(self.pais)
+        self.codigos.append(codigo)
+        self.pais.append(pai)
+        self.custos.append(custo)
+        self.heuristicas.append(heuristica)
+        self.vazios.append(vazio)
+        if not indice & 3:
+            self.acoes.append(0)
+        self.acoes[indice >> 2] |= (acao & 3) << ((indice & 3) << 1)
+        return indice
+
+    def acao(self, indice):
+        """
+        Índice em MOVIMENTOS do movimento que gerou o nó.
+        """
+        return (self.acoes[indice >> 2] >> ((indice & 3) << 1)) & 3
+
+    def no(self, indice):
+        """
+        Cria a visão NoPool de um nó guardado.
+        """
+        return NoPool(indice, self.codigos[indice], self.vazios[indice], self.custos[indice],
+                      self.heuristicas[indice], self.acao(indice) if self.pais[indice] >= 0 else -1)
+
+    def caminho(self, indice):
+        """
+        Caminho da raiz até o nó, como CaminhoPreguicoso.
+        """
+        movimentos = bytearray()
+        pais = self.pais
+        while pais[indice] >= 0:
+            movimentos.append(self.acao(indice))
+            indice = pais[indice]
+        movimentos.reverse()
+        return CaminhoPreguicoso(self.tabuleiro, self.codigos[indice], movimentos)
+
+    def __len__(self):
+        return len(self.pais)
+
+
+class CaminhoPreguicoso(Sequence):
+    """
+    Sequência de pares (acao, estado) de uma solução, com `estado` como
+    matriz N×N. Guarda só o estado inicial e os índices dos movimentos;
+    cada estado é refeito a partir do marco anterior mais próximo, e um
+    marco é registrado a cada `intervalo` passos já calculados.
+
+    Args:
+        tabuleiro: Tabuleiro dos estados
+        codigo_inicial: Estado inicial empacotado
+        movimentos: Índices em MOVIMENTOS de cada passo
+        intervalo: Distância, em passos, entre marcos guardados
+    """
+
+    def __init__(self, tabuleiro, codigo_inicial, movimentos, intervalo=32):
+        self.tabuleiro = tabuleiro
+        self.movimentos = bytes(movimentos)
+        self.intervalo = intervalo
+        # marcos[k] = (codigo, vazio) depois de k * intervalo movimentos
+        self._marcos = [(codigo_inicial, tabuleiro.posicao_vazio(codigo_inicial))]
+
+    @property
+    def acoes(self):
+        """
+        Nomes das ações, sem reconstruir nenhum estado.
+        """
+        return [MOVIMENTOS[d][0] for d in self.movimentos]
+
+    def _refazer(self, codigo, vazio, inicio, fim):
+        """
+        Aplica os movimentos [inicio, fim) a partir de (codigo, vazio).
+        """
+        mover = self.tabuleiro.mover
+        passos = self.tabuleiro.passos
+        for d in self.movimentos[inicio:fim]:
+            destino = vazio + passos[d]
+            codigo, _ = mover(codigo, vazio, destino)
+            vazio = destino
+        return codigo, vazio
+
+    def codigo(self, indice):
+        """
+        Estado empacotado depois do passo `indice` (0 é o primeiro movimento).
+        """
+        passos_feitos = indice + 1
+        marco = passos_feitos // self.intervalo
+        while len(self._marcos) <= marco:
+            k = len(self._marcos) - 1
+            self._marcos.append(self._refazer(*self._marcos[k], k * self.intervalo,
+                                              (k + 1) * self.intervalo))
+        codigo, _ = self._refazer(*self._marcos[marco], marco * self.intervalo, passos_feitos)
+        return codigo
+
+    def __len__(self):
+        return len(self.movimentos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice fora do caminho")
+        return MOVIMENTOS[self.movimentos[indice]][0], self.tabuleiro.desempacotar(self.codigo(indice))
+
+    def __iter__(self):
+        # Percorre em sequência, um movimento por passo
+        mover = self.tabuleiro.mover
+        passos = self.tabuleiro.passos
+        codigo, vazio = self._marcos[0]
+        for d in self.movimentos:
+            destino = vazio + passos[d]
+            codigo, _ = mover(codigo, vazio, destino)
+            vazio = destino
+            yield MOVIMENTOS[d][0], self.tabuleiro.desempacotar(codigo)
+
+    def __eq__(self, outro):
+        if isinstance(outro, CaminhoPreguicoso):
+            return self._marcos[0] == outro._marcos[0] and self.movimentos == outro.movimentos
+        if isinstance(outro, Sequence):
+            return list(self) == list(outro)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CaminhoPreguicoso({len(self)} movimentos)"
@@ -0,0 +1,422 @@
+'''
+Serviço local (asyncio) que resolve o quebra-cabeça sob demanda.
+
+Aceita pedidos em JSON Lines sobre TCP ou em HTTP, na mesma porta:
+
+    {"id": 1, "estado": [[7, 2, 4], [5, 0, 6], [8, 3, 1]], "prazo": 2.0}
+    {"cancelar": 1}
+    {"metricas": true}
+
+    POST /resolver  (corpo: o mesmo JSON de um pedido)
+    GET /metricas
+
+Campos opcionais de um pedido: "objetivo", "algoritmo" ('a_estrela',
+'ida_estrela' ou 'ara'), "heuristica" e "prazo" (segundos). As respostas
+em JSON Lines chegam na ordem em que ficam prontas, com o mesmo "id".
+
+As buscas rodam em um pool de processos. Cada processo tem uma vaga em um
+vetor compartilhado de sinais; a busca consulta o sinal da sua vaga e o
+prazo a cada INTERVALO_CANCELAMENTO nós (ver main.py) e para com
+BuscaCancelada. A fila de pedidos é limitada: em JSON Lines, com a fila
+cheia o servidor para de ler a conexão (o TCP propaga a pressão ao
+cliente); em HTTP, responde 503.
+
+    python servico.py --porta 8765 --processos 4 --max-fila 64
+'''
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from estado import obter_tabuleiro
+from lote import validar
+
+ALGORITMOS = ('a_estrela', 'ida_estrela', 'ara')
+
+_sinais = None  # Vetor compartilhado de pedidos de cancelamento, um por vaga
+
+
+def _iniciar_trabalhador(sinais):
+    global _sinais
+    _sinais = sinais
+
+
+def _resolver(vaga, estado, objetivo, algoritmo, heuristica, limite):
+    """
+    Executa uma busca dentro de um processo do pool.
+
+    Args:
+        vaga: Índice do sinal de cancelamento deste pedido
+        limite: Instante (time.time()) em que o prazo acaba
+
+    Returns:
+        Dicionário com o resultado
+    """
+    from main import BuscaCancelada, busca_a_estrela, busca_ara, busca_ida_estrela
+
+    def cancelar():
+        return _sinais[vaga] or time.time() > limite
+
+    try:
+        if algoritmo == 'ara':
+            # O ARA* usa o prazo para refinar e devolve a melhor solução até lá
+            caminho, nos_expandidos, tempo, fator = busca_ara(
+                estado, objetivo, heuristica, prazo=max(0.0, limite - time.time()),
+                cancelar=lambda: _sinais[vaga])
+        else:
+            busca = busca_a_estrela if algoritmo == 'a_estrela' else busca_ida_estrela
+            caminho, nos_expandidos, tempo = busca(estado, objetivo, heuristica,
+                                                   cancelar=cancelar)
+            fator = None
+    except BuscaCancelada:
+        return {'status': 'tempo_esgotado' if time.time() > limite else 'cancelado'}
+
+    resultado = {'nos_expandidos': nos_expandidos, 'tempo': tempo}
+    if caminho is None:
+        resultado['status'] = 'sem_solucao'
+    else:
+        resultado['status'] = 'resolvido'
+        resultado['movimentos'] = len(caminho)
+        resultado['acoes'] = caminho.acoes
+        if fator is not None:
+            resultado['limite_subotimo'] = fator
+    return resultado
+
+
+def percentis(valores, pontos=(50, 90, 99)):
+    """
+    Percentis pelo método do posto mais próximo.
+
+    Returns:
+        Dicionário {'p50': ..., ...}, vazio se não houver valores
+    """
+    if not valores:
+        return {}
+    ordenados = sorted(valores)
+    return {f"p{p}": ordenados[min(len(ordenados) - 1, max(0, -(-p * len(ordenados) // 100) - 1))]
+            for p in pontos}
+
+
+class Pedido:
+    """
+    Um pedido de resolução, da chegada até a resposta.
+    """
+
+    def __init__(self, identificador, estado, objetivo, algoritmo, heuristica, prazo):
+        self.id = identificador
+        self.estado = estado
+        self.objetivo = objetivo
+        self.algoritmo = algoritmo
+        self.heuristica = heuristica
+        self.chegada = time.time()
+        self.limite = self.chegada + prazo
+        self.vaga = None  # Vaga do pool enquanto está em execução
+        self.temporizador = None  # Resposta de tempo esgotado, cancelada ao concluir
+        self.futuro = asyncio.get_running_loop().create_future()
+
+
+class Servico:
+    """
+    Fila de pedidos, pool de processos e servidor TCP/HTTP.
+
+    Args:
+        processos: Número de processos de busca (padrão: número de núcleos)
+        max_fila: Máximo de pedidos aguardando um processo
+        prazo_padrao: Prazo, em segundos, dos pedidos que não informam um
+        prazo_maximo: Maior prazo aceito
+    """
+
+    def __init__(self, processos=None, max_fila=64, prazo_padrao=10.0, prazo_maximo=60.0):
+        self.processos = processos or os.cpu_count() or 1
+        self.max_fila = max_fila
+        self.prazo_padrao = prazo_padrao
+        self.prazo_maximo = prazo_maximo
+        self.sinais = multiprocessing.Array('b', self.processos, lock=False)
+        self.executor = None
+        self.fila = None
+        self.servidor = None
+        self.despachantes = []
+        self.conexoes = set()  # Tarefas das conexões abertas
+        self.latencias = deque(maxlen=10000)  # Segundos, da chegada à resposta
+        self.contagem = {}  # status -> número de respostas
+        self.sequencia = itertools.count(1)
+
+    async def iniciar(self, host='127.0.0.1', porta=8765):
+        self.executor = ProcessPoolExecutor(self.processos, initializer=_iniciar_trabalhador,
+                                            initargs=(self.sinais,))
+        self.fila = asyncio.Queue(self.max_fila)
+        self.despachantes = [asyncio.create_task(self._despachar(vaga))
+                             for vaga in range(self.processos)]
+        self.servidor = await asyncio.start_server(self._atender, host, porta)
+        return self.servidor
+
+    async def parar(self):
+        if self.servidor is not None:
+            self.servidor.close()
+        for tarefa in list(self.conexoes):
+            tarefa.cancel()
+        await asyncio.gather(*self.conexoes, return_exceptions=True)
+        if self.servidor is not None:
+            await self.servidor.wait_closed()
+        for vaga in range(self.processos):
+            self.sinais[vaga] = 1
+        for tarefa in self.despachantes:
+            tarefa.cancel()
+        await asyncio.gather(*self.despachantes, return_exceptions=True)
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def criar_pedido(self, dados):
+        """
+        Valida os dados de um pedido.
+
+        Returns:
+            Pedido, ou um dicionário de resposta imediata (erro ou insolúvel)
+        """
+        identificador = dados.get('id', next(self.sequencia))
+        try:
+            if isinstance(identificador, (list, dict)):
+                raise ValueError("o id deve ser um texto ou um número")
+            estado = dados['estado']
+            tabuleiro = obter_tabuleiro(len(estado))
+            objetivo = dados.get('objetivo') or tabuleiro.desempacotar(tabuleiro.objetivo_padrao)
+            algoritmo = dados.get('algoritmo', 'a_estrela')
+            if algoritmo not in ALGORITMOS:
+                raise ValueError(f"algoritmo desconhecido: {algoritmo}")
+            validar(estado, objetivo, algoritmo)
+            prazo = float(dados.get('prazo', self.prazo_padrao))
+            if not math.isfinite(prazo) or prazo <= 0:
+                raise ValueError(f"o prazo deve ser um número positivo de segundos, não {prazo}")
+            prazo = min(prazo, self.prazo_maximo)
+        except (ValueError, KeyError, TypeError) as erro:
+            return {'id': identificador, 'status': 'erro', 'mensagem': str(erro)}
+        if not tabuleiro.eh_soluvel(tabuleiro.empacotar(estado), tabuleiro.empacotar(objetivo)):
+            return {'id': identificador, 'status': 'insoluvel'}
+        pedido = Pedido(identificador, estado, objetivo, algoritmo,
+                        dados.get('heuristica', 'manhattan'), prazo)
+        # Responde no prazo mesmo que a busca não chegue a um ponto de verificação
+        pedido.temporizador = asyncio.get_running_loop().call_later(
+            prazo, self._concluir, pedido, {'status': 'tempo_esgotado'})
+        pedido.futuro.add_done_callback(lambda _: self._registrar(pedido))
+        return pedido
+
+    def _concluir(self, pedido, resultado):
+        """
+        Entrega o resultado de um pedido (só o primeiro conta) e, se ele
+        ainda estiver em execução, sinaliza o processo para parar.
+        """
+        if pedido.futuro.done():
+            return
+        resultado['id'] = pedido.id
+        pedido.futuro.set_result(resultado)
+        if pedido.temporizador is not None:
+            pedido.temporizador.cancel()
+        if pedido.vaga is not None:
+            self.sinais[pedido.vaga] = 1
+
+    def cancelar(self, pedido):
+        self._concluir(pedido, {'status': 'cancelado'})
+
+    def _registrar(self, pedido):
+        resultado = pedido.futuro.result()
+        self.latencias.append(time.time() - pedido.chegada)
+        self.contagem[resultado['status']] = self.contagem.get(resultado['status'], 0) + 1
+
+    async def _despachar(self, vaga):
+        """
+        Tarefa que leva pedidos da fila para o processo da sua vaga.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pedido = await self.fila.get()
+            if pedido.futuro.done():  # Cancelado ou expirado enquanto esperava
+                continue
+            self.sinais[vaga] = 0
+            pedido.vaga = vaga
+            try:
+                resultado = await loop.run_in_executor(
+                    self.executor, _resolver, vaga, pedido.estado, pedido.objetivo,
+                    pedido.algoritmo, pedido.heuristica, pedido.limite)
+            except Exception as erro:
+                resultado = {'status': 'erro', 'mensagem': str(erro)}
+            pedido.vaga = None
+            self._concluir(pedido, resultado)
+
+    def metricas(self):
+        latencias = list(self.latencias)
+        return {
+            'fila': self.fila.qsize(),
+            'max_fila': self.max_fila,
+            'processos': self.processos,
+            'respostas': dict(self.contagem),
+            'latencia': percentis(latencias),
+        }
+
+    async def _atender(self, leitor, escritor):
+        """
+        Atende uma conexão; a primeira linha diz se é HTTP ou JSON Lines.
+        """
+        tarefa = asyncio.current_task()
+        self.conexoes.add(tarefa)
+        try:
+            primeira = await leitor.readline()
+            if primeira.startswith((b'GET ', b'POST ')):
+                await self._atender_http(primeira, leitor, escritor)
+            else:
+                await self._atender_linhas(primeira, leitor, escritor)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass  # Serviço parando: a conexão é só fechada
+        finally:
+            self.conexoes.discard(tarefa)
+            escritor.close()
+
+    async def _atender_linhas(self, linha, leitor, escritor):
+        pendentes = {}  # id -> Pedido desta conexão
+
+        async def responder(pedido):
+            escritor.write(json.dumps(await pedido.futuro, ensure_ascii=False).encode() + b'\n')
+            pendentes.pop(pedido.id, None)
+            await escritor.drain()
+
+        tarefas = set()
+        try:
+            while linha:
+                linha = linha.strip()
+                if linha:
+                    try:
+                        dados = json.loads(linha)
+                        if not isinstance(dados, dict):
+                            raise ValueError("cada linha deve ser um objeto JSON")
+                    except ValueError as erro:
+                        dados = None
+                        escritor.write(json.dumps({'status': 'erro', 'mensagem': str(erro)},
+                                                  ensure_ascii=False).encode() + b'\n')
+                    if dados is None:
+                        pass
+                    elif 'cancelar' in dados:
+                        if isinstance(dados['cancelar'], (list, dict)):
+                            escritor.write(json.dumps(
+                                {'status': 'erro', 'mensagem': "cancelar recebe o id de um pedido"},
+                                ensure_ascii=False).encode() + b'\n')
+                        elif dados['cancelar'] in pendentes:
+                            self.cancelar(pendentes[dados['cancelar']])
+                    elif dados.get('metricas'):
+                        escritor.write(json.dumps(self.metricas()).encode() + b'\n')
+                    else:
+                        pedido = self.criar_pedido(dados)
+                        if isinstance(pedido, dict):
+                            escritor.write(json.dumps(pedido, ensure_ascii=False).encode() + b'\n')
+                        else:
+                            pendentes[pedido.id] = pedido
+                            tarefa = asyncio.create_task(responder(pedido))
+                            tarefas.add(tarefa)
+                            tarefa.add_done_callback(tarefas.discard)
+                            # Com a fila cheia, espera aqui: a conexão deixa de ser lida
+                            await self.fila.put(pedido)
+                    await escritor.drain()
+                linha = await leitor.readline()
+            await asyncio.gather(*tarefas, return_exceptions=True)
+        finally:
+            # Cliente desconectou: o que ainda estiver pendente é cancelado
+            for pedido in list(pendentes.values()):
+                self.cancelar(pedido)
+
+    async def _atender_http(self, primeira, leitor, escritor):
+        erro = None
+        partes = primeira.decode('latin-1').split()
+        if len(partes) in (2, 3):
+            metodo, caminho = partes[:2]
+        else:
+            metodo = caminho = None
+            erro = "linha de requisição inválida"
+        tamanho = 0
+        while True:
+            cabecalho = await leitor.readline()
+            if cabecalho in (b'\r\n', b'\n', b''):
+                break
+            nome, _, valor = cabecalho.decode('latin-1').partition(':')
+            if nome.strip().lower() == 'content-length':
+                try:
+                    tamanho = int(valor.strip())
+                    if tamanho < 0:
+                        raise ValueError
+                except ValueError:
+                    tamanho = 0
+                    erro = erro or f"Content-Length inválido: {valor.strip()}"
+        corpo = await leitor.readexactly(tamanho) if tamanho else b''
+
+        if erro is not None:
+            codigo, resposta = 400, {'status': 'erro', 'mensagem': erro}
+        elif metodo == 'GET' and caminho == '/metricas':
+            codigo, resposta = 200, self.metricas()
+        elif metodo == 'POST' and caminho == '/resolver':
+            try:
+                dados = json.loads(corpo)
+                if not isinstance(dados, dict):
+                    raise ValueError("o corpo deve ser um objeto JSON")
+            except ValueError as erro:
+                codigo, resposta = 400, {'status': 'erro', 'mensagem': str(erro)}
+            else:
+                pedido = self.criar_pedido(dados)
+                if isinstance(pedido, dict):
+                    codigo, resposta = (400 if pedido['status'] == 'erro' else 200), pedido
+                else:
+                    try:
+                        self.fila.put_nowait(pedido)
+                    except asyncio.QueueFull:
+                        self._concluir(pedido, {'status': 'ocupado'})
+                        codigo, resposta = 503, pedido.futuro.result()
+                    else:
+                        codigo, resposta = 200, await pedido.futuro
+        else:
+            codigo, resposta = 404, {'status': 'erro', 'mensagem': 'caminho desconhecido'}
+
+        conteudo = json.dumps(resposta, ensure_ascii=False).encode()
+        razoes = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 503: 'Service Unavailable'}
+        escritor.write(f"HTTP/1.1 {codigo} {razoes[codigo]}\r\n"
+                       f"Content-Type: application/json; charset=utf-8\r\n"
+                       f"Content-Length: {len(conteudo)}\r\n"
+                       f"Connection: close\r\n\r\n".encode('latin-1') + conteudo)
+        await escritor.drain()
+
+
+async def servir(host, porta, processos, max_fila, prazo_padrao):
+    servico = Servico(processos, max_fila, prazo_padrao)
+    servidor = await servico.iniciar(host, porta)
+    print(f"Servindo em {host}:{porta} com {servico.processos} processos", file=sys.stderr)
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servico.parar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço de resolução do quebra-cabeça.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--processos', type=int, default=None,
+                        help="processos de busca (padrão: número de núcleos)")
+    parser.add_argument('--max-fila', type=int, default=64,
+                        help="máximo de pedidos aguardando um processo")
+    parser.add_argument('--prazo', type=float, default=10.0,
+                        help="prazo padrão de cada pedido, em segundos")
+    args = parser.parse_args()
+    try:
+        asyncio.run(servir(args.host, args.porta, args.processos, args.max_fila, args.prazo))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
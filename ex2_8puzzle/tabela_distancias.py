@@ -0,0 +1,216 @@
+'''
+Tabela completa de distâncias ótimas do 8-puzzle.
+
+O 8-puzzle tem só 9!/2 = 181.440 estados alcançáveis a partir de um
+objetivo. Uma única busca em largura retrógrada, partindo do objetivo,
+calcula a distância ótima de todos eles; o resultado fica em um arquivo
+de 9! bytes indexado pelo rank da permutação (código de Lehmer).
+
+Gere as tabelas uma vez, offline:
+
+    python tabela_distancias.py
+
+Na carga o arquivo é mapeado em memória (mmap). Resolver um estado passa a
+ser uma descida gulosa na tabela: a cada passo basta escolher o vizinho
+com distância uma unidade menor, sem nenhuma busca.
+
+Há uma tabela para cada posição do vazio no objetivo. Qualquer outro
+objetivo é reduzido a uma delas renomeando as peças (os movimentos do
+vazio não dependem dos números das peças).
+'''
+
+import mmap
+import os
+import struct
+import sys
+import time
+from math import factorial
+
+from estado import obter_tabuleiro
+
+DIRETORIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'distancias')
+
+CABECALHO = struct.Struct('<4sBB')  # Assinatura, lado, posição do vazio no objetivo
+ASSINATURA = b'DIST'
+NAO_ALCANCAVEL = 255
+
+TABULEIRO = obter_tabuleiro(3)
+CASAS = TABULEIRO.casas
+FATORIAIS = [factorial(CASAS - 1 - i) for i in range(CASAS)]
+
+
+def rank_permutacao(codigo):
+    """
+    Rank (código de Lehmer) da permutação de peças do estado empacotado.
+
+    Returns:
+        Índice entre 0 e 9! - 1
+    """
+    bits, mascara = TABULEIRO.bits, TABULEIRO.mascara
+    pecas = []
+    for _ in range(CASAS):
+        pecas.append(codigo & mascara)
+        codigo >>= bits
+    rank = 0
+    usadas = 0  # Máscara das peças que já apareceram
+    for i, peca in enumerate(pecas):
+        menores_livres = peca - bin(usadas & ((1 << peca) - 1)).count('1')
+        rank += menores_livres * FATORIAIS[i]
+        usadas |= 1 << peca
+    return rank
+
+
+def objetivo_canonico(vazio):
+    """
+    Objetivo com as peças 1 a 8 em ordem e o vazio na posição `vazio`.
+    """
+    return TABULEIRO.objetivo_canonico(vazio)
+
+
+def construir_tabela(vazio):
+    """
+    Busca em largura retrógrada a partir do objetivo canônico.
+
+    Args:
+        vazio: Posição do vazio no objetivo
+
+    Returns:
+        bytearray de 9! posições com a distância de cada estado
+    """
+    tabela = bytearray([NAO_ALCANCAVEL]) * factorial(CASAS)
+    objetivo = objetivo_canonico(vazio)
+    tabela[rank_permutacao(objetivo)] = 0
+    camada = [(objetivo, vazio)]
+    distancia = 0
+    while camada:
+        distancia += 1
+        proxima = []
+        for codigo, posicao_vazio in camada:
+            for _, destino in TABULEIRO.vizinhos[posicao_vazio]:
+                novo, _ = TABULEIRO.mover(codigo, posicao_vazio, destino)
+                rank = rank_permutacao(novo)
+                if tabela[rank] == NAO_ALCANCAVEL:
+                    tabela[rank] = distancia
+                    proxima.append((novo, destino))
+        camada = proxima
+    return tabela
+
+
+def nome_arquivo(vazio):
+    """
+    Caminho do arquivo de uma tabela, por exemplo distancias/3x3_vazio8.bin.
+    """
+    return os.path.join(DIRETORIO, f"3x3_vazio{vazio}.bin")
+
+
+class TabelaDistancias:
+    """
+    Tabela de distâncias de um objetivo canônico, mapeada em memória.
+    """
+
+    def __init__(self, caminho, vazio):
+        with open(caminho, 'rb') as arquivo:
+            self.dados = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        assinatura, lado, vazio_arquivo = CABECALHO.unpack_from(self.dados, 0)
+        if assinatura != ASSINATURA or lado != 3 or vazio_arquivo != vazio:
+            raise ValueError(f"Arquivo de distâncias inválido: {caminho}")
+
+    def distancia(self, codigo):
+        """
+        Distância ótima até o objetivo (255 se o estado não o alcança).
+        """
+        return self.dados[CABECALHO.size + rank_permutacao(codigo)]
+
+
+_carregadas = {}  # Tabelas já mapeadas, por posição do vazio
+
+
+def carregar_tabela(vazio=CASAS - 1):
+    """
+    Mapeia em memória a tabela de um objetivo canônico (uma vez por processo).
+
+    Raises:
+        FileNotFoundError: se a tabela ainda não foi gerada
+    """
+    if vazio not in _carregadas:
+        caminho = nome_arquivo(vazio)
+        if not os.path.exists(caminho):
+            raise FileNotFoundError(
+                f"{caminho} não encontrado; gere as tabelas com: python tabela_distancias.py")
+        _carregadas[vazio] = TabelaDistancias(caminho, vazio)
+    return _carregadas[vazio]
+
+
+def renomear(codigo, objetivo):
+    """
+    Renomeia as peças de `codigo` de forma que `objetivo` vire o objetivo
+    canônico com o vazio na mesma posição (ver Tabuleiro.renomear).
+
+    Returns:
+        Tupla (codigo_renomeado, vazio_do_objetivo)
+    """
+    return TABULEIRO.renomear(codigo, objetivo)
+
+
+def resolver_por_tabela(estado_inicial, estado_objetivo):
+    """
+    Resolve o 8-puzzle de forma ótima descendo pela tabela de distâncias.
+
+    Args:
+        estado_inicial: Matriz 3x3 representando o estado inicial
+        estado_objetivo: Matriz 3x3 representando o estado objetivo
+
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo), como busca_a_estrela;
+        nos_expandidos é o número de estados visitados na descida
+    """
+    inicio = time.time()
+    codigo, vazio_objetivo = renomear(TABULEIRO.empacotar(estado_inicial),
+                                      TABULEIRO.empacotar(estado_objetivo))
+    tabela = carregar_tabela(vazio_objetivo)
+    distancia = tabela.distancia(codigo)
+    if distancia == NAO_ALCANCAVEL:
+        return None, 0, time.time() - inicio
+
+    # Os estados do caminho são os originais: os movimentos são os mesmos
+    original = TABULEIRO.empacotar(estado_inicial)
+    vazio = TABULEIRO.posicao_vazio(codigo)
+    passos = []
+    nos_expandidos = 0
+    while distancia > 0:
+        nos_expandidos += 1
+        for acao, destino in TABULEIRO.vizinhos[vazio]:
+            novo, _ = TABULEIRO.mover(codigo, vazio, destino)
+            if tabela.distancia(novo) == distancia - 1:
+                original, _ = TABULEIRO.mover(original, vazio, destino)
+                passos.append((acao, original))
+                codigo, vazio = novo, destino
+                distancia -= 1
+                break
+    tempo = time.time() - inicio
+
+    caminho = [(acao, TABULEIRO.desempacotar(estado)) for acao, estado in passos]
+    return caminho, nos_expandidos, tempo
+
+
+def main():
+    """
+    Gera e salva as tabelas das 9 posições possíveis do vazio no objetivo.
+    """
+    os.makedirs(DIRETORIO, exist_ok=True)
+    for vazio in range(CASAS):
+        inicio = time.time()
+        tabela = construir_tabela(vazio)
+        caminho = nome_arquivo(vazio)
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(CABECALHO.pack(ASSINATURA, 3, vazio))
+            arquivo.write(tabela)
+        alcancaveis = len(tabela) - tabela.count(NAO_ALCANCAVEL)
+        maximo = max(d for d in tabela if d != NAO_ALCANCAVEL)
+        print(f"{caminho}: {alcancaveis} estados, distância máxima {maximo}, "
+              f"{time.time() - inicio:.2f} segundos")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
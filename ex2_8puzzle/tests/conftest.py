@@ -0,0 +1,131 @@
+'''
+Configuração dos testes: os módulos do projeto são importados pelo nome,
+como quando os scripts rodam a partir desta pasta.
+
+As tabelas geradas (distâncias do 8-puzzle e bancos de padrões) são
+criadas em diretórios temporários, nunca em distancias/ ou padroes/ do
+projeto. Os processos filhos dos resolvedores paralelos herdam os
+diretórios trocados porque são criados por fork.
+'''
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import padroes  # noqa: E402
+import tabela_distancias  # noqa: E402
+from benchmark import gerar_instancias  # noqa: E402
+from estado import obter_tabuleiro  # noqa: E402
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+# Grupos menores que os de padroes.GRUPOS_PADRAO no 4x4: as tabelas saem em
+# frações de segundo e o caminho do código é o mesmo
+GRUPOS_TESTE = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 3), (4, 7, 8), (5, 6, 9), (10, 11, 12), (13, 14, 15)],
+}
+
+
+@pytest.fixture(scope='session')
+def distancias(tmp_path_factory):
+    """
+    Tabelas de distâncias 3x3 com o vazio no canto final (objetivo padrão)
+    e no canto inicial, geradas em um diretório temporário.
+    """
+    diretorio = tmp_path_factory.mktemp('distancias')
+    with pytest.MonkeyPatch.context() as ajuste:
+        ajuste.setattr(tabela_distancias, 'DIRETORIO', str(diretorio))
+        ajuste.setattr(tabela_distancias, '_carregadas', {})
+        for vazio in (0, 8):
+            with open(tabela_distancias.nome_arquivo(vazio), 'wb') as arquivo:
+                arquivo.write(tabela_distancias.CABECALHO.pack(tabela_distancias.ASSINATURA, 3, vazio))
+                arquivo.write(tabela_distancias.construir_tabela(vazio))
+        yield tabela_distancias
+
+
+@pytest.fixture(scope='session')
+def bancos_padroes(tmp_path_factory):
+    """
+    Bancos de padrões 3x3 e 4x4 (com GRUPOS_TESTE) em um diretório temporário.
+    """
+    diretorio = tmp_path_factory.mktemp('padroes')
+    with pytest.MonkeyPatch.context() as ajuste:
+        ajuste.setattr(padroes, 'DIRETORIO', str(diretorio))
+        ajuste.setattr(padroes, '_carregadas', {})
+        ajuste.setattr(padroes, 'GRUPOS_PADRAO', GRUPOS_TESTE)
+        for lado, grupos in GRUPOS_TESTE.items():
+            tabuleiro = obter_tabuleiro(lado)
+            for grupo in grupos:
+                padroes.salvar_tabela(padroes.nome_arquivo(lado, grupo), lado, grupo,
+                                      padroes.construir_tabela(grupo, tabuleiro))
+        yield padroes
+
+
+@pytest.fixture(scope='session')
+def instancias():
+    """
+    Instâncias 3x3 solúveis: o próprio objetivo e embaralhamentos curtos e longos.
+    """
+    return ([(OBJETIVO, OBJETIVO)] + gerar_instancias(3, 15, 20, semente=1)
+            + gerar_instancias(3, 15, 60, semente=2))
+
+
+@pytest.fixture(scope='session')
+def custo_otimo(distancias):
+    """
+    Função (inicial, objetivo) -> número mínimo de movimentos, pela tabela.
+    """
+    def custo(inicial, objetivo):
+        caminho, _, _ = distancias.resolver_por_tabela(inicial, objetivo)
+        return len(caminho)
+    return custo
+
+
+def conferir_caminho(caminho, inicial, objetivo, custo):
+    """
+    Confere que o caminho tem `custo` passos, que cada passo troca o vazio
+    com uma peça vizinha e que o último estado é o objetivo.
+    """
+    estados = [inicial] + [[list(linha) for linha in estado] for _, estado in caminho]
+    assert len(estados) - 1 == custo
+    assert estados[-1] == objetivo
+    lado = len(inicial)
+    for anterior, seguinte in zip(estados, estados[1:]):
+        diferentes = [(i, j) for i in range(lado) for j in range(lado)
+                      if anterior[i][j] != seguinte[i][j]]
+        assert len(diferentes) == 2
+        (i1, j1), (i2, j2) = diferentes
+        assert abs(i1 - i2) + abs(j1 - j2) == 1
+        assert 0 in (anterior[i1][j1], anterior[i2][j2])
+
+
+@pytest.fixture(scope='session')
+def conferir_otimo(instancias, custo_otimo):
+    """
+    Função que resolve as instâncias com `resolver(inicial, objetivo)` e
+    confere que cada caminho é válido e ótimo.
+    """
+    def conferir(resolver, lista=None):
+        for inicial, objetivo in instancias if lista is None else lista:
+            caminho, _, _ = resolver(inicial, objetivo)
+            conferir_caminho(caminho, inicial, objetivo, custo_otimo(inicial, objetivo))
+    return conferir
+
+
+@pytest.fixture(scope='session')
+def conferir_mesmo_custo():
+    """
+    Função que resolve as instâncias com dois resolvedores e confere que os
+    caminhos são válidos e do mesmo tamanho (para tabuleiros sem tabela de
+    distâncias).
+    """
+    def conferir(resolver, referencia, lista):
+        for inicial, objetivo in lista:
+            caminho, _, _ = resolver(inicial, objetivo)
+            esperado, _, _ = referencia(inicial, objetivo)
+            conferir_caminho(caminho, inicial, objetivo, len(esperado))
+    return conferir
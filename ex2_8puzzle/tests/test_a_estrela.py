@@ -0,0 +1,46 @@
+'''
+Testes do A*: otimalidade com cada desempate e fila, no 3x3 (pela tabela
+de distâncias) e no 4x4 (pelo IDA*).
+'''
+
+import pytest
+
+from benchmark import gerar_instancias
+from main import busca_a_estrela, busca_ida_estrela
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+@pytest.mark.parametrize('fila', ['baldes', 'heap'])
+@pytest.mark.parametrize('desempate', ['maior_g', 'menor_h', 'fifo'])
+def test_custo_otimo(desempate, fila, conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_a_estrela(inicial, objetivo,
+                                                             desempate=desempate, fila=fila))
+
+
+@pytest.mark.parametrize('fila', ['baldes', 'heap'])
+def test_insoluvel(fila):
+    caminho, nos_expandidos, _ = busca_a_estrela(INSOLUVEL, OBJETIVO, fila=fila)
+    assert caminho is None
+    assert nos_expandidos == 181440  # Todo o componente de paridade do estado inicial
+
+
+def test_maior_g_expande_menos_no_ultimo_f(instancias):
+    # No último f, o desempate pelo maior g vai direto ao objetivo
+    total = {desempate: sum(busca_a_estrela(inicial, objetivo, desempate=desempate)[1]
+                            for inicial, objetivo in instancias)
+             for desempate in ('maior_g', 'fifo')}
+    assert total['maior_g'] < total['fifo']
+
+
+def test_4x4_igual_ao_ida_estrela(conferir_mesmo_custo):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        lambda inicial, objetivo: busca_ida_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 6, 40, semente=13))
+
+
+def test_desempate_desconhecido():
+    with pytest.raises(ValueError):
+        busca_a_estrela(OBJETIVO, OBJETIVO, desempate='aleatorio')
@@ -0,0 +1,44 @@
+'''
+Testes da busca bidirecional MM (bidirecional.py): custo ótimo com o
+objetivo padrão e com objetivos quaisquer, que não têm banco de padrões.
+'''
+
+import pytest
+
+from benchmark import gerar_instancias
+from bidirecional import busca_bidirecional
+from conftest import OBJETIVO
+from main import busca_a_estrela
+
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+OBJETIVO_VAZIO_NO_INICIO = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', 'conflito_linear'])
+def test_custo_otimo(heuristica, conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_bidirecional(inicial, objetivo, heuristica))
+
+
+def test_objetivo_com_vazio_no_inicio(instancias, conferir_otimo):
+    conferir_otimo(busca_bidirecional,
+                   [(OBJETIVO, OBJETIVO_VAZIO_NO_INICIO)]
+                   + [(inicial, OBJETIVO_VAZIO_NO_INICIO) for inicial, _ in instancias[-10:]])
+
+
+def test_objetivos_quaisquer(conferir_mesmo_custo):
+    # Os papéis trocados: o objetivo é um estado embaralhado
+    instancias = [(objetivo, inicial) for inicial, objetivo in gerar_instancias(3, 10, 40, semente=7)]
+    conferir_mesmo_custo(busca_bidirecional, busca_a_estrela, instancias)
+
+
+def test_insoluvel():
+    caminho, nos_expandidos, _ = busca_bidirecional(INSOLUVEL, OBJETIVO)
+    assert caminho is None
+    assert nos_expandidos == 0
+
+
+def test_4x4_mesmo_custo_a_estrela(conferir_mesmo_custo):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_bidirecional(inicial, objetivo, 'conflito_linear'),
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 4, 40, semente=3))
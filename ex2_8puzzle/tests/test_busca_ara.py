@@ -0,0 +1,54 @@
+'''
+Testes do A* ponderado e do A* anytime (ARA*): limites de subotimalidade
+conferidos com a distância ótima da tabela de distâncias.
+'''
+
+import pytest
+
+from main import busca_a_estrela, busca_ara
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+def test_inicial_igual_ao_objetivo():
+    caminho, nos_expandidos, _, limite = busca_ara(OBJETIVO, OBJETIVO)
+    assert list(caminho) == []
+    assert limite == 1.0
+
+
+@pytest.mark.parametrize('peso', [1.5, 2, 3])
+def test_a_estrela_ponderado_respeita_o_peso(peso, instancias, custo_otimo):
+    for inicial, objetivo in instancias:
+        caminho, _, _ = busca_a_estrela(inicial, objetivo, peso=peso)
+        otimo = custo_otimo(inicial, objetivo)
+        assert otimo <= len(caminho) <= peso * otimo
+
+
+def test_ara_respeita_o_limite(instancias, custo_otimo):
+    for inicial, objetivo in instancias:
+        caminho, _, _, limite = busca_ara(inicial, objetivo, prazo=0.0)
+        otimo = custo_otimo(inicial, objetivo)
+        assert 1.0 <= limite <= 3.0
+        assert otimo <= len(caminho) <= limite * otimo
+
+
+def test_ara_com_prazo_chega_ao_otimo(conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_ara(inicial, objetivo, prazo=60.0)[:3])
+
+
+def test_ara_melhora_a_cada_rodada(instancias, custo_otimo):
+    for inicial, objetivo in instancias:
+        melhorias = []
+        busca_ara(inicial, objetivo, prazo=60.0,
+                  ao_melhorar=lambda caminho, limite, _: melhorias.append((len(caminho), limite)))
+        custos = [custo for custo, _ in melhorias]
+        limites = [limite for _, limite in melhorias]
+        assert custos == sorted(custos, reverse=True)
+        assert limites == sorted(limites, reverse=True)
+        assert melhorias[-1] == (custo_otimo(inicial, objetivo), 1.0)
+
+
+def test_ara_insoluvel():
+    caminho, _, _, _ = busca_ara(INSOLUVEL, OBJETIVO, prazo=60.0)
+    assert caminho is None
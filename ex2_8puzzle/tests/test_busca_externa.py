@@ -0,0 +1,53 @@
+'''
+Testes da busca A* externa (busca_externa.py): soluções ótimas com e sem
+heurística, e o orçamento de memória respeitado com despejo em disco.
+'''
+
+import pytest
+
+from benchmark import gerar_instancias
+from busca_externa import busca_externa
+from conftest import OBJETIVO, conferir_caminho
+from main import busca_a_estrela
+
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', None])
+def test_custo_otimo(heuristica, conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_externa(inicial, objetivo, heuristica))
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', None])
+def test_insoluvel(heuristica):
+    caminho, _, _ = busca_externa(INSOLUVEL, OBJETIVO, heuristica)
+    assert caminho is None
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', None])
+def test_orcamento_pequeno_despeja_em_disco(heuristica, instancias, custo_otimo):
+    # 0,0005 MB: 65 estados, bem menos que um balde de f ou uma camada da
+    # busca em largura nas instâncias longas
+    for inicial, objetivo in instancias[-2:]:
+        relatorio = {}
+        caminho, _, _ = busca_externa(inicial, objetivo, heuristica, memoria_mb=0.0005,
+                                      relatorio=relatorio)
+        conferir_caminho(caminho, inicial, objetivo, custo_otimo(inicial, objetivo))
+        assert relatorio['arquivos'] > 0
+        assert relatorio['bytes_escritos'] > 0
+        assert relatorio['pico_estados_memoria'] <= relatorio['limite_estados'] + 4
+
+
+def test_sem_despejo_quando_cabe(instancias):
+    inicial, objetivo = instancias[-1]
+    relatorio = {}
+    busca_externa(inicial, objetivo, memoria_mb=64, relatorio=relatorio)
+    assert relatorio['arquivos'] == 0
+    assert relatorio['pico_estados_memoria'] <= relatorio['limite_estados']
+
+
+def test_4x4_mesmo_custo_a_estrela(conferir_mesmo_custo):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_externa(inicial, objetivo, memoria_mb=0.01),
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 3, 30, semente=5))
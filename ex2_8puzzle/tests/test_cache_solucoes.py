@@ -0,0 +1,73 @@
+'''
+Testes do cache de soluções com objetivos renomeados.
+'''
+
+import pytest
+
+from benchmark import gerar_instancias
+from cache_solucoes import CacheSolucoes
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+# Outro objetivo com o vazio no canto inicial: usa a tabela do vazio 0
+OBJETIVO_VAZIO_0 = [[0, 8, 7], [6, 5, 4], [3, 2, 1]]
+
+
+def test_custo_otimo(conferir_otimo):
+    conferir_otimo(CacheSolucoes().resolver)
+
+
+def test_insoluvel():
+    cache = CacheSolucoes()
+    caminho, _, _ = cache.resolver(INSOLUVEL, OBJETIVO)
+    assert caminho is None
+    assert len(cache) == 0
+
+
+def test_consultas_equivalentes_acertam(instancias):
+    cache = CacheSolucoes()
+    for inicial, objetivo in instancias[1:]:
+        cache.resolver(inicial, objetivo)
+    assert cache.acertos == 0
+    # Renomear as peças dos dois estados da mesma forma não muda a consulta
+    nome = [0, 8, 7, 6, 5, 4, 3, 2, 1]
+    for inicial, objetivo in instancias[1:]:
+        renomear = lambda matriz: [[nome[peca] for peca in linha] for linha in matriz]
+        caminho, nos_expandidos, _ = cache.resolver(renomear(inicial), renomear(objetivo))
+        assert nos_expandidos == 0
+        assert [list(linha) for linha in list(caminho)[-1][1]] == renomear(objetivo)
+    assert cache.acertos == len(instancias) - 1
+
+
+def test_chave_calculada_uma_vez_por_consulta(monkeypatch, instancias):
+    chamadas = []
+    chave = CacheSolucoes.chave
+    monkeypatch.setattr(CacheSolucoes, 'chave',
+                        staticmethod(lambda *args: chamadas.append(args) or chave(*args)))
+    cache = CacheSolucoes()
+    inicial, objetivo = instancias[5]
+    cache.resolver(inicial, objetivo)  # Falha
+    cache.resolver(inicial, objetivo)  # Acerto
+    assert len(chamadas) == 2
+
+
+def test_lru_descarta_a_mais_antiga(instancias):
+    cache = CacheSolucoes(capacidade=2)
+    (a, objetivo), (b, _), (c, _) = instancias[1:4]
+    for inicial in (a, b, a, c):
+        cache.resolver(inicial, objetivo)
+    assert (a, objetivo) in cache and (c, objetivo) in cache
+    assert (b, objetivo) not in cache
+    assert cache.descartadas == 1
+
+
+def test_padroes_com_vazio_fora_do_canto(bancos_padroes, conferir_otimo):
+    cache = CacheSolucoes(heuristica='padroes')
+    instancias = [(inicial, OBJETIVO_VAZIO_0) for inicial, _ in gerar_instancias(3, 10, 40, semente=14)]
+    conferir_otimo(cache.resolver, instancias)
+    conferir_otimo(cache.resolver, gerar_instancias(3, 10, 40, semente=15))
+
+
+def test_capacidade_invalida():
+    with pytest.raises(ValueError):
+        CacheSolucoes(capacidade=0)
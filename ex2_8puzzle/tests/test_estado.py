@@ -0,0 +1,75 @@
+'''
+Testes dos estados empacotados em inteiros (estado.py).
+'''
+
+import random
+
+from estado import desempacotar, empacotar, obter_tabuleiro
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def test_empacotar_e_desempacotar():
+    gerador = random.Random(0)
+    for _ in range(200):
+        pecas = list(range(9))
+        gerador.shuffle(pecas)
+        estado = [pecas[0:3], pecas[3:6], pecas[6:9]]
+        codigo = empacotar(estado)
+        assert desempacotar(codigo) == estado
+        assert obter_tabuleiro(3).posicao_vazio(codigo) == pecas.index(0)
+
+
+def test_mover_troca_o_vazio_com_a_peca():
+    tabuleiro = obter_tabuleiro(3)
+    codigo = tabuleiro.empacotar(OBJETIVO)
+    codigo, peca = tabuleiro.mover(codigo, 8, 5)
+    assert peca == 6
+    assert tabuleiro.desempacotar(codigo) == [[1, 2, 3], [4, 5, 0], [7, 8, 6]]
+    codigo, peca = tabuleiro.mover(codigo, 5, 8)
+    assert (codigo, peca) == (tabuleiro.empacotar(OBJETIVO), 6)
+
+
+def test_paridade_igual_a_alcancabilidade(distancias):
+    # A tabela de distâncias diz quais estados alcançam o objetivo padrão
+    tabuleiro = obter_tabuleiro(3)
+    objetivo = tabuleiro.objetivo_padrao
+    tabela = distancias.carregar_tabela(8)
+    gerador = random.Random(1)
+    for _ in range(500):
+        pecas = list(range(9))
+        gerador.shuffle(pecas)
+        codigo = tabuleiro.empacotar([pecas[0:3], pecas[3:6], pecas[6:9]])
+        alcancavel = tabela.distancia(codigo) != distancias.NAO_ALCANCAVEL
+        assert tabuleiro.eh_soluvel(codigo, objetivo) == alcancavel
+
+
+def test_tabuleiros_maiores():
+    gerador = random.Random(2)
+    for lado in (4, 5):
+        tabuleiro = obter_tabuleiro(lado)
+        for _ in range(50):
+            pecas = list(range(lado * lado))
+            gerador.shuffle(pecas)
+            estado = [pecas[i:i + lado] for i in range(0, lado * lado, lado)]
+            codigo = empacotar(estado)
+            assert tabuleiro.desempacotar(codigo) == estado
+            assert tabuleiro.posicao_vazio(codigo) == pecas.index(0)
+
+
+def test_paridade_nos_tabuleiros_maiores():
+    # Passeios aleatórios são sempre solúveis; trocar duas peças nunca é
+    gerador = random.Random(3)
+    for lado in (4, 5):
+        tabuleiro = obter_tabuleiro(lado)
+        objetivo = tabuleiro.objetivo_padrao
+        codigo, vazio = objetivo, tabuleiro.posicao_vazio(objetivo)
+        for _ in range(300):
+            _, destino = gerador.choice(tabuleiro.vizinhos[vazio])
+            codigo, _ = tabuleiro.mover(codigo, vazio, destino)
+            vazio = destino
+            assert tabuleiro.eh_soluvel(codigo, objetivo)
+            estado = tabuleiro.desempacotar(codigo)
+            a, b = [(i, j) for i in range(lado) for j in range(lado) if estado[i][j]][:2]
+            estado[a[0]][a[1]], estado[b[0]][b[1]] = estado[b[0]][b[1]], estado[a[0]][a[1]]
+            assert not tabuleiro.eh_soluvel(tabuleiro.empacotar(estado), objetivo)
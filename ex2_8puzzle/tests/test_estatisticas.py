@@ -0,0 +1,31 @@
+'''
+Testes das métricas de EstatisticasBusca preenchidas pelo A*.
+'''
+
+from benchmark import gerar_instancias
+from estatisticas import EstatisticasBusca
+from main import busca_a_estrela
+
+
+def test_camadas_usam_a_prioridade_da_fila():
+    inicial, objetivo = gerar_instancias(3, 1, 60, semente=5)[0]
+    for peso in (1, 2, 1.5):
+        vistas = []
+        estatisticas = EstatisticasBusca(ao_expandir=vistas.append)
+        _, nos_expandidos, _ = busca_a_estrela(inicial, objetivo, estatisticas=estatisticas,
+                                               peso=peso)
+        prioridades = [no.custo + peso * no.heuristica for no in vistas]
+        assert set(estatisticas.camadas_f) == set(prioridades)
+        if peso == 1:
+            # Com heurística consistente, f nunca diminui ao longo da busca
+            assert prioridades == sorted(prioridades)
+        assert sum(c['expandidos'] for c in estatisticas.camadas_f.values()) == nos_expandidos
+
+
+def test_nos_armazenados_e_o_tamanho_do_pool():
+    inicial, objetivo = gerar_instancias(3, 1, 60, semente=6)[0]
+    estatisticas = EstatisticasBusca()
+    busca_a_estrela(inicial, objetivo, estatisticas=estatisticas)
+    dados = estatisticas.para_dicionario()
+    assert 'pico_fechada' not in dados
+    assert dados['nos_armazenados'] >= dados['estados_armazenados'] > dados['nos_expandidos']
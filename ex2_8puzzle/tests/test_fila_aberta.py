@@ -0,0 +1,28 @@
+'''
+Testes das filas da lista aberta: a FilaBaldes deve remover na mesma ordem
+da FilaHeap (menor f, menor chave, mais antigo primeiro).
+'''
+
+import random
+
+from fila_aberta import FilaBaldes, FilaHeap
+
+
+def test_baldes_removem_na_ordem_do_heap():
+    gerador = random.Random(0)
+    heap, baldes = FilaHeap(), FilaBaldes()
+    removidos_heap, removidos_baldes = [], []
+    for i in range(5000):
+        # f às vezes abaixo do mínimo atual, como com heurística inconsistente
+        f, chave = gerador.randrange(40), gerador.randrange(30)
+        heap.inserir(f, chave, i)
+        baldes.inserir(f, chave, i)
+        if gerador.random() < 0.4:
+            assert heap.menor_f() == baldes.menor_f()
+            removidos_heap.append(heap.remover())
+            removidos_baldes.append(baldes.remover())
+    while len(heap):
+        removidos_heap.append(heap.remover())
+        removidos_baldes.append(baldes.remover())
+    assert removidos_baldes == removidos_heap
+    assert len(baldes) == 0
@@ -0,0 +1,55 @@
+'''
+Testes do A* paralelo distribuído por hash (HDA*).
+'''
+
+import multiprocessing
+import os
+
+import pytest
+
+import hda
+from benchmark import gerar_instancias
+from hda import ErroTrabalhador, busca_hda, medir_escalabilidade
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+@pytest.mark.parametrize('processos', [1, 3])
+def test_custo_otimo(processos, conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_hda(inicial, objetivo, processos=processos))
+
+
+def test_insoluvel():
+    caminho, _, _ = busca_hda(INSOLUVEL, OBJETIVO, processos=2)
+    assert caminho is None
+
+
+def test_4x4_igual_ao_a_estrela(conferir_mesmo_custo):
+    from main import busca_a_estrela
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_hda(inicial, objetivo, 'conflito_linear', processos=2),
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 4, 40, semente=16))
+
+
+def test_processo_morto_interrompe_a_busca(monkeypatch):
+    obter_heuristica = hda.obter_heuristica
+
+    def morrer_no_filho(*args):
+        # Os processos são criados por fork e herdam a troca; o coordenador não
+        if multiprocessing.parent_process() is not None:
+            os._exit(3)
+        return obter_heuristica(*args)
+
+    monkeypatch.setattr(hda, 'obter_heuristica', morrer_no_filho)
+    inicial, objetivo = gerar_instancias(3, 1, 60, semente=17)[0]
+    with pytest.raises(ErroTrabalhador, match='código 3'):
+        busca_hda(inicial, objetivo, processos=2)
+
+
+def test_medir_escalabilidade():
+    medidas = medir_escalabilidade(gerar_instancias(3, 3, 40, semente=18), processos=[1, 2])
+    assert [medida['processos'] for medida in medidas] == [0, 1, 2]
+    assert all(medida['mesmo_custo'] for medida in medidas)
+    assert medidas[2]['eficiencia'] == pytest.approx(medidas[2]['aceleracao'] / 2)
@@ -0,0 +1,57 @@
+'''
+Testes das heurísticas Manhattan e conflito linear em tabuleiros N×N.
+'''
+
+import random
+
+import pytest
+
+from benchmark import gerar_instancias
+from estado import obter_tabuleiro
+from heuristicas import obter_heuristica
+from main import busca_a_estrela
+
+
+def test_conflito_linear_admissivel_no_3x3(distancias):
+    tabuleiro = obter_tabuleiro(3)
+    manhattan = obter_heuristica('manhattan', tabuleiro=tabuleiro)
+    conflito = obter_heuristica('conflito_linear', tabuleiro=tabuleiro)
+    tabela = distancias.carregar_tabela(8)
+    for inicial, _ in gerar_instancias(3, 300, 80, semente=10):
+        codigo = tabuleiro.empacotar(inicial)
+        assert manhattan.calcular(codigo) <= conflito.calcular(codigo) <= tabela.distancia(codigo)
+
+
+@pytest.mark.parametrize('nome', ['manhattan', 'conflito_linear'])
+@pytest.mark.parametrize('lado', [3, 4, 5])
+def test_atualizar_igual_a_calcular(nome, lado):
+    tabuleiro = obter_tabuleiro(lado)
+    gerador = random.Random(lado)
+    # Um objetivo embaralhado também exercita as posições fora da ordem padrão
+    objetivo, vazio = tabuleiro.objetivo_padrao, tabuleiro.casas - 1
+    for _ in range(100):
+        _, destino = gerador.choice(tabuleiro.vizinhos[vazio])
+        objetivo, _ = tabuleiro.mover(objetivo, vazio, destino)
+        vazio = destino
+    heuristica = obter_heuristica(nome, objetivo, tabuleiro)
+    codigo = objetivo
+    h = heuristica.calcular(codigo)
+    assert h == 0
+    for _ in range(500):
+        _, destino = gerador.choice(tabuleiro.vizinhos[vazio])
+        codigo, peca = tabuleiro.mover(codigo, vazio, destino)
+        h = heuristica.atualizar(h, codigo, peca, destino, vazio)
+        vazio = destino
+        assert h == heuristica.calcular(codigo)
+
+
+def test_a_estrela_conflito_linear_otimo_no_3x3(conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'))
+
+
+@pytest.mark.parametrize('lado, passos', [(4, 40), (5, 24)])
+def test_conflito_linear_igual_a_manhattan_nos_maiores(lado, passos, conferir_mesmo_custo):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        busca_a_estrela,
+        gerar_instancias(lado, 5, passos, semente=11))
@@ -0,0 +1,30 @@
+'''
+Testes do IDA*: otimalidade no 3x3 (pela tabela de distâncias) e no 4x4
+(pelo A* com conflito linear).
+'''
+
+import pytest
+
+from benchmark import gerar_instancias
+from main import busca_a_estrela, busca_ida_estrela
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', 'conflito_linear', 'padroes'])
+def test_custo_otimo(heuristica, conferir_otimo, bancos_padroes):
+    conferir_otimo(lambda inicial, objetivo: busca_ida_estrela(inicial, objetivo, heuristica))
+
+
+def test_insoluvel():
+    caminho, _, _ = busca_ida_estrela(INSOLUVEL, OBJETIVO)
+    assert caminho is None
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', 'padroes'])
+def test_4x4_igual_ao_a_estrela(heuristica, conferir_mesmo_custo, bancos_padroes):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_ida_estrela(inicial, objetivo, heuristica),
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 6, 40, semente=7))
@@ -0,0 +1,76 @@
+'''
+Testes do resolvedor em lote: leitura e validação das instâncias e
+resultados ótimos com cada algoritmo.
+'''
+
+import io
+import json
+
+import pytest
+
+from lote import ler_instancias, resolver_lote, validar
+
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+OBJETIVO_4X4 = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]]
+
+
+def test_tabela_rejeita_tabuleiro_que_nao_e_3x3():
+    with pytest.raises(ValueError, match='3x3'):
+        validar(OBJETIVO_4X4, OBJETIVO_4X4, 'tabela')
+    validar(OBJETIVO_4X4, OBJETIVO_4X4, 'ida_estrela')
+    validar([[1, 2, 3], [4, 5, 6], [7, 8, 0]], [[1, 2, 3], [4, 5, 6], [7, 8, 0]], 'tabela')
+
+
+def test_ler_instancias_marca_erro_de_tamanho_para_a_tabela():
+    arquivo = io.StringIO(json.dumps({'id': 'a', 'estado': OBJETIVO_4X4}) + '\n')
+    [(identificador, estado, _, erro)] = ler_instancias(arquivo, 'tabela')
+    assert estado is None and '3x3' in erro
+
+
+def _resolver(tmp_path, linhas, algoritmo, **opcoes):
+    entrada = tmp_path / 'instancias.jsonl'
+    entrada.write_text(''.join(linha + '\n' for linha in linhas))
+    saida = tmp_path / 'resultados.jsonl'
+    with open(entrada) as arquivo, open(saida, 'w') as destino:
+        totais = resolver_lote(arquivo, destino, algoritmo, **opcoes)
+    with open(saida) as arquivo:
+        return totais, {r['id']: r for r in map(json.loads, arquivo)}
+
+
+@pytest.mark.parametrize('algoritmo', ['a_estrela', 'ida_estrela', 'bidirecional', 'tabela'])
+def test_resultados_otimos(tmp_path, algoritmo, instancias, custo_otimo, distancias):
+    linhas = [json.dumps({'id': i, 'estado': inicial, 'objetivo': objetivo})
+              for i, (inicial, objetivo) in enumerate(instancias)]
+    linhas.append(json.dumps({'id': 'insoluvel', 'estado': INSOLUVEL}))
+    totais, resultados = _resolver(tmp_path, linhas, algoritmo, processos=2)
+    assert resultados.pop('insoluvel')['status'] == 'insoluvel'
+    assert totais['resolvido'] == len(resultados) == len(instancias)
+    for i, (inicial, objetivo) in enumerate(instancias):
+        assert resultados[i]['movimentos'] == custo_otimo(inicial, objetivo)
+        assert len(resultados[i]['acoes']) == resultados[i]['movimentos']
+
+
+def test_linhas_invalidas_viram_erro(tmp_path, distancias):
+    linhas = ['{"id": "a", "estado": [[1, 2, 3], [4, 5, 6], [7, 0, 8]]}',
+              'não é JSON',
+              '{"id": "b"}',
+              '',
+              json.dumps({'id': 'c', 'estado': OBJETIVO_4X4})]
+    totais, resultados = _resolver(tmp_path, linhas, 'tabela', processos=2)
+    assert resultados.pop('a')['movimentos'] == 1
+    assert totais['erro'] == len(resultados) == 3
+    assert all(r['status'] == 'erro' and r['mensagem'] for r in resultados.values())
+
+
+def test_cache_responde_repetidas(tmp_path, instancias):
+    # Uma instância pendente por vez: a segunda rodada acha no cache as
+    # soluções da primeira, menos talvez a última, que pode estar em
+    # andamento quando a repetição é lida
+    linhas = [json.dumps({'id': f'{rodada}-{i}', 'estado': inicial, 'objetivo': objetivo})
+              for rodada in range(2) for i, (inicial, objetivo) in enumerate(instancias)]
+    _, resultados = _resolver(tmp_path, linhas, 'a_estrela', processos=1, max_pendentes=1,
+                              tamanho_cache=100)
+    for i in range(len(instancias) - 1):
+        primeira, segunda = resultados[f'0-{i}'], resultados[f'1-{i}']
+        assert segunda.get('cache') and not primeira.get('cache')
+        assert segunda['movimentos'] == primeira['movimentos']
@@ -0,0 +1,66 @@
+'''
+Testes dos bancos de padrões aditivos: admissibilidade no 3x3 (pela tabela
+de distâncias), atualização incremental e otimalidade do A* no 3x3 e no 4x4.
+'''
+
+import random
+
+import pytest
+
+from benchmark import gerar_instancias
+from estado import obter_tabuleiro
+from heuristicas import obter_heuristica
+from main import busca_a_estrela
+
+
+@pytest.fixture(autouse=True)
+def tabelas(bancos_padroes):
+    """
+    Os bancos de padrões são gerados em um diretório temporário.
+    """
+
+
+def test_admissivel_no_3x3(distancias):
+    tabuleiro = obter_tabuleiro(3)
+    padroes = obter_heuristica('padroes', tabuleiro=tabuleiro)
+    manhattan = obter_heuristica('manhattan', tabuleiro=tabuleiro)
+    tabela = distancias.carregar_tabela(8)
+    for inicial, _ in gerar_instancias(3, 300, 80, semente=8):
+        codigo = tabuleiro.empacotar(inicial)
+        # Os grupos do 3x3 somam só movimentos de peças, como Manhattan, mas
+        # contam as interações dentro de cada grupo
+        assert manhattan.calcular(codigo) <= padroes.calcular(codigo) <= tabela.distancia(codigo)
+
+
+@pytest.mark.parametrize('lado', [3, 4])
+def test_atualizar_igual_a_calcular(lado):
+    tabuleiro = obter_tabuleiro(lado)
+    padroes = obter_heuristica('padroes', tabuleiro=tabuleiro)
+    gerador = random.Random(lado)
+    codigo = tabuleiro.objetivo_padrao
+    vazio = tabuleiro.posicao_vazio(codigo)
+    h = padroes.calcular(codigo)
+    assert h == 0
+    for _ in range(500):
+        _, destino = gerador.choice(tabuleiro.vizinhos[vazio])
+        codigo, peca = tabuleiro.mover(codigo, vazio, destino)
+        h = padroes.atualizar(h, codigo, peca, destino, vazio)
+        vazio = destino
+        assert h == padroes.calcular(codigo)
+
+
+def test_a_estrela_otimo_no_3x3(conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'padroes'))
+
+
+def test_a_estrela_4x4_igual_ao_conflito_linear(conferir_mesmo_custo):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'padroes'),
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 6, 40, semente=9))
+
+
+def test_objetivo_fora_do_padrao_e_rejeitado():
+    tabuleiro = obter_tabuleiro(3)
+    with pytest.raises(ValueError):
+        obter_heuristica('padroes', tabuleiro.objetivo_canonico(0), tabuleiro)
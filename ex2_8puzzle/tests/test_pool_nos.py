@@ -0,0 +1,64 @@
+'''
+Testes do pool compacto de nós e do caminho reconstruído sob demanda.
+'''
+
+import random
+
+import pytest
+
+from estado import MOVIMENTOS, obter_tabuleiro
+from pool_nos import CaminhoPreguicoso, PoolNos
+
+
+def _passeio(tabuleiro, passos, semente):
+    """
+    Passeio aleatório a partir do objetivo: (movimentos, estados empacotados).
+    """
+    gerador = random.Random(semente)
+    codigo = tabuleiro.objetivo_padrao
+    vazio = tabuleiro.posicao_vazio(codigo)
+    movimentos, codigos = [], []
+    for _ in range(passos):
+        d, destino = gerador.choice(tabuleiro.direcoes[vazio])
+        codigo, _ = tabuleiro.mover(codigo, vazio, destino)
+        vazio = destino
+        movimentos.append(d)
+        codigos.append(codigo)
+    return movimentos, codigos
+
+
+@pytest.mark.parametrize('lado', [3, 4, 5])
+def test_pool_guarda_os_campos_e_refaz_o_caminho(lado):
+    tabuleiro = obter_tabuleiro(lado)
+    movimentos, codigos = _passeio(tabuleiro, 150, lado)
+    pool = PoolNos(tabuleiro)
+    raiz = tabuleiro.objetivo_padrao
+    indice = pool.adicionar(raiz, -1, 0, 0, tabuleiro.posicao_vazio(raiz), 7)
+    for passo, (d, codigo) in enumerate(zip(movimentos, codigos), start=1):
+        indice = pool.adicionar(codigo, indice, d, passo, tabuleiro.posicao_vazio(codigo), passo % 5)
+    assert len(pool) == len(codigos) + 1
+
+    no = pool.no(indice)
+    assert (no.codigo, no.custo, no.heuristica) == (codigos[-1], 150, 0)
+    assert no.acao == MOVIMENTOS[movimentos[-1]][0]
+    assert pool.no(0).acao is None
+
+    caminho = pool.caminho(indice)
+    assert caminho.movimentos == bytes(movimentos)
+    assert caminho.acoes == [MOVIMENTOS[d][0] for d in movimentos]
+
+
+def test_caminho_preguicoso_indexa_como_lista():
+    tabuleiro = obter_tabuleiro(4)
+    movimentos, codigos = _passeio(tabuleiro, 100, 0)
+    caminho = CaminhoPreguicoso(tabuleiro, tabuleiro.objetivo_padrao, movimentos, intervalo=8)
+    esperado = [(MOVIMENTOS[d][0], tabuleiro.desempacotar(codigo))
+                for d, codigo in zip(movimentos, codigos)]
+    # Acesso fora de ordem: os marcos são criados sob demanda
+    for i in (99, 3, 50, -1, -100):
+        assert caminho[i] == esperado[i]
+    assert caminho[10:20] == esperado[10:20]
+    assert list(caminho) == esperado
+    assert caminho == esperado
+    with pytest.raises(IndexError):
+        caminho[100]
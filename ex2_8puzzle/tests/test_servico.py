@@ -0,0 +1,95 @@
+'''
+Testes do serviço asyncio (requisições malformadas, prazos inválidos e temporizadores).
+'''
+
+import asyncio
+import json
+
+from servico import Servico
+
+
+async def _requisitar(porta, dados):
+    leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+    escritor.write(dados)
+    await escritor.drain()
+    resposta = await leitor.read()
+    escritor.close()
+    return resposta
+
+
+def _responder(*requisicoes):
+    async def rodar():
+        servico = Servico(processos=1)
+        servidor = await servico.iniciar(porta=0)
+        porta = servidor.sockets[0].getsockname()[1]
+        try:
+            return [await _requisitar(porta, dados) for dados in requisicoes]
+        finally:
+            await servico.parar()
+    return asyncio.run(rodar())
+
+
+def _corpo(resposta):
+    cabecalhos, _, corpo = resposta.partition(b'\r\n\r\n')
+    return cabecalhos.split(b'\r\n')[0], json.loads(corpo)
+
+
+def test_http_malformado_responde_400():
+    respostas = _responder(
+        b'POST /resolver\r\n\r\n',
+        b'POST /resolver HTTP/1.1\r\nContent-Length: abc\r\n\r\n',
+    )
+    for resposta in respostas:
+        status, corpo = _corpo(resposta)
+        assert status == b'HTTP/1.1 400 Bad Request'
+        assert corpo['status'] == 'erro'
+
+
+def test_pedido_resolvido_cancela_o_temporizador():
+    async def rodar():
+        servico = Servico(processos=1)
+        await servico.iniciar(porta=0)
+        try:
+            pedido = servico.criar_pedido({'id': 1, 'estado': [[1, 2, 3], [4, 5, 6], [7, 0, 8]]})
+            await servico.fila.put(pedido)
+            resultado = await pedido.futuro
+            return resultado, pedido.temporizador.cancelled()
+        finally:
+            await servico.parar()
+    resultado, cancelado = asyncio.run(rodar())
+    assert resultado['status'] == 'resolvido'
+    assert cancelado
+
+
+def test_prazo_invalido_responde_400():
+    respostas = _responder(*(
+        b'POST /resolver HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s' % (len(corpo), corpo)
+        for corpo in (b'{"estado": [[1, 2, 3], [4, 5, 6], [7, 0, 8]], "prazo": %s}' % prazo
+                      for prazo in (b'NaN', b'-1', b'0', b'Infinity', b'"abc"'))))
+    for resposta in respostas:
+        status, corpo = _corpo(resposta)
+        assert status == b'HTTP/1.1 400 Bad Request'
+        assert corpo['status'] == 'erro'
+
+
+def test_linhas_com_id_nao_hashavel_respondem_erro():
+    linhas = (b'{"cancelar": [1]}\n'
+              b'{"cancelar": {"id": 1}}\n'
+              b'{"id": [1], "estado": [[1, 2, 3], [4, 5, 6], [7, 0, 8]]}\n'
+              b'{"id": 2, "estado": [[1, 2, 3], [4, 5, 6], [7, 0, 8]]}\n')
+    async def rodar():
+        servico = Servico(processos=1)
+        servidor = await servico.iniciar(porta=0)
+        porta = servidor.sockets[0].getsockname()[1]
+        try:
+            leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+            escritor.write(linhas)
+            await escritor.drain()
+            respostas = [json.loads(await leitor.readline()) for _ in range(4)]
+            escritor.close()
+            return respostas
+        finally:
+            await servico.parar()
+    respostas = asyncio.run(rodar())
+    assert [resposta['status'] for resposta in respostas] == ['erro', 'erro', 'erro', 'resolvido']
+    assert respostas[3]['id'] == 2
@@ -0,0 +1,34 @@
+'''
+Testes da tabela completa de distâncias do 8-puzzle, comparada com o A*.
+'''
+
+import pytest
+
+from benchmark import gerar_instancias
+from main import busca_a_estrela
+
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+def test_igual_ao_a_estrela(distancias, instancias, conferir_mesmo_custo):
+    conferir_mesmo_custo(distancias.resolver_por_tabela, busca_a_estrela, instancias)
+
+
+def test_objetivo_renomeado(distancias, conferir_mesmo_custo):
+    # Objetivos com as peças em outra ordem e o vazio no canto inicial usam a
+    # tabela do vazio 0, renomeando as peças
+    objetivo = [[0, 8, 7], [6, 5, 4], [3, 2, 1]]
+    instancias = [(inicial, objetivo) for inicial, _ in gerar_instancias(3, 10, 40, semente=12)]
+    conferir_mesmo_custo(distancias.resolver_por_tabela, busca_a_estrela, instancias)
+
+
+def test_insoluvel(distancias):
+    caminho, nos_expandidos, _ = distancias.resolver_por_tabela(
+        INSOLUVEL, [[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    assert caminho is None and nos_expandidos == 0
+
+
+def test_tabela_ausente(distancias):
+    with pytest.raises(FileNotFoundError, match='tabela_distancias.py'):
+        distancias.resolver_por_tabela([[1, 2, 3], [4, 0, 5], [6, 7, 8]],
+                                       [[1, 2, 3], [4, 0, 5], [6, 7, 8]])
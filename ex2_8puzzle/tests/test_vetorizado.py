@@ -0,0 +1,52 @@
+'''
+Testes da busca vetorizada: a tabela hash em arrays e a otimalidade no 3x3
+(pela tabela de distâncias) e no 4x4 (pelo A* com conflito linear).
+'''
+
+import numpy as np
+import pytest
+
+from benchmark import gerar_instancias
+from main import busca_a_estrela
+from vetorizado import TabelaEstados, busca_vetorizada
+
+OBJETIVO = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+INSOLUVEL = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # Duas peças trocadas: paridade errada
+
+
+def test_tabela_estados_equivale_a_um_dicionario():
+    gerador = np.random.default_rng(0)
+    tabela = TabelaEstados(capacidade=4)  # Pequena: força colisões e crescimento
+    referencia = {}
+    for _ in range(50):
+        chaves = np.unique(gerador.integers(0, 3000, 200).astype(np.uint64))
+        g = gerador.integers(0, 100, len(chaves)).astype(np.int16)
+        tabela.gravar(chaves, g, chaves + np.uint64(1), np.zeros(len(chaves), dtype=np.uint8))
+        referencia.update(zip(chaves.tolist(), g.tolist()))
+    assert tabela.tamanho == len(referencia)
+    chaves = np.array(list(referencia), dtype=np.uint64)
+    posicoes = tabela.posicoes(chaves)
+    assert (tabela.chaves[posicoes] == chaves).all()
+    assert tabela.g[posicoes].tolist() == list(referencia.values())
+    ausentes = tabela.posicoes(np.arange(5000, 5100, dtype=np.uint64))
+    assert (tabela.chaves[ausentes] == TabelaEstados.VAZIA).all()
+
+
+@pytest.mark.parametrize('tamanho_lote', [1, 64, 4096])
+def test_custo_otimo(tamanho_lote, conferir_otimo):
+    conferir_otimo(lambda inicial, objetivo: busca_vetorizada(inicial, objetivo,
+                                                              tamanho_lote=tamanho_lote))
+
+
+def test_insoluvel():
+    caminho, nos_expandidos, _ = busca_vetorizada(INSOLUVEL, OBJETIVO)
+    assert caminho is None
+    assert nos_expandidos == 181440
+
+
+@pytest.mark.parametrize('heuristica', ['manhattan', 'padroes'])
+def test_4x4_igual_ao_a_estrela(heuristica, conferir_mesmo_custo, bancos_padroes):
+    conferir_mesmo_custo(
+        lambda inicial, objetivo: busca_vetorizada(inicial, objetivo, heuristica, tamanho_lote=256),
+        lambda inicial, objetivo: busca_a_estrela(inicial, objetivo, 'conflito_linear'),
+        gerar_instancias(4, 8, 30, semente=4))
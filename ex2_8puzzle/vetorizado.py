@@ -0,0 +1,357 @@
+'''
+Expansão vetorizada da fronteira com NumPy.
+
+Em vez de um objeto Puzzle por nó, a fronteira guarda lotes de estados em
+matrizes 2-D (uma linha por estado, uma coluna por casa). Sucessores,
+heurísticas, a eliminação de duplicatas e a consulta ao melhor g (uma
+tabela hash em arrays) de um lote inteiro são feitos de uma vez com
+operações vetorizadas.
+
+Compensa em fronteiras grandes: no 15-puzzle (python benchmark.py
+vetorizado --lado 4 --passos 80 --instancias 6) expande cerca de três vezes
+mais nós por segundo que o A*. No 8-puzzle as camadas de f são pequenas
+demais para amortizar o custo de cada chamada do NumPy, e o A* nó a nó é
+mais rápido.
+
+As chaves dos estados são os mesmos inteiros empacotados de estado.py
+(4 bits por casa), calculados em uint64; por isso o modo vetorizado vale
+para tabuleiros de até 4x4.
+'''
+
+import time
+
+import numpy as np
+
+from estado import MOVIMENTOS, obter_tabuleiro
+from heuristicas import Manhattan
+from pool_nos import CaminhoPreguicoso
+
+
+class TabelasVetorizadas:
+    """
+    Tabelas auxiliares de um tabuleiro em forma de arrays NumPy.
+    """
+
+    def __init__(self, tabuleiro):
+        if tabuleiro.bits * tabuleiro.casas > 64:
+            raise ValueError("O modo vetorizado suporta tabuleiros de até 4x4")
+        self.tabuleiro = tabuleiro
+        casas = tabuleiro.casas
+        self.deslocamentos = np.arange(casas, dtype=np.uint64) * np.uint64(tabuleiro.bits)
+        # destinos[d][vazio]: nova posição do vazio no movimento d (-1 se inválido)
+        self.destinos = np.full((len(MOVIMENTOS), casas), -1, dtype=np.int64)
+        nomes = [acao for acao, _, _ in MOVIMENTOS]
+        for vazio, vizinhos in enumerate(tabuleiro.vizinhos):
+            for acao, destino in vizinhos:
+                self.destinos[nomes.index(acao), vazio] = destino
+
+    def matriz(self, codigos):
+        """
+        Converte inteiros empacotados em uma matriz (uma linha por estado).
+        """
+        codigos = np.asarray(codigos, dtype=np.uint64).reshape(-1, 1)
+        mascara = np.uint64(self.tabuleiro.mascara)
+        return ((codigos >> self.deslocamentos) & mascara).astype(np.uint8)
+
+    def chaves(self, estados):
+        """
+        Empacota cada linha de `estados` no inteiro de estado.py.
+        """
+        return (estados.astype(np.uint64) << self.deslocamentos).sum(axis=1, dtype=np.uint64)
+
+
+class ManhattanVetorizada:
+    """
+    Distância de Manhattan de um lote, atualizada pela peça movida.
+    """
+
+    def __init__(self, objetivo, tabuleiro):
+        self.distancia = np.array(Manhattan(objetivo, tabuleiro).distancia, dtype=np.int16)
+        self.colunas = np.arange(tabuleiro.casas)
+
+    def calcular(self, estados):
+        return self.distancia[estados, self.colunas].sum(axis=1, dtype=np.int16)
+
+    def atualizar(self, h, estados, pecas, de, para):
+        return h - self.distancia[pecas, de] + self.distancia[pecas, para]
+
+
+class PadroesVetorizada:
+    """
+    Bancos de padrões aditivos avaliados para um lote inteiro. As tabelas
+    mapeadas em memória são vistas como arrays sem cópia.
+    """
+
+    def __init__(self, tabuleiro):
+        from padroes import carregar_padroes
+        self.casas = tabuleiro.casas
+        self.grupos = []
+        for tabela in carregar_padroes(tabuleiro.lado).tabelas:
+            valores = np.frombuffer(tabela.dados, dtype=np.uint8, offset=tabela.inicio)
+            self.grupos.append((np.array(tabela.grupo), valores))
+
+    def calcular(self, estados):
+        # Como cada linha é uma permutação, argsort dá a posição de cada peça
+        posicoes = np.argsort(estados, axis=1)
+        h = np.zeros(len(estados), dtype=np.int16)
+        for grupo, valores in self.grupos:
+            arranjo = posicoes[:, grupo]
+            indice = np.zeros(len(estados), dtype=np.int64)
+            for i in range(len(grupo)):
+                menores = (arranjo[:, :i] < arranjo[:, i:i + 1]).sum(axis=1)
+                indice = indice * (self.casas - i) + arranjo[:, i] - menores
+            h += valores[indice]
+        return h
+
+    def atualizar(self, h, estados, pecas, de, para):
+        return self.calcular(estados)
+
+
+def obter_heuristica_vetorizada(nome, objetivo, tabuleiro):
+    """
+    Cria a versão vetorizada de uma heurística ('manhattan' ou 'padroes').
+    """
+    if nome == 'manhattan':
+        return ManhattanVetorizada(objetivo, tabuleiro)
+    if nome == 'padroes':
+        if objetivo != tabuleiro.objetivo_padrao:
+            raise ValueError("Os bancos de padrões só existem para o objetivo ordenado")
+        return PadroesVetorizada(tabuleiro)
+    raise ValueError(f"Heurística sem versão vetorizada: {nome}")
+
+
+def expandir_lote(tabelas, avaliador, estados, vazios, h):
+    """
+    Gera os sucessores de todos os estados de um lote.
+
+    Args:
+        tabelas: TabelasVetorizadas do tabuleiro
+        avaliador: Heurística vetorizada
+        estados: Matriz (lote × casas) com os estados
+        vazios: Posição do vazio em cada estado
+        h: Heurística de cada estado
+
+    Returns:
+        Lista, por movimento, de tuplas (indices_pais, filhos, vazios, h)
+    """
+    resultado = []
+    for d in range(len(MOVIMENTOS)):
+        destinos = tabelas.destinos[d][vazios]
+        validos = np.nonzero(destinos >= 0)[0]
+        filhos = estados[validos]  # Indexação avançada já cria uma cópia
+        linhas = np.arange(len(validos))
+        de = destinos[validos]
+        para = vazios[validos]
+        pecas = filhos[linhas, de]
+        filhos[linhas, para] = pecas
+        filhos[linhas, de] = 0
+        h_filhos = avaliador.atualizar(h[validos], filhos, pecas, de, para)
+        resultado.append((validos, filhos, de, h_filhos))
+    return resultado
+
+
+class TabelaEstados:
+    """
+    Tabela hash de endereçamento aberto (sondagem linear) em arrays NumPy:
+    chave empacotada -> (melhor g, chave do pai, movimento). Consultas e
+    inserções são feitas para um lote de chaves de uma vez.
+    """
+
+    VAZIA = np.uint64(0xFFFFFFFFFFFFFFFF)  # Nenhuma permutação empacota em só uns
+    FIBONACCI = np.uint64(0x9E3779B97F4A7C15)
+
+    def __init__(self, capacidade=1 << 16):
+        self.bits = max(capacidade - 1, 1).bit_length()
+        capacidade = 1 << self.bits
+        self.chaves = np.full(capacidade, self.VAZIA, dtype=np.uint64)
+        self.g = np.zeros(capacidade, dtype=np.int16)
+        self.pais = np.zeros(capacidade, dtype=np.uint64)
+        self.movimentos = np.zeros(capacidade, dtype=np.uint8)
+        self.tamanho = 0
+
+    def posicoes(self, chaves):
+        """
+        Posição de cada chave na tabela: onde ela está ou, se ausente, a
+        primeira posição vazia da sua sequência de sondagem.
+        """
+        mascara = np.uint64(len(self.chaves) - 1)
+        posicoes = (chaves * self.FIBONACCI) >> np.uint64(64 - self.bits)
+        pendentes = np.arange(len(chaves))
+        while len(pendentes):
+            atuais = self.chaves[posicoes[pendentes]]
+            resolvidas = (atuais == chaves[pendentes]) | (atuais == self.VAZIA)
+            pendentes = pendentes[~resolvidas]
+            posicoes[pendentes] = (posicoes[pendentes] + np.uint64(1)) & mascara
+        return posicoes.astype(np.int64)
+
+    def gravar(self, chaves, g, pais, movimentos):
+        """
+        Grava um lote de chaves distintas, novas ou já presentes.
+        """
+        if 2 * (self.tamanho + len(chaves)) > len(self.chaves):
+            self._crescer(self.tamanho + len(chaves))
+        pendentes = np.arange(len(chaves))
+        while len(pendentes):
+            posicoes = self.posicoes(chaves[pendentes])
+            # Chaves novas podem disputar a mesma posição vazia: fica a
+            # primeira, e as outras sondam de novo
+            posicoes, primeiras = np.unique(posicoes, return_index=True)
+            escolhidas = pendentes[primeiras]
+            self.tamanho += int(np.count_nonzero(self.chaves[posicoes] == self.VAZIA))
+            self.chaves[posicoes] = chaves[escolhidas]
+            self.g[posicoes] = g[escolhidas]
+            self.pais[posicoes] = pais[escolhidas]
+            self.movimentos[posicoes] = movimentos[escolhidas]
+            restantes = np.ones(len(pendentes), dtype=bool)
+            restantes[primeiras] = False
+            pendentes = pendentes[restantes]
+
+    def _crescer(self, necessario):
+        ocupadas = self.chaves != self.VAZIA
+        antigas = (self.chaves[ocupadas], self.g[ocupadas], self.pais[ocupadas],
+                   self.movimentos[ocupadas])
+        self.__init__(4 * necessario)
+        self.gravar(*antigas)
+
+
+def busca_vetorizada(estado_inicial, estado_objetivo, heuristica='manhattan', tamanho_lote=4096):
+    """
+    A* que expande a fronteira em lotes vetorizados.
+
+    A fronteira é dividida em camadas por f e, dentro de cada f, por h. A
+    camada de menor f é retirada em lotes de até `tamanho_lote` estados,
+    começando pelos de menor h (como o desempate 'maior_g' do A*), e cada
+    lote é expandido de uma vez. O melhor g e o pai de cada estado ficam em
+    uma TabelaEstados, consultada e atualizada para o lote inteiro. Com
+    heurística admissível, o objetivo é ótimo quando é retirado ou quando é
+    gerado com f igual ao menor f da fronteira.
+
+    Args:
+        estado_inicial: Matriz N×N representando o estado inicial
+        estado_objetivo: Matriz N×N representando o estado objetivo (N <= 4)
+        heuristica: 'manhattan' ou 'padroes'
+        tamanho_lote: Máximo de estados expandidos por lote
+
+    Returns:
+        Tupla (caminho, nos_expandidos, tempo) com a solução encontrada,
+        ou (None, nos_expandidos, tempo) se não houver solução
+    """
+    inicio = time.time()
+    tabuleiro = obter_tabuleiro(len(estado_objetivo))
+    tabelas = TabelasVetorizadas(tabuleiro)
+    objetivo = tabuleiro.empacotar(estado_objetivo)
+    avaliador = obter_heuristica_vetorizada(heuristica, objetivo, tabuleiro)
+
+    codigo_inicial = tabuleiro.empacotar(estado_inicial)
+    estados = tabelas.matriz([codigo_inicial])
+    h = avaliador.calcular(estados)
+    chaves = np.array([codigo_inicial], dtype=np.uint64)
+    # camadas[f][h] = lista de blocos (estados, vazios, g, h, chaves)
+    camadas = {int(h[0]): {int(h[0]): [(estados, np.array([tabuleiro.posicao_vazio(codigo_inicial)]),
+                                       np.zeros(1, dtype=np.int16), h, chaves)]}}
+    tabela = TabelaEstados()
+    tabela.gravar(chaves, np.zeros(1, dtype=np.int16), chaves, np.zeros(1, dtype=np.uint8))
+    objetivo = np.uint64(objetivo)
+    nos_expandidos = 0
+    minimo = tamanho_lote // 16
+
+    while camadas:
+        f = min(camadas)
+        camada = camadas[f]
+        # Junta blocos da camada, dos menores h para os maiores, até completar
+        # um lote. Um h maior só entra se o lote ainda estiver pequeno: ele
+        # traz estados que o desempate do A* deixaria para depois do objetivo
+        lote = []
+        tamanho = 0
+        while camada:
+            h_min = min(camada)
+            blocos = camada[h_min]
+            if lote and (tamanho >= minimo or tamanho + len(blocos[-1][0]) > tamanho_lote):
+                break
+            while blocos and (not lote or tamanho + len(blocos[-1][0]) <= tamanho_lote):
+                lote.append(blocos.pop())
+                tamanho += len(lote[-1][0])
+            if not blocos:
+                del camada[h_min]
+        if not camada:
+            del camadas[f]
+        estados = np.concatenate([b[0] for b in lote])
+        vazios = np.concatenate([b[1] for b in lote])
+        g = np.concatenate([b[2] for b in lote])
+        h = np.concatenate([b[3] for b in lote])
+        chaves = np.concatenate([b[4] for b in lote])
+
+        # Remoção preguiçosa de entradas superadas por caminhos mais baratos
+        atuais = tabela.g[tabela.posicoes(chaves)] == g
+        if not atuais.all():
+            estados, vazios, g, h, chaves = (estados[atuais], vazios[atuais], g[atuais],
+                                             h[atuais], chaves[atuais])
+
+        if np.any(chaves == objetivo):
+            return _reconstruir(tabuleiro, tabela, objetivo), nos_expandidos, time.time() - inicio
+        nos_expandidos += len(chaves)
+
+        # Sucessores de todos os movimentos em um só conjunto de arrays
+        sucessores = expandir_lote(tabelas, avaliador, estados, vazios, h)
+        indices = np.concatenate([s[0] for s in sucessores])
+        if not len(indices):
+            continue
+        filhos = np.concatenate([s[1] for s in sucessores])
+        vazios_filhos = np.concatenate([s[2] for s in sucessores])
+        h_filhos = np.concatenate([s[3] for s in sucessores])
+        movimentos = np.repeat(np.arange(len(sucessores), dtype=np.uint8),
+                               [len(s[0]) for s in sucessores])
+        g_filhos = g[indices] + 1
+        chaves_filhos = tabelas.chaves(filhos)
+
+        # Um filho por estado (o de menor g), e só os novos ou alcançados
+        # por um caminho mais barato
+        ordem = np.lexsort((g_filhos, chaves_filhos))
+        _, primeiros = np.unique(chaves_filhos[ordem], return_index=True)
+        novos = ordem[primeiros]
+        posicoes = tabela.posicoes(chaves_filhos[novos])
+        conhecidos = tabela.chaves[posicoes] == chaves_filhos[novos]
+        melhores = ~conhecidos | (g_filhos[novos] < tabela.g[posicoes])
+        novos = novos[melhores]
+        if not len(novos):
+            continue
+        tabela.gravar(chaves_filhos[novos], g_filhos[novos], chaves[indices[novos]],
+                      movimentos[novos])
+
+        h_novos = h_filhos[novos].astype(np.int64)
+        f_novos = g_filhos[novos] + h_novos
+        # Objetivo gerado no menor f: nenhum caminho na fronteira é mais barato
+        if np.any((chaves_filhos[novos] == objetivo) & (f_novos == f)):
+            return _reconstruir(tabuleiro, tabela, objetivo), nos_expandidos, time.time() - inicio
+
+        # Uma única chave inteira por (f, h), ordenada, para dividir em blocos
+        grupos = f_novos * (1 << 16) + h_novos
+        ordem = np.argsort(grupos, kind='stable')
+        novos, grupos = novos[ordem], grupos[ordem]
+        valores, inicios = np.unique(grupos, return_index=True)
+        for grupo, selecao in zip(valores.tolist(), np.split(novos, inicios[1:])):
+            f_filho, h_filho = divmod(grupo, 1 << 16)
+            camadas.setdefault(f_filho, {}).setdefault(h_filho, []).append((
+                filhos[selecao], vazios_filhos[selecao], g_filhos[selecao],
+                h_filhos[selecao], chaves_filhos[selecao]))
+
+    return None, nos_expandidos, time.time() - inicio
+
+
+def _reconstruir(tabuleiro, tabela, chave):
+    """
+    Reconstrói o caminho seguindo os pais até o estado inicial, como um
+    CaminhoPreguicoso (os estados só viram matrizes quando acessados). O
+    estado inicial é o seu próprio pai.
+    """
+    movimentos = bytearray()
+    chave = np.array([chave], dtype=np.uint64)
+    while True:
+        posicao = tabela.posicoes(chave)
+        pai = tabela.pais[posicao]
+        if pai[0] == chave[0]:
+            break
+        movimentos.append(int(tabela.movimentos[posicao[0]]))
+        chave = pai
+    movimentos.reverse()
+    return CaminhoPreguicoso(tabuleiro, int(chave[0]), movimentos)
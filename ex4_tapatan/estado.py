@@ -1,50 +1,196 @@
 '''
 Estado do jogo Tapatan.
 Encapsula o tabuleiro e o jogador atual.
+
+A posição é guardada em duas máscaras de 9 bits, uma por jogador, com a
+casa (linha, coluna) no bit 3 * linha + coluna. Os movimentos saem das
+máscaras de adjacência e as vitórias das oito máscaras de linha, todas
+calculadas uma única vez, ao carregar o módulo.
 '''
 
-import copy
+# Tabuleiro inicial (variante filipina)
+TABULEIRO_INICIAL = (
+    ('X', 'O', 'X'),
+    (' ', ' ', ' '),
+    ('O', 'X', 'O')
+)
+
+# Coordenadas (linha, coluna) de cada casa, pelo índice do bit
+COORDENADAS = tuple((i // 3, i % 3) for i in range(9))
+
+# Define as conexões válidas no tabuleiro (movimentos possíveis)
+CONEXOES = {
+    # (0, 0): [(0, 1), (1, 0), (1, 1)],
+    # (0, 1): [(0, 0), (0, 2), (1, 1)],
+    # (0, 2): [(0, 1), (1, 1), (1, 2)],
+    # (1, 0): [(0, 0), (1, 1), (2, 0)],
+    # (1, 1): [(0, 0), (0, 1), (0, 2),
+    #          (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)],
+    # (1, 2): [(0, 2), (1, 1), (2, 2)],
+    # (2, 0): [(1, 0), (1, 1), (2, 1)],
+    # (2, 1): [(2, 0), (1, 1), (2, 2)],
+    # (2, 2): [(2, 1), (1, 1), (1, 2)]
+
+    # SEM MOVIMENTOS DIAGONAIS
+    (0, 0): [(0, 1), (1, 0)],                   # Removido (1,1) diagonal
+    (0, 1): [(0, 0), (0, 2), (1, 1)],
+    (0, 2): [(0, 1), (1, 2)],                   # Removido (1,1) diagonal
+    (1, 0): [(0, 0), (1, 1), (2, 0)],
+    (1, 1): [(0, 1), (1, 0), (1, 2), (2, 1)],   # Removidas as diagonais
+    (1, 2): [(0, 2), (1, 1), (2, 2)],
+    (2, 0): [(1, 0), (2, 1)],                   # Removido (1,1) diagonal
+    (2, 1): [(2, 0), (1, 1), (2, 2)],
+    (2, 2): [(2, 1), (1, 2)]                    # Removido (1,1) diagonal
+}
+
+
+def indice(casa):
+    """
+    Índice do bit de uma casa (linha, coluna).
+    """
+    return 3 * casa[0] + casa[1]
+
+
+# Destinos de cada casa como (índice, bit), na ordem de CONEXOES
+VIZINHOS = tuple(
+    tuple((indice(destino), 1 << indice(destino)) for destino in CONEXOES[casa])
+    for casa in COORDENADAS
+)
+
+# Máscara das casas vizinhas de cada casa
+ADJACENTES = tuple(sum(bit for _, bit in vizinhos) for vizinhos in VIZINHOS)
+
+# As oito linhas vencedoras: linhas, colunas, diagonal principal e secundária
+LINHAS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100
+)
+
+# Número de bits ligados de cada máscara de 9 bits
+BITS = tuple(bin(mascara).count('1') for mascara in range(512))
+
+# Índice da primeira linha de LINHAS completada pelas peças de cada máscara
+# (8 se nenhuma). Como X e O não dividem linhas, ganha quem tem o menor.
+PRIMEIRA_LINHA = tuple(
+    next((i for i, linha in enumerate(LINHAS) if mascara & linha == linha), len(LINHAS))
+    for mascara in range(512)
+)
+
 
 class Estado:
     """
     Classe para representar um estado do jogo.
     Encapsula o tabuleiro e o jogador atual.
+
+    Args:
+        tabuleiro: Matriz 3×3 com 'X', 'O' e ' ' (padrão: tabuleiro inicial)
+        jogador_atual: Jogador da vez ('X' ou 'O')
     """
+
+    __slots__ = ('x', 'o', 'jogador_atual', '_tabuleiro')
+
+    # Conexões compartilhadas por todos os estados
+    conexoes = CONEXOES
+
     def __init__(self, tabuleiro=None, jogador_atual='X'):
-        # Inicializa o tabuleiro padrão se nenhum for fornecido
+        # Usa o tabuleiro padrão se nenhum for fornecido
         if tabuleiro is None:
-            self.tabuleiro = [
-                ['X', 'O', 'X'], 
-                [' ', ' ', ' '], 
-                ['O', 'X', 'O']
-            ]
-        else:
-            # Cria uma cópia profunda do tabuleiro para evitar referências
-            self.tabuleiro = copy.deepcopy(tabuleiro)
-        
+            tabuleiro = TABULEIRO_INICIAL
+
+        x = o = 0
+        for i, (linha, coluna) in enumerate(COORDENADAS):
+            simbolo = tabuleiro[linha][coluna]
+            if simbolo == 'X':
+                x |= 1 << i
+            elif simbolo == 'O':
+                o |= 1 << i
+        self.x = x
+        self.o = o
         self.jogador_atual = jogador_atual
-        
-        # Define as conexões válidas no tabuleiro (movimentos possíveis)
-        self.conexoes = {
-            # (0, 0): [(0, 1), (1, 0), (1, 1)],
-            # (0, 1): [(0, 0), (0, 2), (1, 1)],
-            # (0, 2): [(0, 1), (1, 1), (1, 2)],
-            # (1, 0): [(0, 0), (1, 1), (2, 0)],
-            # (1, 1): [(0, 0), (0, 1), (0, 2), 
-            #          (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)],
-            # (1, 2): [(0, 2), (1, 1), (2, 2)],
-            # (2, 0): [(1, 0), (1, 1), (2, 1)],
-            # (2, 1): [(2, 0), (1, 1), (2, 2)],
-            # (2, 2): [(2, 1), (1, 1), (1, 2)]
-            
-            # SEM MOVIMENTOS DIAGONAIS
-            (0, 0): [(0, 1), (1, 0)],                   # Removido (1,1) diagonal
-            (0, 1): [(0, 0), (0, 2), (1, 1)],
-            (0, 2): [(0, 1), (1, 2)],                   # Removido (1,1) diagonal
-            (1, 0): [(0, 0), (1, 1), (2, 0)],
-            (1, 1): [(0, 1), (1, 0), (1, 2), (2, 1)],   # Removidas as diagonais
-            (1, 2): [(0, 2), (1, 1), (2, 2)],
-            (2, 0): [(1, 0), (2, 1)],                   # Removido (1,1) diagonal
-            (2, 1): [(2, 0), (1, 1), (2, 2)],
-            (2, 2): [(2, 1), (1, 2)]                    # Removido (1,1) diagonal
-        }
\ No newline at end of file
+        self._tabuleiro = None
+
+    @classmethod
+    def de_mascaras(cls, x, o, jogador_atual):
+        """
+        Cria um estado direto das máscaras, sem passar pela matriz.
+        """
+        estado = cls.__new__(cls)
+        estado.x = x
+        estado.o = o
+        estado.jogador_atual = jogador_atual
+        estado._tabuleiro = None
+        return estado
+
+    def mascara(self, simbolo):
+        """
+        Máscara das peças de um jogador.
+        """
+        return self.x if simbolo == 'X' else self.o
+
+    @property
+    def tabuleiro(self):
+        """
+        Matriz 3×3 (tuplas) com 'X', 'O' e ' ', para a interface.
+        Só é montada quando pedida e é somente leitura: para mover uma peça
+        use mover().
+        """
+        if self._tabuleiro is None:
+            x, o = self.x, self.o
+            self._tabuleiro = tuple(
+                tuple('X' if x >> i & 1 else 'O' if o >> i & 1 else ' '
+                      for i in range(3 * linha, 3 * linha + 3))
+                for linha in range(3)
+            )
+        return self._tabuleiro
+
+    def mover(self, origem, destino):
+        """
+        Move a peça de origem para destino e passa a vez (sem validar o
+        movimento).
+
+        Args:
+            origem: Coordenadas (linha, coluna) da peça
+            destino: Coordenadas (linha, coluna) da casa vazia
+        """
+        movimento = (1 << indice(origem)) | (1 << indice(destino))
+        if self.x >> indice(origem) & 1:
+            self.x ^= movimento
+        else:
+            self.o ^= movimento
+        self.jogador_atual = 'O' if self.jogador_atual == 'X' else 'X'
+        self._tabuleiro = None
+
+
+class Posicao:
+    """
+    Posição mutável usada pela busca: as máscaras de um Estado, alteradas
+    no lugar com fazer() e desfeitas com desfazer(), sem criar objetos.
+
+    Um movimento é a máscara com os bits da origem e do destino, então
+    aplicá-lo e desfazê-lo são o mesmo XOR nas peças de quem moveu.
+
+    Args:
+        estado: Estado de onde a posição parte (não é alterado)
+    """
+
+    __slots__ = ('pecas', 'vez')
+
+    def __init__(self, estado):
+        # pecas[0] são as peças de X e pecas[1] as de O; vez indexa pecas
+        self.pecas = [estado.x, estado.o]
+        self.vez = 0 if estado.jogador_atual == 'X' else 1
+
+    def fazer(self, movimento):
+        self.pecas[self.vez] ^= movimento
+        self.vez ^= 1
+
+    def desfazer(self, movimento):
+        self.vez ^= 1
+        self.pecas[self.vez] ^= movimento
+
+    def estado(self):
+        """
+        Estado equivalente à posição atual.
+        """
+        return Estado.de_mascaras(self.pecas[0], self.pecas[1], 'XO'[self.vez])
@@ -4,6 +4,62 @@ Implementação do algoritmo Minimax para o jogo Tapatan.
 -> Versão otimizada para criar uma IA praticamente imbatível.
 '''
 
+import time
+from itertools import combinations
+
+from estado import ADJACENTES, BITS, COORDENADAS, LINHAS, PRIMEIRA_LINHA, VIZINHOS, Estado, Posicao
+from simetria import INVERSAS, TRANSFORMACOES
+from transposicao import EXATO, INFERIOR, SUPERIOR, ZOBRIST_MOVIMENTO, chave_canonica, hash_zobrist
+
+# Casa central e casas ocupadas em um tabuleiro cheio
+CENTRO = 1 << 4
+TODAS = (1 << 9) - 1
+
+# Pontos de proximidade de cada par de casas: 2 se vizinhas, 1 se a
+# distância de Manhattan é 2
+PROXIMIDADE = tuple(
+    tuple({1: 2, 2: 1}.get(abs(a[0] - b[0]) + abs(a[1] - b[1]), 0) for b in COORDENADAS)
+    for a in COORDENADAS
+)
+
+# Jogadas a partir de cada casa: (bit do destino, ação), na ordem de CONEXOES
+JOGADAS = tuple(
+    tuple((bit, (COORDENADAS[origem], COORDENADAS[destino])) for destino, bit in vizinhos)
+    for origem, vizinhos in enumerate(VIZINHOS)
+)
+
+_MENOS_INFINITO = float('-inf')
+_MAIS_INFINITO = float('inf')
+
+# Movimentos de cada par (peças de quem joga, peças do adversário),
+# montados na primeira vez em que o par aparece
+_MOVIMENTOS = {}
+
+
+def movimentos(propria, outra):
+    """
+    Movimentos do jogador com as peças `propria`, como máscaras
+    origem|destino e na mesma ordem de MinimaxAlgoritmo.acoes.
+
+    Returns:
+        tuple: Tupla compartilhada entre as chamadas (não deve ser alterada)
+    """
+    chave = propria << 9 | outra
+    lista = _MOVIMENTOS.get(chave)
+    if lista is None:
+        ocupadas = propria | outra
+        lista = []
+        pecas = propria
+        while pecas:
+            bit = pecas & -pecas
+            pecas ^= bit
+            for _, destino in VIZINHOS[bit.bit_length() - 1]:
+                if not ocupadas & destino:
+                    lista.append(bit | destino)
+        lista = _MOVIMENTOS[chave] = tuple(lista)
+    return lista
+
+
 class MinimaxAlgoritmo:
     """
     Implementação do algoritmo Minimax com poda alfa-beta e otimizações para IA imbatível.
@@ -22,45 +78,43 @@ class MinimaxAlgoritmo:
         Retorna todas as jogadas disponíveis no estado atual.
         """
         jogadas = []
-        simbolo = MinimaxAlgoritmo.jogador(estado)
-        
-        # Encontrar todas as peças do jogador atual
-        pecas = []
-        for i in range(3):
-            for j in range(3):
-                if estado.tabuleiro[i][j] == simbolo:
-                    pecas.append((i, j))
-        
-        # Para cada peça, encontrar todos os movimentos possíveis
-        for origem in pecas:
-            for destino in estado.conexoes[origem]:
-                # Verificar se o destino está vazio
-                if destino[0] < 0 or destino[0] > 2 or destino[1] < 0 or destino[1] > 2:
-                    continue
-                if estado.tabuleiro[destino[0]][destino[1]] == ' ':
-                    jogadas.append((origem, destino))
+        pecas = estado.mascara(MinimaxAlgoritmo.jogador(estado))
+        ocupadas = estado.x | estado.o
+        
+        # Para cada peça (bit ligado, da casa 0 à 8), os destinos vazios
+        while pecas:
+            bit = pecas & -pecas
+            pecas ^= bit
+            for destino, acao in JOGADAS[bit.bit_length() - 1]:
+                if not ocupadas & destino:
+                    jogadas.append(acao)
         
         return jogadas
     
+    @staticmethod
+    def _mobilidade(pecas, livres):
+        """
+        Número de jogadas das peças de uma máscara (o mesmo que len(acoes)).
+        """
+        total = 0
+        while pecas:
+            bit = pecas & -pecas
+            pecas ^= bit
+            total += BITS[ADJACENTES[bit.bit_length() - 1] & livres]
+        return total
+    
     @staticmethod
     def resultado(estado, acao):
         """
         Retorna o novo estado após aplicar uma ação ao estado atual.
         """
-        from estado import Estado
-        
         # Criar uma cópia do estado para não modificar o original
-        novo_estado = Estado(estado.tabuleiro, estado.jogador_atual)
+        novo_estado = Estado.de_mascaras(estado.x, estado.o, estado.jogador_atual)
         
         origem, destino = acao
         
-        # Aplicar o movimento
-        simbolo = novo_estado.tabuleiro[origem[0]][origem[1]]
-        novo_estado.tabuleiro[origem[0]][origem[1]] = ' '
-        novo_estado.tabuleiro[destino[0]][destino[1]] = simbolo
-        
-        # Trocar o jogador
-        novo_estado.jogador_atual = 'O' if novo_estado.jogador_atual == 'X' else 'X'
+        # Aplicar o movimento e trocar o jogador
+        novo_estado.mover(origem, destino)
         
         return novo_estado
     
@@ -69,22 +123,12 @@ class MinimaxAlgoritmo:
         """
         Retorna o símbolo do jogador que ganhou, se houver.
         """
-        # Verificar linhas
-        for i in range(3):
-            if estado.tabuleiro[i][0] == estado.tabuleiro[i][1] == estado.tabuleiro[i][2] != ' ':
-                return estado.tabuleiro[i][0]
-        
-        # Verificar colunas
-        for j in range(3):
-            if estado.tabuleiro[0][j] == estado.tabuleiro[1][j] == estado.tabuleiro[2][j] != ' ':
-                return estado.tabuleiro[0][j]
-        
-        # Verificar diagonais
-        if estado.tabuleiro[0][0] == estado.tabuleiro[1][1] == estado.tabuleiro[2][2] != ' ':
-            return estado.tabuleiro[0][0]
-        
-        if estado.tabuleiro[0][2] == estado.tabuleiro[1][1] == estado.tabuleiro[2][0] != ' ':
-            return estado.tabuleiro[0][2]
+        # Primeira linha completa, na ordem linhas, colunas e diagonais
+        linha_x, linha_o = PRIMEIRA_LINHA[estado.x], PRIMEIRA_LINHA[estado.o]
+        if linha_x < linha_o:
+            return 'X'
+        if linha_o < linha_x:
+            return 'O'
         
         return None
     
@@ -121,100 +165,66 @@ class MinimaxAlgoritmo:
             return -100  # Jogador humano venceu
         
         simbolo_humano = 'O' if simbolo_computador == 'X' else 'X'
+        return AVALIACOES[estado.mascara(simbolo_computador) << 9 | estado.mascara(simbolo_humano)]
+    
+    @staticmethod
+    def _avaliar_mascaras(pecas_computador, pecas_humano):
+        """
+        avaliar_posicao para uma posição sem vencedor, dada pelas máscaras.
+        Usada para preencher AVALIACOES e FOLHAS; a busca só consulta as tabelas.
+        """
         valor = 0
+        ocupadas = pecas_computador | pecas_humano
         
         # Favorecimento do centro - posição estratégica
-        if estado.tabuleiro[1][1] == simbolo_computador:
+        if pecas_computador & CENTRO:
             valor += 3
-        elif estado.tabuleiro[1][1] == simbolo_humano:
+        elif pecas_humano & CENTRO:
             valor -= 3
         
         # Avaliar possibilidades de 2-em-linha
         # Para o computador
-        valor += MinimaxAlgoritmo._contar_dois_em_linha(estado, simbolo_computador) * 5
+        valor += MinimaxAlgoritmo._contar_dois_em_linha(pecas_computador, ocupadas) * 5
         # Para o humano
-        valor -= MinimaxAlgoritmo._contar_dois_em_linha(estado, simbolo_humano) * 5
-        
-        # Avaliar mobilidade (número de movimentos possíveis)
-        # Original do jogador atual
-        jogador_atual = estado.jogador_atual
+        valor -= MinimaxAlgoritmo._contar_dois_em_linha(pecas_humano, ocupadas) * 5
         
-        # Temporariamente mudar para computador e calcular mobilidade
-        estado.jogador_atual = simbolo_computador
-        movimentos_computador = len(MinimaxAlgoritmo.acoes(estado))
-        valor += movimentos_computador * 0.5
-        
-        # Temporariamente mudar para humano e calcular mobilidade
-        estado.jogador_atual = simbolo_humano
-        movimentos_humano = len(MinimaxAlgoritmo.acoes(estado))
-        valor -= movimentos_humano * 0.5
-        
-        # Restaurar jogador original
-        estado.jogador_atual = jogador_atual
+        # Avaliar mobilidade (número de movimentos possíveis de cada jogador)
+        livres = TODAS & ~ocupadas
+        valor += MinimaxAlgoritmo._mobilidade(pecas_computador, livres) * 0.5
+        valor -= MinimaxAlgoritmo._mobilidade(pecas_humano, livres) * 0.5
         
         # Favorecimento de posições próximas de peças próprias
-        valor += MinimaxAlgoritmo._avaliar_proximidade(estado, simbolo_computador)
+        valor += MinimaxAlgoritmo._avaliar_proximidade(pecas_computador)
         
         return valor
     
     @staticmethod
-    def _contar_dois_em_linha(estado, simbolo):
+    def _contar_dois_em_linha(pecas, ocupadas):
         """
         Conta quantas configurações de 2-em-linha o jogador tem.
         Isso indica posições quase vencedoras.
         """
+        # Linhas com duas peças do jogador e a terceira casa vazia
         contador = 0
-        
-        # Verificar linhas
-        for i in range(3):
-            if (estado.tabuleiro[i][0] == estado.tabuleiro[i][1] == simbolo and estado.tabuleiro[i][2] == ' ') or \
-               (estado.tabuleiro[i][0] == estado.tabuleiro[i][2] == simbolo and estado.tabuleiro[i][1] == ' ') or \
-               (estado.tabuleiro[i][1] == estado.tabuleiro[i][2] == simbolo and estado.tabuleiro[i][0] == ' '):
+        for linha in LINHAS:
+            if BITS[pecas & linha] == 2 and BITS[ocupadas & linha] == 2:
                 contador += 1
         
-        # Verificar colunas
-        for j in range(3):
-            if (estado.tabuleiro[0][j] == estado.tabuleiro[1][j] == simbolo and estado.tabuleiro[2][j] == ' ') or \
-               (estado.tabuleiro[0][j] == estado.tabuleiro[2][j] == simbolo and estado.tabuleiro[1][j] == ' ') or \
-               (estado.tabuleiro[1][j] == estado.tabuleiro[2][j] == simbolo and estado.tabuleiro[0][j] == ' '):
-                contador += 1
-        
-        # Verificar diagonais
-        if (estado.tabuleiro[0][0] == estado.tabuleiro[1][1] == simbolo and estado.tabuleiro[2][2] == ' ') or \
-           (estado.tabuleiro[0][0] == estado.tabuleiro[2][2] == simbolo and estado.tabuleiro[1][1] == ' ') or \
-           (estado.tabuleiro[1][1] == estado.tabuleiro[2][2] == simbolo and estado.tabuleiro[0][0] == ' '):
-            contador += 1
-        
-        if (estado.tabuleiro[0][2] == estado.tabuleiro[1][1] == simbolo and estado.tabuleiro[2][0] == ' ') or \
-           (estado.tabuleiro[0][2] == estado.tabuleiro[2][0] == simbolo and estado.tabuleiro[1][1] == ' ') or \
-           (estado.tabuleiro[1][1] == estado.tabuleiro[2][0] == simbolo and estado.tabuleiro[0][2] == ' '):
-            contador += 1
-        
         return contador
     
     @staticmethod
-    def _avaliar_proximidade(estado, simbolo):
+    def _avaliar_proximidade(mascara):
         """
         Avalia quão próximas estão as peças do jogador entre si.
         Proximidade entre peças pode levar a melhores chances de formar linha.
         """
-        valor = 0
-        pecas = []
+        pecas = [i for i in range(9) if mascara >> i & 1]
         
-        # Encontrar todas as peças do jogador
-        for i in range(3):
-            for j in range(3):
-                if estado.tabuleiro[i][j] == simbolo:
-                    pecas.append((i, j))
-        
-        # Calcular proximidade entre peças (menor distância = melhor)
+        # Somar a proximidade de cada par de peças (menor distância = melhor)
+        valor = 0
         for i, peca1 in enumerate(pecas):
             for peca2 in pecas[i+1:]:
-                distancia = abs(peca1[0] - peca2[0]) + abs(peca1[1] - peca2[1])
-                if distancia <= 1:  # Peças adjacentes
-                    valor += 2
-                elif distancia == 2:  # Peças a uma casa de distância
-                    valor += 1
+                valor += PROXIMIDADE[peca1][peca2]
         
         return valor
     
@@ -237,57 +247,481 @@ class MinimaxAlgoritmo:
             return MinimaxAlgoritmo.avaliar_posicao(estado, simbolo_computador) / 100
     
     @staticmethod
-    def minimax(estado, profundidade=5, alfa=float('-inf'), beta=float('inf'), maximizando=True, simbolo_computador='O'):
+    def minimax(estado, profundidade=5, alfa=float('-inf'), beta=float('inf'), maximizando=True, simbolo_computador='O', tabela=None):
         """
         Implementa o algoritmo minimax com poda alfa-beta para determinar o melhor movimento.
         Profundidade maior (5) e avaliação de posição melhorada.
+        
+        A busca é feita por BuscaMinimax, que aplica e desfaz os movimentos em
+        uma única posição mutável em vez de criar um estado por nó. Se for
+        passada uma TabelaTransposicao (tabela), ela é consultada e
+        atualizada pela busca e pode ser reaproveitada na jogada seguinte.
+        
+        Returns:
+            tuple: (valor, melhor ação), com a ação None em estados finais ou
+            com profundidade 0
+        """
+        busca = BuscaMinimax(estado, simbolo_computador, tabela)
+        return busca.buscar(profundidade, alfa, beta, maximizando)
+
+
+class BuscaInterrompida(Exception):
+    """
+    O prazo ou o limite de nós do aprofundamento iterativo acabou.
+    """
+
+
+# Nós entre duas verificações do prazo no aprofundamento iterativo
+INTERVALO_VERIFICACAO = 1024
+
+
+def para_acao(movimento, propria):
+    """
+    Converte um movimento (máscara origem|destino) na ação com coordenadas.
+
+    Args:
+        movimento: Máscara com os bits da origem e do destino
+        propria: Máscara das peças de quem faz o movimento
+    """
+    origem = movimento & propria
+    destino = movimento ^ origem
+    return COORDENADAS[origem.bit_length() - 1], COORDENADAS[destino.bit_length() - 1]
+
+
+class BuscaMinimax:
+    """
+    Minimax com poda alfa-beta sobre uma Posicao: cada movimento é feito e
+    desfeito no lugar, e as listas de movimentos são tuplas pré-calculadas,
+    então a busca não cria objetos por nó. Sem tabela de transposição, dá o
+    mesmo valor e a mesma jogada que a recursão sobre estados (mesma ordem
+    de movimentos e mesma avaliação).
+    
+    Com uma TabelaTransposicao, cada posição interna consulta a tabela pelo
+    hash de Zobrist (atualizado a cada movimento): um valor guardado com
+    profundidade suficiente encerra a busca do nó, e a melhor jogada
+    guardada é tentada primeiro. Se a tabela usa simetria, o hash é o da
+    representante canônica e as jogadas passam pela transformação até ela.
+    
+    aprofundar() faz o aprofundamento iterativo com orçamento de tempo ou de
+    nós, ordenando os movimentos pela variação principal da iteração
+    anterior, pela tabela e pelas heurísticas assassina e de história.
+    
+    Args:
+        estado: Estado de onde a busca parte (não é alterado)
+        simbolo_computador: O símbolo do computador ('X' ou 'O')
+        tabela: TabelaTransposicao opcional, que pode ser reaproveitada entre
+            buscas com o mesmo computador e o mesmo lado maximizando
+    """
+    
+    def __init__(self, estado, simbolo_computador='O', tabela=None):
+        self.posicao = Posicao(estado)
+        self.computador = 0 if simbolo_computador == 'X' else 1
+        self.tabela = tabela
+        self.simetria = tabela is not None and tabela.simetria
+        self.nos = 0  # Nós visitados (incluindo folhas)
+        
+        # Estado do aprofundamento iterativo
+        self.ordenar = False
+        self.fim = None  # Instante (time.time()) em que o prazo acaba
+        self.limite_nos = None
+        self._verificar_em = _MAIS_INFINITO  # Valor de nos da próxima verificação
+        self._raiz = 0  # Profundidade da iteração atual: ply = _raiz - profundidade
+        self._seguindo_pv = False
+        self.pv = ()  # Variação principal da última iteração completa (movimentos)
+        self.linhas = []  # Variação principal a partir de cada ply, na iteração atual
+        self.assassinas = []  # Duas jogadas que causaram poda, por ply
+        self.historia = ([0] * 512, [0] * 512)  # Pontos de poda por [vez][movimento]
+        self.profundidade_alcancada = 0
+        self.tempo = 0.0
+    
+    def aprofundar(self, prazo=None, limite_nos=None, profundidade_maxima=32, maximizando=True):
+        """
+        Aprofundamento iterativo: busca com profundidade 1, 2, 3... e devolve
+        o resultado da última iteração completa. A profundidade 1 sempre é
+        completada; as seguintes são interrompidas quando o orçamento acaba.
+        
+        Sem tabela, ou com uma de profundidade_exata, o valor é o mesmo do
+        minimax de profundidade fixa na profundidade alcançada. Com uma
+        tabela comum, entradas de buscas mais profundas (de iterações ou
+        jogadas anteriores) são reaproveitadas, e o valor e a jogada podem
+        ser diferentes dos do minimax de profundidade fixa.
+        
+        Args:
+            prazo: Tempo máximo, em segundos (None para não limitar)
+            limite_nos: Máximo de nós visitados (None para não limitar)
+            profundidade_maxima: Profundidade da última iteração
+            maximizando: Se o jogador da vez maximiza, como em minimax
+            
+        Returns:
+            tuple: (valor, melhor ação), como MinimaxAlgoritmo.minimax
+        """
+        inicio = time.time()
+        posicao = self.posicao
+        pecas, vez = list(posicao.pecas), posicao.vez
+        self.ordenar = True
+        try:
+            resultado = self.buscar(1, maximizando=maximizando)
+            self.profundidade_alcancada = 1
+            self.pv = self.linhas[0]
+            
+            self.fim = inicio + prazo if prazo is not None else None
+            self.limite_nos = limite_nos
+            if prazo is not None or limite_nos is not None:
+                self._verificar_em = self.nos
+            for profundidade in range(2, profundidade_maxima + 1):
+                # Fim de jogo: uma vitória ou derrota forçada não muda mais
+                if resultado[1] is None or abs(resultado[0]) == 1:
+                    break
+                try:
+                    iteracao = self.buscar(profundidade, maximizando=maximizando)
+                except BuscaInterrompida:
+                    # Desfaz os movimentos que estavam aplicados
+                    posicao.pecas[:] = pecas
+                    posicao.vez = vez
+                    break
+                resultado = iteracao
+                self.profundidade_alcancada = profundidade
+                self.pv = self.linhas[0]
+        finally:
+            self.ordenar = False
+            self._verificar_em = _MAIS_INFINITO
+            self.tempo = time.time() - inicio
+        return resultado
+    
+    def relatorio(self):
+        """
+        Resumo do último aprofundamento iterativo.
+        
+        Returns:
+            dict: profundidade alcançada, nós, tempo, nós por segundo e a
+            variação principal como lista de ações
+        """
+        pecas = list(self.posicao.pecas)
+        vez = self.posicao.vez
+        variacao = []
+        for movimento in self.pv:
+            variacao.append(para_acao(movimento, pecas[vez]))
+            pecas[vez] ^= movimento
+            vez ^= 1
+        return {
+            'profundidade': self.profundidade_alcancada,
+            'nos': self.nos,
+            'tempo': self.tempo,
+            'nos_por_segundo': self.nos / self.tempo if self.tempo > 0 else 0.0,
+            'pv': variacao,
+        }
+    
+    def _verificar(self):
+        """
+        Interrompe a busca se o orçamento acabou.
         """
-        # Caso base: jogo acabou ou atingiu profundidade máxima
-        if profundidade == 0 or MinimaxAlgoritmo.final(estado):
-            return MinimaxAlgoritmo.custo(estado, simbolo_computador), None
+        if (self.limite_nos is not None and self.nos >= self.limite_nos) or \
+                (self.fim is not None and time.time() >= self.fim):
+            raise BuscaInterrompida()
+        self._verificar_em = self.nos + INTERVALO_VERIFICACAO
+        if self.limite_nos is not None:
+            self._verificar_em = min(self._verificar_em, self.limite_nos)
+    
+    def _ordenar_jogadas(self, jogadas, ply, vez, primeira, na_pv):
+        """
+        Ordem de tentativa dos movimentos no aprofundamento iterativo: o da
+        variação principal anterior (se o caminho até aqui a segue), o da
+        tabela, as assassinas do ply e os demais por pontos de história.
+        """
+        frente = []
+        if na_pv and ply < len(self.pv):
+            frente.append(self.pv[ply])
+        frente.append(primeira)
+        frente.extend(self.assassinas[ply])
+        inicio = []
+        for movimento in frente:
+            if movimento in jogadas and movimento not in inicio:
+                inicio.append(movimento)
+        historia = self.historia[vez]
+        resto = sorted((movimento for movimento in jogadas if movimento not in inicio),
+                       key=historia.__getitem__, reverse=True)
+        return inicio + resto
+    
+    def _registrar_poda(self, ply, vez, movimento, profundidade):
+        """
+        Atualiza as assassinas do ply e a história com o movimento que
+        causou a poda.
+        """
+        assassinas = self.assassinas[ply]
+        if movimento != assassinas[0]:
+            self.assassinas[ply] = (movimento, assassinas[0])
+        self.historia[vez][movimento] += profundidade * profundidade
+    
+    def buscar(self, profundidade, alfa=float('-inf'), beta=float('inf'), maximizando=True):
+        """
+        Valor minimax da posição e a melhor ação, como MinimaxAlgoritmo.minimax.
+        """
+        posicao = self.posicao
+        pecas = posicao.pecas
+        vez = posicao.vez
+        chave = hash_zobrist(pecas[0], pecas[1], vez)
+        transformacao = 0  # Identidade: sem simetria as jogadas não mudam
+        if self.simetria:
+            chave, transformacao = chave_canonica(pecas[0], pecas[1], vez)
+        jogadas = movimentos(pecas[vez], pecas[vez ^ 1])
+        if self.tabela is not None:
+            # Quem maximiza é o jogador da vez ou o outro
+            self.tabela.preparar((self.computador, vez if maximizando else vez ^ 1))
+        ordenar = self.ordenar
+        if ordenar:
+            self._raiz = profundidade
+            self.linhas = [()] * (profundidade + 2)
+            while len(self.assassinas) <= profundidade:
+                self.assassinas.append((0, 0))
+            self._seguindo_pv = True
+        if profundidade == 0 or not jogadas or PRIMEIRA_LINHA[pecas[0]] != PRIMEIRA_LINHA[pecas[1]]:
+            return self._valor(profundidade, alfa, beta, maximizando, chave), None
+        
+        self.nos += 1
+        alfa_original, beta_original = alfa, beta
+        if ordenar:
+            primeira = 0
+            if self.tabela is not None:
+                i = self.tabela.consultar(chave)
+                if i >= 0:
+                    primeira = TRANSFORMACOES[INVERSAS[transformacao]][self.tabela.jogadas[i]]
+            jogadas = self._ordenar_jogadas(jogadas, 0, vez, primeira, True)
+            pv = self.pv[0] if self.pv else 0
+        else:
+            jogadas = self._ordenar(jogadas, chave, transformacao)
+        zobrist = ZOBRIST_MOVIMENTO[vez]
+        melhor_valor = float('-inf') if maximizando else float('inf')
+        melhor = None
+        for movimento in jogadas:
+            if ordenar:
+                self._seguindo_pv = movimento == pv
+            posicao.fazer(movimento)
+            valor = self._valor(profundidade - 1, alfa, beta, not maximizando,
+                                chave ^ zobrist[movimento])
+            posicao.desfazer(movimento)
+            
+            if maximizando:
+                if valor > melhor_valor:
+                    melhor_valor, melhor = valor, movimento
+                    if ordenar:
+                        self.linhas[0] = (movimento,) + self.linhas[1]
+                alfa = max(alfa, melhor_valor)
+            else:
+                if valor < melhor_valor:
+                    melhor_valor, melhor = valor, movimento
+                    if ordenar:
+                        self.linhas[0] = (movimento,) + self.linhas[1]
+                beta = min(beta, melhor_valor)
+            
+            # Poda alfa-beta
+            if beta <= alfa:
+                break
         
-        # Inicializar melhor ação e valor
-        melhor_acao = None
+        self._gravar(chave, profundidade, melhor_valor, alfa_original, beta_original,
+                     TRANSFORMACOES[transformacao][melhor])
         
+        # Converter a máscara origem|destino na ação com coordenadas
+        return melhor_valor, para_acao(melhor, pecas[vez])
+
+    def buscar_jogada(self, movimento, profundidade, alfa=float('-inf'), beta=float('inf'),
+                      maximizando=True, fim=None):
+        """
+        Valor de um movimento da raiz: o da posição depois dele, buscada com
+        profundidade - 1. É a parte de cada processo na busca paralela, que
+        divide os movimentos da raiz (a tabela já deve estar preparada).
+
+        Args:
+            movimento: Máscara origem|destino de um movimento de quem tem a vez
+            maximizando: Se o jogador da vez (antes do movimento) maximiza
+            fim: Instante (time.time()) em que a busca é interrompida
+
+        Raises:
+            BuscaInterrompida: se o instante fim passar
+        """
+        posicao = self.posicao
+        pecas, vez = list(posicao.pecas), posicao.vez
+        self.fim = fim
+        if fim is not None:
+            self._verificar_em = self.nos
+        posicao.fazer(movimento)
+        try:
+            chave = hash_zobrist(posicao.pecas[0], posicao.pecas[1], posicao.vez)
+            return self._valor(profundidade - 1, alfa, beta, not maximizando, chave)
+        finally:
+            # Também desfaz os movimentos aplicados se a busca foi interrompida
+            posicao.pecas[:] = pecas
+            posicao.vez = vez
+            self.fim = None
+            self._verificar_em = _MAIS_INFINITO
+
+    def _ordenar(self, jogadas, chave, transformacao=0):
+        """
+        Põe a melhor jogada guardada na tabela (se houver) na frente.
+        """
+        tabela = self.tabela
+        if tabela is None:
+            return jogadas
+        i = tabela.consultar(chave)
+        if i < 0:
+            return jogadas
+        primeira = TRANSFORMACOES[INVERSAS[transformacao]][tabela.jogadas[i]]
+        if primeira not in jogadas:
+            return jogadas
+        return (primeira,) + tuple(movimento for movimento in jogadas if movimento != primeira)
+    
+    def _gravar(self, chave, profundidade, valor, alfa, beta, jogada):
+        """
+        Guarda o resultado de um nó, com o limite dado pela janela original.
+        """
+        if self.tabela is None:
+            return
+        if valor <= alfa:
+            limite = SUPERIOR
+        elif valor >= beta:
+            limite = INFERIOR
+        else:
+            limite = EXATO
+        self.tabela.gravar(chave, profundidade, valor, limite, jogada)
+    
+    def _valor(self, profundidade, alfa, beta, maximizando, chave):
+        """
+        Valor minimax da posição atual (sem a ação), com a mesma avaliação de
+        MinimaxAlgoritmo.custo. `chave` é o hash de Zobrist da posição.
+        """
+        self.nos += 1
+        if self.nos >= self._verificar_em:
+            self._verificar()
+        ordenar = self.ordenar
+        if ordenar:
+            ply = self._raiz - profundidade
+            self.linhas[ply] = ()
+        posicao = self.posicao
+        pecas = posicao.pecas
+        
+        # Vencedor: 1 se X ganhou, -1 se O ganhou
+        linha_x, linha_o = PRIMEIRA_LINHA[pecas[0]], PRIMEIRA_LINHA[pecas[1]]
+        if linha_x != linha_o:
+            return 1 if linha_x < linha_o else -1
+        
+        # Sem movimentos, o jogo acaba empatado
+        vez = posicao.vez
+        jogadas = movimentos(pecas[vez], pecas[vez ^ 1])
+        if not jogadas:
+            return 0
+        
+        if profundidade == 0:
+            computador = self.computador
+            return FOLHAS[pecas[computador] << 9 | pecas[computador ^ 1]]
+        
+        tabela = self.tabela
+        primeira = 0
+        if tabela is not None:
+            transformacao = 0
+            if self.simetria:
+                # A chave recebida (incremental) é trocada pela da representante
+                chave, transformacao = chave_canonica(pecas[0], pecas[1], vez)
+            i = tabela.consultar(chave)
+            if i >= 0:
+                profundidade_guardada = tabela.profundidades[i]
+                if profundidade_guardada == profundidade or \
+                        (profundidade_guardada > profundidade and not tabela.profundidade_exata):
+                    # Valor já conhecido, ou um limite que já causa a poda
+                    valor = tabela.valores[i]
+                    limite = tabela.limites[i]
+                    if limite == EXATO or (limite == INFERIOR and valor >= beta) or \
+                            (limite == SUPERIOR and valor <= alfa):
+                        return valor
+                primeira = tabela.jogadas[i]
+                if transformacao:
+                    primeira = TRANSFORMACOES[INVERSAS[transformacao]][primeira]
+                if not ordenar and primeira in jogadas:
+                    jogadas = (primeira,) + tuple(m for m in jogadas if m != primeira)
+            alfa_original, beta_original = alfa, beta
+        if ordenar:
+            na_pv = self._seguindo_pv
+            jogadas = self._ordenar_jogadas(jogadas, ply, vez, primeira, na_pv)
+            pv = self.pv[ply] if na_pv and ply < len(self.pv) else 0
+            linhas = self.linhas
+        
+        # Posicao.fazer/desfazer feitos aqui mesmo: é o laço mais quente da busca
+        zobrist = ZOBRIST_MOVIMENTO[vez]
+        proxima = vez ^ 1
+        melhor = 0
         if maximizando:
-            melhor_valor = float('-inf')
-            # Para cada ação possível
-            for acao in MinimaxAlgoritmo.acoes(estado):
-                # Calcular o valor minimax do resultado dessa ação
-                novo_estado = MinimaxAlgoritmo.resultado(estado, acao)
-                valor, _ = MinimaxAlgoritmo.minimax(novo_estado, profundidade - 1, alfa, beta, False, simbolo_computador)
-                
-                # Atualizar melhor valor e ação, se necessário
+            melhor_valor = _MENOS_INFINITO
+            for movimento in jogadas:
+                if ordenar:
+                    self._seguindo_pv = movimento == pv
+                pecas[vez] ^= movimento
+                posicao.vez = proxima
+                valor = self._valor(profundidade - 1, alfa, beta, False, chave ^ zobrist[movimento])
+                pecas[vez] ^= movimento
+                posicao.vez = vez
                 if valor > melhor_valor:
                     melhor_valor = valor
-                    melhor_acao = acao
-                
-                # Atualizar alfa
-                alfa = max(alfa, melhor_valor)
-                
-                # Poda alfa-beta
+                    melhor = movimento
+                    if ordenar:
+                        linhas[ply] = (movimento,) + linhas[ply + 1]
+                    if valor > alfa:
+                        alfa = valor
                 if beta <= alfa:
                     break
-                
-            return melhor_valor, melhor_acao
         else:
-            melhor_valor = float('inf')
-            # Para cada ação possível
-            for acao in MinimaxAlgoritmo.acoes(estado):
-                # Calcular o valor minimax do resultado dessa ação
-                novo_estado = MinimaxAlgoritmo.resultado(estado, acao)
-                valor, _ = MinimaxAlgoritmo.minimax(novo_estado, profundidade - 1, alfa, beta, True, simbolo_computador)
-                
-                # Atualizar melhor valor e ação, se necessário
+            melhor_valor = _MAIS_INFINITO
+            for movimento in jogadas:
+                if ordenar:
+                    self._seguindo_pv = movimento == pv
+                pecas[vez] ^= movimento
+                posicao.vez = proxima
+                valor = self._valor(profundidade - 1, alfa, beta, True, chave ^ zobrist[movimento])
+                pecas[vez] ^= movimento
+                posicao.vez = vez
                 if valor < melhor_valor:
                     melhor_valor = valor
-                    melhor_acao = acao
-                
-                # Atualizar beta
-                beta = min(beta, melhor_valor)
-                
-                # Poda alfa-beta
+                    melhor = movimento
+                    if ordenar:
+                        linhas[ply] = (movimento,) + linhas[ply + 1]
+                    if valor < beta:
+                        beta = valor
                 if beta <= alfa:
                     break
-                
-            return melhor_valor, melhor_acao
\ No newline at end of file
+        
+        if ordenar and beta <= alfa:
+            self._registrar_poda(ply, vez, melhor, profundidade)
+        if tabela is not None:
+            self._gravar(chave, profundidade, melhor_valor, alfa_original, beta_original,
+                         TRANSFORMACOES[transformacao][melhor])
+        return melhor_valor
+
+
+class TabelaAvaliacao(dict):
+    """
+    Avaliações estáticas pré-calculadas, indexadas por
+    (peças do computador << 9) | peças do humano. As 1.680 posições com 3
+    peças de cada lado são calculadas ao carregar o módulo; qualquer outra,
+    na primeira vez em que é consultada.
+    
+    Args:
+        escala: Divisor da avaliação (100 dá o valor usado nas folhas, como
+            em custo)
+    """
+    
+    def __init__(self, escala=1):
+        super().__init__()
+        self.escala = escala
+        for casas_computador in combinations(range(9), 3):
+            pecas_computador = sum(1 << casa for casa in casas_computador)
+            livres = [casa for casa in range(9) if not pecas_computador >> casa & 1]
+            for casas_humano in combinations(livres, 3):
+                self[pecas_computador << 9 | sum(1 << casa for casa in casas_humano)]
+    
+    def __missing__(self, chave):
+        valor = MinimaxAlgoritmo._avaliar_mascaras(chave >> 9, chave & TODAS)
+        if self.escala != 1:
+            valor /= self.escala
+        self[chave] = valor
+        return valor
+
+
+AVALIACOES = TabelaAvaliacao()
+FOLHAS = TabelaAvaliacao(100)
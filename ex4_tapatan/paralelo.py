@@ -0,0 +1,287 @@
+'''
+Busca minimax paralela para o Tapatan.
+
+Os movimentos da raiz são divididos entre os processos de um
+multiprocessing.Pool, e todos usam a mesma TabelaCompartilhada (memória
+compartilhada, sem travas): o que um processo grava encurta a busca dos
+outros. O melhor valor exato da raiz (e o índice do movimento) também fica
+na memória compartilhada, atualizado por quem o encontra; cada processo
+começa com a janela apertada por ele e só confirma um movimento que o
+supera, ou que o iguala vindo antes na ordem dos movimentos.
+
+A jogada é sempre a mesma da busca serial de profundidade fixa
+(MinimaxAlgoritmo.minimax sem tabela): a tabela só aceita valores da mesma
+profundidade, então os valores exatos não dependem da ordem em que os
+processos gravam, e os empates ficam com o primeiro movimento, na ordem de
+MinimaxAlgoritmo.acoes.
+
+Para medir a escalabilidade (aceleração e eficiência por número de
+processos):
+
+    python paralelo.py [profundidade]
+'''
+
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from estado import PRIMEIRA_LINHA, Estado, Posicao
+from minimax import BuscaInterrompida, BuscaMinimax, movimentos, para_acao
+from transposicao import TabelaCompartilhada, TabelaTransposicao
+
+# Tabela compartilhada de cada processo da busca
+_tabela = None
+
+
+def _iniciar_processo(nome, memoria_kb, simetria):
+    """
+    Liga o processo da busca à tabela compartilhada.
+    """
+    global _tabela
+    _tabela = TabelaCompartilhada(memoria_kb, simetria, nome=nome)
+
+
+def _buscar_movimento(tarefa):
+    """
+    Busca um movimento da raiz em um processo.
+
+    Returns:
+        Tupla (índice do movimento, valor ou None se interrompida, se o valor
+        é exato, nós visitados)
+    """
+    x, o, jogador, simbolo_computador, k, movimento, profundidade, maximizando, fim = tarefa
+    busca = BuscaMinimax(Estado.de_mascaras(x, o, jogador), simbolo_computador, _tabela)
+
+    # Janela a partir do melhor valor já confirmado; se o movimento vem
+    # antes do melhor, um empate o faz vencer, então a janela abre logo
+    # abaixo (ou acima) do valor para que o empate saia exato
+    alfa, beta = -math.inf, math.inf
+    raiz = _tabela.ler_raiz()
+    if raiz is not None:
+        melhor, indice = raiz
+        if maximizando:
+            alfa = melhor if indice < k else math.nextafter(melhor, -math.inf)
+        else:
+            beta = melhor if indice < k else math.nextafter(melhor, math.inf)
+    try:
+        valor = busca.buscar_jogada(movimento, profundidade, alfa, beta, maximizando, fim)
+    except BuscaInterrompida:
+        return k, None, False, busca.nos
+    exato = valor > alfa if maximizando else valor < beta
+    if exato:
+        # Sem trava: outro processo pode sobrescrever com um valor pior, o
+        # que só alarga as janelas seguintes (todo valor gravado é exato)
+        raiz = _tabela.ler_raiz()
+        if raiz is None or (valor > raiz[0] if maximizando else valor < raiz[0]) or \
+                (valor == raiz[0] and k < raiz[1]):
+            _tabela.gravar_raiz(valor, k)
+    return k, valor, exato, busca.nos
+
+
+class BuscaParalela:
+    """
+    Minimax com poda alfa-beta dividindo os movimentos da raiz entre
+    processos, com uma tabela de transposição compartilhada.
+
+    O pool de processos é criado na primeira busca e a tabela é mantida
+    entre as buscas; fechar() (ou o uso com `with`) encerra os dois.
+
+    Args:
+        processos: Número de processos (padrão: os.cpu_count())
+        memoria_kb: Memória da tabela compartilhada, em KB
+        simetria: Indexar a tabela pela posição canônica
+    """
+
+    def __init__(self, processos=None, memoria_kb=1024, simetria=True):
+        self.processos = processos or os.cpu_count() or 1
+        self.memoria_kb = memoria_kb
+        self.simetria = simetria
+        self.tabela = TabelaCompartilhada(memoria_kb, simetria)
+        self._pool = None
+        self._valores = {}  # Valores exatos da última iteração, por movimento
+        self.nos = 0
+        self.profundidade_alcancada = 0
+        self.tempo = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+    def fechar(self):
+        """
+        Encerra os processos e apaga a tabela compartilhada.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self.tabela is not None:
+            self.tabela.fechar()
+            self.tabela = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = Pool(self.processos, initializer=_iniciar_processo,
+                              initargs=(self.tabela.nome, self.memoria_kb, self.simetria))
+        return self._pool
+
+    def buscar(self, estado, profundidade, maximizando=True, simbolo_computador='O', fim=None):
+        """
+        Valor minimax e melhor ação, como MinimaxAlgoritmo.minimax.
+
+        Args:
+            fim: Instante (time.time()) em que a busca é interrompida
+
+        Raises:
+            BuscaInterrompida: se o instante fim passar
+        """
+        pecas = Posicao(estado).pecas
+        vez = 0 if estado.jogador_atual == 'X' else 1
+        jogadas = movimentos(pecas[vez], pecas[vez ^ 1])
+        if profundidade == 0 or not jogadas or PRIMEIRA_LINHA[pecas[0]] != PRIMEIRA_LINHA[pecas[1]]:
+            busca = BuscaMinimax(estado, simbolo_computador)
+            return busca.buscar(profundidade, maximizando=maximizando)
+
+        computador = 0 if simbolo_computador == 'X' else 1
+        tabela = self.tabela
+        tabela.preparar((computador, vez if maximizando else vez ^ 1))
+        tabela.gravar_raiz(-math.inf if maximizando else math.inf, len(jogadas))
+        self.nos += 1  # A raiz
+
+        # Os melhores movimentos da iteração anterior saem primeiro, para
+        # apertar a janela dos outros o quanto antes
+        sinal = 1 if maximizando else -1
+        anteriores = self._valores
+        ordem = sorted(range(len(jogadas)),
+                       key=lambda k: -sinal * anteriores.get(jogadas[k], -sinal * math.inf))
+        tarefas = [(estado.x, estado.o, estado.jogador_atual, simbolo_computador,
+                    k, jogadas[k], profundidade, maximizando, fim) for k in ordem]
+
+        melhor_valor, melhor = None, None
+        valores = {}
+        interrompida = False
+        for k, valor, exato, nos in self.pool.imap_unordered(_buscar_movimento, tarefas):
+            self.nos += nos
+            if valor is None:
+                interrompida = True
+                continue
+            if not exato:
+                continue  # Limite: pior do que o melhor já confirmado
+            valores[jogadas[k]] = valor
+            if melhor is None or sinal * valor > sinal * melhor_valor or \
+                    (valor == melhor_valor and k < melhor):
+                melhor_valor, melhor = valor, k
+        if interrompida:
+            raise BuscaInterrompida()
+        self._valores = valores
+        return melhor_valor, para_acao(jogadas[melhor], pecas[vez])
+
+    def aprofundar(self, estado, prazo=None, profundidade_maxima=32, maximizando=True,
+                   simbolo_computador='O'):
+        """
+        Aprofundamento iterativo como em BuscaMinimax.aprofundar, com cada
+        iteração dividida entre os processos.
+
+        Returns:
+            tuple: (valor, melhor ação) da última iteração completa
+        """
+        inicio = time.time()
+        fim = inicio + prazo if prazo is not None else None
+        self.nos = 0
+        self._valores = {}
+        try:
+            resultado = self.buscar(estado, 1, maximizando, simbolo_computador)
+            self.profundidade_alcancada = 1
+            for profundidade in range(2, profundidade_maxima + 1):
+                # Fim de jogo: uma vitória ou derrota forçada não muda mais
+                if resultado[1] is None or abs(resultado[0]) == 1:
+                    break
+                try:
+                    resultado = self.buscar(estado, profundidade, maximizando, simbolo_computador, fim)
+                except BuscaInterrompida:
+                    break
+                self.profundidade_alcancada = profundidade
+        finally:
+            self.tempo = time.time() - inicio
+        return resultado
+
+    def relatorio(self):
+        """
+        Resumo do último aprofundamento iterativo.
+
+        Returns:
+            dict: processos, profundidade alcançada, nós, tempo e nós por segundo
+        """
+        return {
+            'processos': self.processos,
+            'profundidade': self.profundidade_alcancada,
+            'nos': self.nos,
+            'tempo': self.tempo,
+            'nos_por_segundo': self.nos / self.tempo if self.tempo > 0 else 0.0,
+        }
+
+
+def medir_escalabilidade(estado, profundidade, processos=None, maximizando=True,
+                         simbolo_computador='O'):
+    """
+    Compara a busca serial de profundidade fixa, com uma tabela comum de
+    mesmo tamanho e mesmas opções, com a paralela.
+
+    Args:
+        processos: Números de processos a medir (padrão: 1, 2, 4... até
+            os.cpu_count())
+
+    Returns:
+        list: Um dict por número de processos, com tempo, nós, aceleração
+        (tempo serial / tempo paralelo), eficiência (aceleração / processos)
+        e se a jogada é a mesma da busca serial
+    """
+    if processos is None:
+        processos = [1]
+        while processos[-1] * 2 <= (os.cpu_count() or 1):
+            processos.append(processos[-1] * 2)
+
+    inicio = time.time()
+    tabela = TabelaTransposicao(simetria=True, profundidade_exata=True)
+    serial = BuscaMinimax(estado, simbolo_computador, tabela)
+    valor, acao = serial.buscar(profundidade, maximizando=maximizando)
+    tempo_serial = time.time() - inicio
+
+    medidas = [{'processos': 0, 'tempo': tempo_serial, 'nos': serial.nos,
+                'aceleracao': 1.0, 'eficiencia': 1.0, 'mesma_jogada': True}]
+    for n in processos:
+        with BuscaParalela(n) as busca:
+            busca.pool  # Cria os processos fora da medida
+            inicio = time.time()
+            valor_paralelo, acao_paralela = busca.buscar(estado, profundidade, maximizando,
+                                                         simbolo_computador)
+            tempo = time.time() - inicio
+        aceleracao = tempo_serial / tempo if tempo > 0 else 0.0
+        medidas.append({'processos': n, 'tempo': tempo, 'nos': busca.nos,
+                        'aceleracao': aceleracao, 'eficiencia': aceleracao / n,
+                        'mesma_jogada': (valor_paralelo, acao_paralela) == (valor, acao)})
+    return medidas
+
+
+def main():
+    """
+    Mostra a escalabilidade da busca paralela a partir da posição inicial.
+    """
+    profundidade = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    print(f"Profundidade {profundidade}, {os.cpu_count()} processadores")
+    print(f"{'processos':>9} {'tempo (s)':>10} {'nós':>10} {'aceleração':>11} {'eficiência':>11} {'mesma jogada':>13}")
+    for medida in medir_escalabilidade(Estado(), profundidade):
+        processos = medida['processos'] or 'serial'
+        print(f"{processos:>9} {medida['tempo']:>10.3f} {medida['nos']:>10} "
+              f"{medida['aceleracao']:>11.2f} {medida['eficiencia']:>11.2f} "
+              f"{'sim' if medida['mesma_jogada'] else 'não':>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+'''
+Simetrias do tabuleiro do Tapatan.
+
+Com as conexões só ortogonais, o tabuleiro não muda com nenhuma das oito
+simetrias do quadrado (quatro rotações e quatro reflexões): as conexões,
+as oito linhas vencedoras e a avaliação das posições são as mesmas. Por
+isso cada posição pode ser trocada por uma representante canônica da sua
+classe, a de menor chave (x << 9) | o entre as oito imagens, e tabelas
+indexadas por posição guardam só as representantes (228 das 1.680
+posições com 3 peças de cada lado).
+
+As transformações são tabelas pré-calculadas: a imagem de uma máscara
+(de peças ou de um movimento origem|destino) é uma consulta, e cada
+transformação tem a sua inversa, para levar de volta ao tabuleiro
+original as jogadas guardadas na forma canônica.
+'''
+
+from estado import COORDENADAS, indice
+
+# As oito simetrias do quadrado 3×3, como funções de (linha, coluna)
+SIMETRIAS = (
+    lambda linha, coluna: (linha, coluna),          # Identidade
+    lambda linha, coluna: (coluna, 2 - linha),      # Rotação de 90°
+    lambda linha, coluna: (2 - linha, 2 - coluna),  # Rotação de 180°
+    lambda linha, coluna: (2 - coluna, linha),      # Rotação de 270°
+    lambda linha, coluna: (linha, 2 - coluna),      # Reflexão vertical
+    lambda linha, coluna: (2 - linha, coluna),      # Reflexão horizontal
+    lambda linha, coluna: (coluna, linha),          # Diagonal principal
+    lambda linha, coluna: (2 - coluna, 2 - linha),  # Diagonal secundária
+)
+
+# PERMUTACOES[t][casa]: casa para onde a transformação t leva `casa`
+PERMUTACOES = tuple(
+    tuple(indice(simetria(*casa)) for casa in COORDENADAS)
+    for simetria in SIMETRIAS
+)
+
+# INVERSAS[t]: transformação que desfaz t
+INVERSAS = tuple(
+    next(u for u, inversa in enumerate(PERMUTACOES)
+         if all(inversa[permutacao[casa]] == casa for casa in range(9)))
+    for permutacao in PERMUTACOES
+)
+
+# TRANSFORMACOES[t][mascara]: imagem de uma máscara de 9 bits pela transformação t
+TRANSFORMACOES = tuple(
+    tuple(sum(1 << permutacao[casa] for casa in range(9) if mascara >> casa & 1)
+          for mascara in range(512))
+    for permutacao in PERMUTACOES
+)
+
+_CANONICAS = {}  # (x << 9) | o -> (x canônico, o canônico, transformação)
+
+
+def canonizar(x, o):
+    """
+    Representante canônica de uma posição.
+
+    Args:
+        x: Máscara das peças de X
+        o: Máscara das peças de O
+
+    Returns:
+        Tupla (x, o, t) com as máscaras da representante e a transformação
+        t que leva a posição dada até ela. Um movimento m da posição dada é
+        TRANSFORMACOES[t][m] na representante; o caminho de volta usa
+        TRANSFORMACOES[INVERSAS[t]]
+    """
+    chave = x << 9 | o
+    canonica = _CANONICAS.get(chave)
+    if canonica is None:
+        menor, t = min((transformacao[x] << 9 | transformacao[o], t)
+                       for t, transformacao in enumerate(TRANSFORMACOES))
+        canonica = _CANONICAS[chave] = (menor >> 9, menor & 511, t)
+    return canonica
+
+
+def transformar_acao(acao, t):
+    """
+    Imagem de uma ação ((linha, coluna) de origem e de destino) pela
+    transformação t.
+    """
+    simetria = SIMETRIAS[t]
+    origem, destino = acao
+    return simetria(*origem), simetria(*destino)
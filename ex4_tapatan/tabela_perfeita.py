@@ -0,0 +1,286 @@
+'''
+Tabela de jogo perfeito do Tapatan, por análise retrógrada.
+
+O Tapatan tem só 9!/(3!·3!·3!) = 1.680 arranjos das peças, vezes 2
+jogadores da vez. A análise retrógrada parte das posições finais (alguém
+já formou linha) e volta pelos movimentos: uma posição é vitória se algum
+movimento leva a uma derrota do adversário, e derrota se todos levam a
+vitórias dele. O que nunca é rotulado é empate, inclusive os empates por
+repetição (ciclos). Junto do resultado fica a distância, em lances, até o
+fim do jogo: o vencedor a encurta e o perdedor a estica.
+
+Gere a tabela uma vez, offline:
+
+    python tabela_perfeita.py
+
+As posições simétricas (rotações e reflexões do tabuleiro) têm o mesmo
+resultado, então o arquivo guarda só as representantes canônicas (ver
+simetria.py): um byte para cada uma das 228 classes e cada jogador da vez.
+Ele é mapeado em memória (mmap) na primeira consulta; escolher a jogada
+perfeita passa a ser olhar a tabela para cada movimento, sem nenhuma busca.
+'''
+
+import mmap
+import os
+import struct
+import sys
+import time
+from collections import deque
+from itertools import combinations
+
+from estado import ADJACENTES, COORDENADAS, LINHAS, PRIMEIRA_LINHA
+from minimax import movimentos
+from simetria import canonizar
+
+CAMINHO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tabela_perfeita.bin')
+
+# Assinatura e as máscaras de adjacência: se as conexões mudarem, a tabela
+# gerada com as antigas é recusada
+CABECALHO = struct.Struct('<4s9H')
+ASSINATURA = b'TPTS'
+
+# Resultado para o jogador da vez, nos 2 bits baixos de cada byte; a
+# distância até o fim do jogo fica nos 6 bits altos
+EMPATE = 0
+VITORIA = 1
+DERROTA = 2
+NOMES = {EMPATE: 'empate', VITORIA: 'vitória', DERROTA: 'derrota'}
+DISTANCIA_MAXIMA = 63
+
+
+def _arranjos():
+    """
+    Todos os pares (x, o) de máscaras com 3 peças de cada jogador.
+    """
+    arranjos = []
+    for casas_x in combinations(range(9), 3):
+        x = sum(1 << casa for casa in casas_x)
+        livres = [casa for casa in range(9) if not x >> casa & 1]
+        for casas_o in combinations(livres, 3):
+            arranjos.append((x, sum(1 << casa for casa in casas_o)))
+    return arranjos
+
+
+# Posição de índice i: arranjo ARRANJOS[i // 2] com a vez de i % 2 (0 = X)
+ARRANJOS = _arranjos()
+INDICE_ARRANJO = {x << 9 | o: i for i, (x, o) in enumerate(ARRANJOS)}
+POSICOES = 2 * len(ARRANJOS)
+
+# Representantes canônicas; a posição canônica de índice k é
+# CANONICOS[k // 2] com a vez de k % 2
+CANONICOS = sorted({x << 9 | o for x, o, _ in (canonizar(x, o) for x, o in ARRANJOS)})
+INDICE_CANONICO = {chave: k for k, chave in enumerate(CANONICOS)}
+
+
+def indice(x, o, vez):
+    """
+    Índice de uma posição na tabela.
+    """
+    return 2 * INDICE_ARRANJO[x << 9 | o] + vez
+
+
+def resolver():
+    """
+    Análise retrógrada de todas as posições.
+
+    Returns:
+        bytearray: Um byte por posição, (distância << 2) | resultado
+    """
+    tabela = bytearray(POSICOES)
+    rotulada = bytearray(POSICOES)
+    pais = [[] for _ in range(POSICOES)]
+    restantes = [0] * POSICOES  # Filhos ainda não rotulados como vitória
+    fila = deque()
+
+    for i in range(POSICOES):
+        x, o = ARRANJOS[i // 2]
+        vez = i % 2
+        linha_x, linha_o = PRIMEIRA_LINHA[x], PRIMEIRA_LINHA[o]
+        if linha_x != linha_o:
+            # Jogo terminado: ganha quem completou a primeira linha
+            vencedor = 0 if linha_x < linha_o else 1
+            tabela[i] = VITORIA if vencedor == vez else DERROTA
+            rotulada[i] = 1
+            fila.append(i)
+            continue
+        pecas = (x, o)
+        jogadas = movimentos(pecas[vez], pecas[vez ^ 1])
+        if not jogadas:
+            # Sem movimentos o jogo acaba empatado (como em MinimaxAlgoritmo.final)
+            tabela[i] = EMPATE
+            rotulada[i] = 1
+            continue
+        restantes[i] = len(jogadas)
+        for movimento in jogadas:
+            filho = (x ^ movimento, o) if vez == 0 else (x, o ^ movimento)
+            pais[indice(filho[0], filho[1], vez ^ 1)].append(i)
+
+    # Em ordem de distância: a primeira derrota de um filho dá a vitória mais
+    # curta do pai; a última vitória de um filho dá a derrota mais longa
+    while fila:
+        i = fila.popleft()
+        resultado, distancia = tabela[i] & 3, tabela[i] >> 2
+        if distancia + 1 > DISTANCIA_MAXIMA:
+            raise ValueError("Distância maior do que cabe na tabela")
+        for pai in pais[i]:
+            if rotulada[pai]:
+                continue
+            if resultado == DERROTA:
+                tabela[pai] = (distancia + 1) << 2 | VITORIA
+            else:
+                restantes[pai] -= 1
+                if restantes[pai]:
+                    continue
+                tabela[pai] = (distancia + 1) << 2 | DERROTA
+            rotulada[pai] = 1
+            fila.append(pai)
+
+    # O que sobrou está preso em ciclos: empate (o byte já é 0)
+    return tabela
+
+
+def compactar(tabela):
+    """
+    Reduz a tabela de resolver() às posições canônicas.
+
+    As únicas posições simétricas com rótulos diferentes são as com linha
+    dos dois jogadores, em que ganhador() decide pela ordem das linhas; elas
+    não acontecem em uma partida (o jogo acaba na primeira linha).
+
+    Raises:
+        ValueError: se outras posições simétricas tiverem rótulos diferentes
+    """
+    compacta = bytearray(2 * len(CANONICOS))
+    vistas = bytearray(len(compacta))
+    for i in range(POSICOES):
+        x, o, _ = canonizar(*ARRANJOS[i // 2])
+        k = 2 * INDICE_CANONICO[x << 9 | o] + i % 2
+        duas_linhas = PRIMEIRA_LINHA[x] < len(LINHAS) and PRIMEIRA_LINHA[o] < len(LINHAS)
+        if vistas[k] and compacta[k] != tabela[i] and not duas_linhas:
+            raise ValueError("Posições simétricas com resultados diferentes")
+        compacta[k] = tabela[i]
+        vistas[k] = 1
+    return compacta
+
+
+class TabelaPerfeita:
+    """
+    Tabela de jogo perfeito, mapeada em memória na primeira consulta.
+
+    Args:
+        caminho: Arquivo gerado por este módulo
+    """
+
+    def __init__(self, caminho=CAMINHO):
+        self.caminho = caminho
+        self._dados = None
+
+    @property
+    def dados(self):
+        if self._dados is None:
+            with open(self.caminho, 'rb') as arquivo:
+                dados = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            assinatura, *adjacentes = CABECALHO.unpack_from(dados, 0)
+            if assinatura != ASSINATURA or tuple(adjacentes) != ADJACENTES or \
+                    len(dados) != CABECALHO.size + 2 * len(CANONICOS):
+                raise ValueError(f"Tabela perfeita inválida ou desatualizada: {self.caminho}")
+            self._dados = dados
+        return self._dados
+
+    def consultar(self, x, o, vez):
+        """
+        Resultado e distância de uma posição.
+
+        Args:
+            x: Máscara das peças de X
+            o: Máscara das peças de O
+            vez: 0 se X joga, 1 se O joga
+
+        Returns:
+            Tupla (resultado, distancia), com o resultado (EMPATE, VITORIA ou
+            DERROTA) do ponto de vista do jogador da vez e a distância em
+            lances até o fim do jogo (0 em empates)
+        """
+        x, o, _ = canonizar(x, o)
+        byte = self.dados[CABECALHO.size + 2 * INDICE_CANONICO[x << 9 | o] + vez]
+        return byte & 3, byte >> 2
+
+    def avaliar(self, estado):
+        """
+        Resultado e distância de um Estado, como em consultar().
+        """
+        return self.consultar(estado.x, estado.o, 0 if estado.jogador_atual == 'X' else 1)
+
+    def melhor_jogada(self, estado):
+        """
+        Jogada perfeita: a vitória mais rápida, senão o empate, senão a
+        derrota mais demorada. Nos empates de critério vale a ordem de
+        MinimaxAlgoritmo.acoes.
+
+        Returns:
+            Tupla (origem, destino) com coordenadas, ou None sem jogadas
+        """
+        vez = 0 if estado.jogador_atual == 'X' else 1
+        pecas = (estado.x, estado.o)
+        melhor, melhor_nota = None, None
+        for movimento in movimentos(pecas[vez], pecas[vez ^ 1]):
+            filho = (pecas[0] ^ movimento, pecas[1]) if vez == 0 else (pecas[0], pecas[1] ^ movimento)
+            resultado, distancia = self.consultar(filho[0], filho[1], vez ^ 1)
+            # Nota maior é melhor para quem joga agora
+            if resultado == DERROTA:
+                nota = 2 * DISTANCIA_MAXIMA - distancia
+            elif resultado == EMPATE:
+                nota = DISTANCIA_MAXIMA
+            else:
+                nota = distancia
+            if melhor_nota is None or nota > melhor_nota:
+                melhor, melhor_nota = movimento, nota
+        if melhor is None:
+            return None
+        origem = melhor & pecas[vez]
+        destino = melhor ^ origem
+        return COORDENADAS[origem.bit_length() - 1], COORDENADAS[destino.bit_length() - 1]
+
+
+_carregada = None
+
+
+def carregar_tabela():
+    """
+    Tabela de jogo perfeito (uma por processo; o arquivo só é mapeado na
+    primeira consulta).
+
+    Raises:
+        FileNotFoundError: se a tabela ainda não foi gerada
+    """
+    global _carregada
+    if _carregada is None:
+        if not os.path.exists(CAMINHO):
+            raise FileNotFoundError(
+                f"{CAMINHO} não encontrado; gere a tabela com: python tabela_perfeita.py")
+        _carregada = TabelaPerfeita(CAMINHO)
+    return _carregada
+
+
+def main():
+    """
+    Gera e salva a tabela de jogo perfeito.
+    """
+    inicio = time.time()
+    tabela = resolver()
+    with open(CAMINHO, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(ASSINATURA, *ADJACENTES))
+        arquivo.write(compactar(tabela))
+    contagem = {nome: 0 for nome in NOMES.values()}
+    for byte in tabela:
+        contagem[NOMES[byte & 3]] += 1
+    print(f"{CAMINHO}: {POSICOES} posições, {2 * len(CANONICOS)} canônicas ({', '.join(f'{n} {nome}' for nome, n in contagem.items())}), "
+          f"distância máxima {max(byte >> 2 for byte in tabela)}, {time.time() - inicio:.2f} segundos")
+    from estado import Estado
+    resultado, distancia = TabelaPerfeita().avaliar(Estado())
+    print(f"Posição inicial (X joga): {NOMES[resultado]}, {distancia} lances até o fim")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,10 @@ Implementação usando o algoritmo Minimax para a IA do computador.
 import os
 import time
 from estado import Estado
-from minimax import MinimaxAlgoritmo
+from minimax import BuscaMinimax, MinimaxAlgoritmo
+from paralelo import BuscaParalela
+from tabela_perfeita import carregar_tabela
+from transposicao import TabelaTransposicao
 
 class Tapatan:
     def __init__(self):
@@ -25,8 +28,26 @@ class Tapatan:
         # Contador para acompanhar o número de turnos
         self.turnos = 0
         
-        # Profundidade fixa para o minimax (IA imbatível)
+        # Profundidade fixa para o minimax (IA imbatível), usada se não houver prazo
         self.dificuldade = 5
+        
+        # Orçamento por jogada do aprofundamento iterativo: tempo em segundos
+        # e, opcionalmente, número máximo de nós
+        self.prazo_jogada = 1.0
+        self.limite_nos = None
+        
+        # Tabela de transposição da partida, mantida entre as jogadas do computador
+        self.tabela = TabelaTransposicao(simetria=True)
+        
+        # Jogo perfeito pela tabela retrógrada (python tabela_perfeita.py),
+        # carregada na primeira jogada do computador; sem ela, usa o minimax
+        self.usar_tabela_perfeita = True
+        self.tabela_perfeita = None
+        
+        # Processos da busca paralela (None busca em um só processo); o
+        # pool e a tabela compartilhada são criados na primeira jogada
+        self.processos = None
+        self.busca_paralela = None
     
     def limpar_tela(self):
         """Limpa a tela do console"""
@@ -109,12 +130,8 @@ class Tapatan:
             origem (tuple): Coordenadas (linha, coluna) da peça a ser movida
             destino (tuple): Coordenadas (linha, coluna) do destino
         """
-        simbolo = self.estado.tabuleiro[origem[0]][origem[1]]
-        self.estado.tabuleiro[origem[0]][origem[1]] = ' '
-        self.estado.tabuleiro[destino[0]][destino[1]] = simbolo
-        
-        # Trocar o jogador atual
-        self.estado.jogador_atual = 'O' if self.estado.jogador_atual == 'X' else 'X'
+        # Move a peça nas máscaras do estado e troca o jogador atual
+        self.estado.mover(origem, destino)
     
     def mostrar_movimentos_possiveis(self, origem):
         """
@@ -134,7 +151,8 @@ class Tapatan:
     
     def movimento_computador(self):
         """
-        Determina o movimento do computador usando o algoritmo Minimax.
+        Determina o movimento do computador usando a tabela de jogo perfeito,
+        se ela foi gerada, ou o algoritmo Minimax.
         
         Returns:
             tuple: Tupla contendo as coordenadas de origem e destino do movimento
@@ -144,12 +162,45 @@ class Tapatan:
         
         print("\nAnalisando possíveis movimentos...")
         
+        # Com a tabela de jogo perfeito, a jogada sai direto dela
+        if self.usar_tabela_perfeita:
+            try:
+                if self.tabela_perfeita is None:
+                    self.tabela_perfeita = carregar_tabela()
+                return self.tabela_perfeita.melhor_jogada(self.estado)
+            except (FileNotFoundError, ValueError):
+                # Tabela não gerada ou desatualizada: segue com o minimax
+                self.usar_tabela_perfeita = False
+        
+        # Aprofundamento iterativo com os movimentos divididos entre processos
+        if self.processos and self.prazo_jogada is not None:
+            if self.busca_paralela is None:
+                self.busca_paralela = BuscaParalela(self.processos)
+            _, melhor_acao = self.busca_paralela.aprofundar(
+                self.estado, prazo=self.prazo_jogada, maximizando=maximizando,
+                simbolo_computador=self.simbolo_computador)
+            relatorio = self.busca_paralela.relatorio()
+            print(f"Profundidade {relatorio['profundidade']}, {relatorio['nos']} nós "
+                  f"({relatorio['nos_por_segundo']:.0f} nós/s, {relatorio['processos']} processos)")
+            return melhor_acao
+        
+        # Aprofundamento iterativo até esgotar o orçamento da jogada
+        if self.prazo_jogada is not None or self.limite_nos is not None:
+            busca = BuscaMinimax(self.estado, self.simbolo_computador, self.tabela)
+            _, melhor_acao = busca.aprofundar(prazo=self.prazo_jogada, limite_nos=self.limite_nos,
+                                              maximizando=maximizando)
+            relatorio = busca.relatorio()
+            print(f"Profundidade {relatorio['profundidade']}, {relatorio['nos']} nós "
+                  f"({relatorio['nos_por_segundo']:.0f} nós/s)")
+            return melhor_acao
+        
         # Chamar o algoritmo minimax com profundidade fixa e avaliação melhorada
         _, melhor_acao = MinimaxAlgoritmo.minimax(
             self.estado, 
             profundidade=self.dificuldade, 
             maximizando=maximizando, 
-            simbolo_computador=self.simbolo_computador
+            simbolo_computador=self.simbolo_computador,
+            tabela=self.tabela
         )
         
         return melhor_acao
@@ -303,7 +354,11 @@ class Tapatan:
             if escolha == '1':
                 self.__init__()  # Reinicia o jogo
                 self.configurar_modo_jogo()
-                self.jogar()
+                try:
+                    self.jogar()
+                finally:
+                    if self.busca_paralela is not None:
+                        self.busca_paralela.fechar()
                 input("\nPressione Enter para voltar ao menu principal...")
             elif escolha == '2':
                 self.mostrar_regras()
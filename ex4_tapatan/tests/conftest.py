@@ -0,0 +1,42 @@
+'''
+Configuração dos testes: os módulos do projeto são importados pelo nome,
+como quando os scripts rodam a partir desta pasta.
+
+As posições de teste são sorteadas entre os arranjos com 3 peças de cada
+lado, com semente fixa; a referência é a versão original do jogo
+(tests/original.py).
+'''
+
+import os
+import random
+import sys
+from itertools import permutations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import original  # noqa: E402
+
+
+def _posicoes(quantidade, semente=0):
+    arranjos = sorted(set(permutations('XXXOOO   ')))
+    gerador = random.Random(semente)
+    return [(tuple(celulas[i:i + 3] for i in range(0, 9, 3)), gerador.choice('XO'))
+            for celulas in gerador.sample(arranjos, quantidade)]
+
+
+# (tabuleiro, jogador da vez)
+POSICOES = _posicoes(150)
+
+# (tabuleiro, jogador da vez, profundidade, símbolo do computador, maximizando)
+CASOS = [(tabuleiro, jogador, profundidade, simbolo, maximizando)
+         for tabuleiro, jogador in POSICOES
+         for profundidade in range(1, 6)
+         for simbolo, maximizando in (('O', jogador == 'O'), ('X', jogador == 'X'))]
+
+
+def referencia(tabuleiro, jogador, profundidade, simbolo, maximizando):
+    """
+    (valor, ação) do minimax original.
+    """
+    return original.minimax(original.EstadoOriginal(tabuleiro, jogador), profundidade,
+                            maximizando=maximizando, simbolo_computador=simbolo)
@@ -0,0 +1,138 @@
+'''
+A versão original do Tapatan (tabuleiro em matriz, um Estado novo por
+jogada e avaliação percorrendo as casas), usada como referência nos
+testes das versões otimizadas. As regras e as contas de ponto flutuante
+são as mesmas, na mesma ordem, para que os valores saiam idênticos.
+'''
+
+import copy
+
+from estado import CONEXOES, TABULEIRO_INICIAL
+
+LINHAS = (
+    ((0, 0), (0, 1), (0, 2)), ((1, 0), (1, 1), (1, 2)), ((2, 0), (2, 1), (2, 2)),
+    ((0, 0), (1, 0), (2, 0)), ((0, 1), (1, 1), (2, 1)), ((0, 2), (1, 2), (2, 2)),
+    ((0, 0), (1, 1), (2, 2)), ((0, 2), (1, 1), (2, 0)),
+)
+
+
+class EstadoOriginal:
+    """
+    Estado com o tabuleiro em uma matriz de listas.
+    """
+
+    def __init__(self, tabuleiro=None, jogador_atual='X'):
+        self.tabuleiro = [list(linha) for linha in (tabuleiro or TABULEIRO_INICIAL)]
+        self.jogador_atual = jogador_atual
+
+
+def acoes(estado):
+    jogadas = []
+    for i in range(3):
+        for j in range(3):
+            if estado.tabuleiro[i][j] == estado.jogador_atual:
+                for destino in CONEXOES[(i, j)]:
+                    if estado.tabuleiro[destino[0]][destino[1]] == ' ':
+                        jogadas.append(((i, j), destino))
+    return jogadas
+
+
+def resultado(estado, acao):
+    novo = EstadoOriginal(copy.deepcopy(estado.tabuleiro), estado.jogador_atual)
+    (i, j), (k, m) = acao
+    novo.tabuleiro[k][m], novo.tabuleiro[i][j] = novo.tabuleiro[i][j], ' '
+    novo.jogador_atual = 'O' if estado.jogador_atual == 'X' else 'X'
+    return novo
+
+
+def ganhador(estado):
+    for linha in LINHAS:
+        simbolos = {estado.tabuleiro[i][j] for i, j in linha}
+        if len(simbolos) == 1 and ' ' not in simbolos:
+            return simbolos.pop()
+    return None
+
+
+def final(estado):
+    return ganhador(estado) is not None or not acoes(estado)
+
+
+def avaliar_posicao(estado, simbolo_computador):
+    vencedor = ganhador(estado)
+    if vencedor == simbolo_computador:
+        return 100
+    elif vencedor is not None:
+        return -100
+    simbolo_humano = 'O' if simbolo_computador == 'X' else 'X'
+    valor = 0
+    if estado.tabuleiro[1][1] == simbolo_computador:
+        valor += 3
+    elif estado.tabuleiro[1][1] == simbolo_humano:
+        valor -= 3
+    valor += _contar_dois_em_linha(estado, simbolo_computador) * 5
+    valor -= _contar_dois_em_linha(estado, simbolo_humano) * 5
+    valor += len(acoes(EstadoOriginal(estado.tabuleiro, simbolo_computador))) * 0.5
+    valor -= len(acoes(EstadoOriginal(estado.tabuleiro, simbolo_humano))) * 0.5
+    valor += _avaliar_proximidade(estado, simbolo_computador)
+    return valor
+
+
+def _contar_dois_em_linha(estado, simbolo):
+    contador = 0
+    for linha in LINHAS:
+        simbolos = [estado.tabuleiro[i][j] for i, j in linha]
+        if simbolos.count(simbolo) == 2 and simbolos.count(' ') == 1:
+            contador += 1
+    return contador
+
+
+def _avaliar_proximidade(estado, simbolo):
+    pecas = [(i, j) for i in range(3) for j in range(3) if estado.tabuleiro[i][j] == simbolo]
+    valor = 0
+    for k, peca1 in enumerate(pecas):
+        for peca2 in pecas[k + 1:]:
+            distancia = abs(peca1[0] - peca2[0]) + abs(peca1[1] - peca2[1])
+            if distancia <= 1:
+                valor += 2
+            elif distancia == 2:
+                valor += 1
+    return valor
+
+
+def custo(estado, simbolo_computador='O'):
+    vencedor = ganhador(estado)
+    if vencedor == 'X':
+        return 1
+    elif vencedor == 'O':
+        return -1
+    elif final(estado):
+        return 0
+    return avaliar_posicao(estado, simbolo_computador) / 100
+
+
+def minimax(estado, profundidade=5, alfa=float('-inf'), beta=float('inf'), maximizando=True,
+            simbolo_computador='O'):
+    """
+    Minimax com poda alfa-beta, como na versão original.
+
+    Returns:
+        tuple: (valor, melhor ação)
+    """
+    if profundidade == 0 or final(estado):
+        return custo(estado, simbolo_computador), None
+    melhor_acao = None
+    melhor_valor = float('-inf') if maximizando else float('inf')
+    for acao in acoes(estado):
+        valor, _ = minimax(resultado(estado, acao), profundidade - 1, alfa, beta,
+                           not maximizando, simbolo_computador)
+        if maximizando:
+            if valor > melhor_valor:
+                melhor_valor, melhor_acao = valor, acao
+            alfa = max(alfa, melhor_valor)
+        else:
+            if valor < melhor_valor:
+                melhor_valor, melhor_acao = valor, acao
+            beta = min(beta, melhor_valor)
+        if beta <= alfa:
+            break
+    return melhor_valor, melhor_acao
@@ -0,0 +1,56 @@
+'''
+Testes do aprofundamento iterativo (BuscaMinimax.aprofundar): valores
+iguais aos do minimax original na profundidade alcançada, com e sem
+orçamento, e a variação principal do relatório.
+'''
+
+import pytest
+
+import original
+from conftest import CASOS, POSICOES, referencia
+from estado import Estado
+from minimax import BuscaMinimax, MinimaxAlgoritmo
+from transposicao import TabelaTransposicao
+
+
+@pytest.mark.parametrize('tabela', [None, 'exata'])
+def test_aprofundamento_iterativo_igual_ao_minimax_original(tabela):
+    for tabuleiro, jogador, profundidade, simbolo, maximizando in CASOS:
+        busca = BuscaMinimax(Estado(tabuleiro, jogador), simbolo,
+                             TabelaTransposicao(64, profundidade_exata=True) if tabela else None)
+        valor, _ = busca.aprofundar(profundidade_maxima=profundidade, maximizando=maximizando)
+        assert valor == referencia(tabuleiro, jogador, profundidade, simbolo, maximizando)[0]
+
+
+def test_aprofundamento_respeita_o_limite_de_nos():
+    busca = BuscaMinimax(Estado(), 'O', TabelaTransposicao())
+    _, acao = busca.aprofundar(limite_nos=2000, maximizando=False)
+    assert acao in MinimaxAlgoritmo.acoes(Estado())
+    assert busca.nos <= 2000
+
+
+@pytest.mark.parametrize('limite_nos', [50, 300, 1500])
+def test_interrompido_vale_a_ultima_iteracao_completa(limite_nos):
+    for tabuleiro, jogador in POSICOES[:40]:
+        estado = Estado(tabuleiro, jogador)
+        busca = BuscaMinimax(estado, 'O')
+        valor, _ = busca.aprofundar(limite_nos=limite_nos, maximizando=jogador == 'O')
+        alcancada = busca.profundidade_alcancada
+        assert valor == referencia(tabuleiro, jogador, alcancada, 'O', jogador == 'O')[0]
+        # Os movimentos da iteração interrompida foram desfeitos
+        assert busca.posicao.pecas == [estado.x, estado.o]
+
+
+def test_variacao_principal_e_jogavel():
+    for tabuleiro, jogador in POSICOES[:40]:
+        busca = BuscaMinimax(Estado(tabuleiro, jogador), 'O', TabelaTransposicao())
+        _, acao = busca.aprofundar(profundidade_maxima=6, maximizando=jogador == 'O')
+        relatorio = busca.relatorio()
+        assert 1 <= relatorio['profundidade'] <= 6
+        if acao is None:
+            continue
+        assert relatorio['pv'][0] == acao
+        estado = original.EstadoOriginal(tabuleiro, jogador)
+        for passo in relatorio['pv']:
+            assert passo in original.acoes(estado)
+            estado = original.resultado(estado, passo)
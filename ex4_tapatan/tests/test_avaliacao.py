@@ -0,0 +1,42 @@
+'''
+Compara as avaliações pré-calculadas (TabelaAvaliacao) com a avaliação
+original, que percorre as casas do tabuleiro.
+'''
+
+from itertools import permutations
+
+import pytest
+
+import original
+from estado import Estado
+from minimax import AVALIACOES, FOLHAS, MinimaxAlgoritmo, TabelaAvaliacao
+
+
+def _sem_vencedor(pecas):
+    """
+    Tabuleiros sem vencedor com as peças dadas (por exemplo 'XXXOOO').
+    """
+    for celulas in sorted(set(permutations(pecas.ljust(9)))):
+        tabuleiro = tuple(celulas[i:i + 3] for i in range(0, 9, 3))
+        if original.ganhador(original.EstadoOriginal(tabuleiro)) is None:
+            yield tabuleiro
+
+
+@pytest.mark.parametrize('pecas', ['XXXOOO', 'XXOO', 'XXXO'])
+def test_tabelas_iguais_a_avaliacao_original(pecas):
+    for tabuleiro in _sem_vencedor(pecas):
+        estado = Estado(tabuleiro)
+        for computador, humano in (('X', 'O'), ('O', 'X')):
+            esperado = original.avaliar_posicao(original.EstadoOriginal(tabuleiro), computador)
+            chave = estado.mascara(computador) << 9 | estado.mascara(humano)
+            assert AVALIACOES[chave] == esperado
+            assert FOLHAS[chave] == esperado / 100
+            assert MinimaxAlgoritmo.avaliar_posicao(estado, computador) == esperado
+
+
+def test_posicoes_do_jogo_pre_calculadas():
+    tabela = TabelaAvaliacao()
+    assert len(tabela) == 1680
+    quantidade = len(tabela)
+    tabela[0b011 << 9 | 0b011 << 6]  # Duas peças de cada lado: entra na primeira consulta
+    assert len(tabela) == quantidade + 1
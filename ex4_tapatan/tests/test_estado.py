@@ -0,0 +1,40 @@
+'''
+Compara o estado em máscaras de bits (estado.py) e as regras calculadas
+sobre elas com a versão original em matriz.
+'''
+
+import original
+from conftest import POSICOES
+from estado import Estado
+from minimax import MinimaxAlgoritmo
+
+
+def test_tabuleiro_ida_e_volta():
+    for tabuleiro, jogador in POSICOES:
+        estado = Estado(tabuleiro, jogador)
+        assert estado.tabuleiro == tabuleiro
+        assert Estado.de_mascaras(estado.x, estado.o, jogador).tabuleiro == tabuleiro
+    assert Estado().tabuleiro == tuple(tuple(linha) for linha in original.EstadoOriginal().tabuleiro)
+
+
+def test_regras_iguais_as_originais():
+    for tabuleiro, jogador in POSICOES:
+        estado = Estado(tabuleiro, jogador)
+        referencia = original.EstadoOriginal(tabuleiro, jogador)
+        assert MinimaxAlgoritmo.acoes(estado) == original.acoes(referencia)
+        assert MinimaxAlgoritmo.ganhador(estado) == original.ganhador(referencia)
+        assert MinimaxAlgoritmo.final(estado) == original.final(referencia)
+        for simbolo in 'XO':
+            assert MinimaxAlgoritmo.custo(estado, simbolo) == original.custo(referencia, simbolo)
+
+
+def test_resultado_igual_ao_original():
+    for tabuleiro, jogador in POSICOES:
+        estado = Estado(tabuleiro, jogador)
+        referencia = original.EstadoOriginal(tabuleiro, jogador)
+        for acao in MinimaxAlgoritmo.acoes(estado):
+            novo = MinimaxAlgoritmo.resultado(estado, acao)
+            esperado = original.resultado(referencia, acao)
+            assert [list(linha) for linha in novo.tabuleiro] == esperado.tabuleiro
+            assert novo.jogador_atual == esperado.jogador_atual
+        assert estado.tabuleiro == tabuleiro  # O estado de partida não muda
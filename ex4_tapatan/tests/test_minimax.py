@@ -0,0 +1,49 @@
+'''
+Compara a busca com make/unmake (BuscaMinimax sobre uma Posicao, sem
+tabela) com o minimax original, que cria um estado por nó.
+'''
+
+import original
+from conftest import CASOS, POSICOES, referencia
+from estado import Estado, Posicao
+from minimax import BuscaMinimax, MinimaxAlgoritmo, movimentos, para_acao
+
+
+def test_busca_igual_ao_minimax_original():
+    for tabuleiro, jogador, profundidade, simbolo, maximizando in CASOS:
+        obtido = MinimaxAlgoritmo.minimax(Estado(tabuleiro, jogador), profundidade,
+                                          maximizando=maximizando, simbolo_computador=simbolo)
+        assert obtido == referencia(tabuleiro, jogador, profundidade, simbolo, maximizando)
+
+
+def test_movimentos_na_ordem_das_acoes_originais():
+    for tabuleiro, jogador in POSICOES:
+        posicao = Posicao(Estado(tabuleiro, jogador))
+        propria, outra = posicao.pecas[posicao.vez], posicao.pecas[posicao.vez ^ 1]
+        acoes = [para_acao(movimento, propria) for movimento in movimentos(propria, outra)]
+        assert acoes == original.acoes(original.EstadoOriginal(tabuleiro, jogador))
+
+
+def test_fazer_e_desfazer_voltam_a_posicao():
+    for tabuleiro, jogador in POSICOES:
+        estado = Estado(tabuleiro, jogador)
+        posicao = Posicao(estado)
+        propria, outra = posicao.pecas[posicao.vez], posicao.pecas[posicao.vez ^ 1]
+        for movimento in movimentos(propria, outra):
+            posicao.fazer(movimento)
+            feito = posicao.estado()
+            esperado = MinimaxAlgoritmo.resultado(estado, para_acao(movimento, propria))
+            assert (feito.x, feito.o, feito.jogador_atual) == \
+                (esperado.x, esperado.o, esperado.jogador_atual)
+            posicao.desfazer(movimento)
+            assert posicao.pecas == [estado.x, estado.o]
+            assert posicao.vez == (0 if jogador == 'X' else 1)
+
+
+def test_busca_nao_altera_o_estado():
+    for tabuleiro, jogador in POSICOES[:20]:
+        estado = Estado(tabuleiro, jogador)
+        busca = BuscaMinimax(estado, 'O')
+        busca.buscar(4, maximizando=jogador == 'O')
+        assert estado.tabuleiro == tabuleiro
+        assert busca.posicao.pecas == [estado.x, estado.o]
@@ -0,0 +1,62 @@
+'''
+Testes da busca paralela (paralelo.py) e da tabela em memória
+compartilhada: a jogada é a mesma do minimax original.
+'''
+
+from conftest import POSICOES, referencia
+from estado import Estado
+from paralelo import BuscaParalela, medir_escalabilidade
+from transposicao import TabelaCompartilhada
+
+
+def test_tabela_compartilhada():
+    tabela = TabelaCompartilhada(16)
+    try:
+        tabela.preparar((1, 1))
+        tabela.gravar(12345, 5, -0.37, 2, 0b11)
+        assert tabela.consultar(12345) == 0
+        assert (tabela.valores[0], tabela.profundidades[0], tabela.limites[0],
+                tabela.jogadas[0]) == (-0.37, 5, 2, 0b11)
+        assert tabela.consultar(12345 ^ 1 << 40) == -1
+
+        outra = TabelaCompartilhada(16, nome=tabela.nome)
+        assert outra.consultar(12345) == 0
+        outra.fechar()
+
+        tabela.limpar()
+        assert tabela.consultar(12345) == -1
+    finally:
+        tabela.fechar()
+
+
+def test_busca_paralela_igual_a_serial():
+    with BuscaParalela(2) as paralela:
+        for tabuleiro, jogador in POSICOES[:40]:
+            for profundidade in (2, 7):
+                simbolo, maximizando = 'O', jogador == 'O'
+                obtido = paralela.buscar(Estado(tabuleiro, jogador), profundidade,
+                                         maximizando, simbolo)
+                assert obtido == referencia(tabuleiro, jogador, profundidade, simbolo, maximizando)
+
+
+def test_busca_paralela_minimizando():
+    with BuscaParalela(2) as paralela:
+        for tabuleiro, jogador in POSICOES[40:60]:
+            simbolo = 'O' if jogador == 'X' else 'X'
+            obtido = paralela.buscar(Estado(tabuleiro, jogador), 5, False, simbolo)
+            assert obtido == referencia(tabuleiro, jogador, 5, simbolo, False)
+
+
+def test_aprofundamento_paralelo():
+    with BuscaParalela(2) as paralela:
+        for tabuleiro, jogador in POSICOES[:10]:
+            valor, _ = paralela.aprofundar(Estado(tabuleiro, jogador), profundidade_maxima=5,
+                                           maximizando=jogador == 'O')
+            alcancada = paralela.profundidade_alcancada
+            assert valor == referencia(tabuleiro, jogador, alcancada, 'O', jogador == 'O')[0]
+
+
+def test_medir_escalabilidade():
+    medidas = medir_escalabilidade(Estado(), 6, processos=[1, 2], maximizando=False)
+    assert [medida['processos'] for medida in medidas] == [0, 1, 2]
+    assert all(medida['mesma_jogada'] for medida in medidas)
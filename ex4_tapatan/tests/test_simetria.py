@@ -0,0 +1,73 @@
+'''
+Testes das simetrias do tabuleiro (simetria.py) e da tabela de
+transposição indexada pela representante canônica.
+'''
+
+import original
+from conftest import CASOS, POSICOES, referencia
+from estado import Estado, indice
+from minimax import MinimaxAlgoritmo
+from simetria import INVERSAS, SIMETRIAS, TRANSFORMACOES, canonizar, transformar_acao
+from transposicao import TabelaTransposicao, chave_canonica
+
+
+def _imagens(tabuleiro):
+    """
+    As oito imagens de um tabuleiro, na ordem de SIMETRIAS.
+    """
+    imagens = []
+    for simetria in SIMETRIAS:
+        imagem = [[' '] * 3 for _ in range(3)]
+        for i in range(3):
+            for j in range(3):
+                k, m = simetria(i, j)
+                imagem[k][m] = tabuleiro[i][j]
+        imagens.append(tuple(tuple(linha) for linha in imagem))
+    return imagens
+
+
+def test_transformacoes_das_mascaras_e_inversas():
+    for tabuleiro, jogador in POSICOES:
+        estado = Estado(tabuleiro, jogador)
+        for t, imagem in enumerate(_imagens(tabuleiro)):
+            assert Estado.de_mascaras(TRANSFORMACOES[t][estado.x], TRANSFORMACOES[t][estado.o],
+                                      jogador).tabuleiro == imagem
+            inversa = TRANSFORMACOES[INVERSAS[t]]
+            assert inversa[TRANSFORMACOES[t][estado.x]] == estado.x
+
+
+def test_imagens_tem_a_mesma_representante_e_a_mesma_avaliacao():
+    for tabuleiro, jogador in POSICOES:
+        estado = Estado(tabuleiro, jogador)
+        x, o, t = canonizar(estado.x, estado.o)
+        assert (TRANSFORMACOES[t][estado.x], TRANSFORMACOES[t][estado.o]) == (x, o)
+        chave = chave_canonica(estado.x, estado.o, 1)[0]
+        avaliacao = original.custo(original.EstadoOriginal(tabuleiro, jogador))
+        for imagem in _imagens(tabuleiro):
+            simetrico = Estado(imagem, jogador)
+            assert canonizar(simetrico.x, simetrico.o)[:2] == (x, o)
+            assert chave_canonica(simetrico.x, simetrico.o, 1)[0] == chave
+            assert original.custo(original.EstadoOriginal(imagem, jogador)) == avaliacao
+
+
+def test_acoes_transformadas_sao_as_acoes_da_imagem():
+    for tabuleiro, jogador in POSICOES:
+        acoes = MinimaxAlgoritmo.acoes(Estado(tabuleiro, jogador))
+        for t, imagem in enumerate(_imagens(tabuleiro)):
+            transformadas = {transformar_acao(acao, t) for acao in acoes}
+            assert transformadas == set(MinimaxAlgoritmo.acoes(Estado(imagem, jogador)))
+            for origem, destino in acoes:
+                movimento = 1 << indice(origem) | 1 << indice(destino)
+                k, m = transformar_acao((origem, destino), t)
+                assert TRANSFORMACOES[t][movimento] == 1 << indice(k) | 1 << indice(m)
+
+
+def test_tabela_com_simetria_da_o_valor_original():
+    for tabuleiro, jogador, profundidade, simbolo, maximizando in CASOS:
+        tabela = TabelaTransposicao(64, simetria=True, profundidade_exata=True)
+        valor, acao = MinimaxAlgoritmo.minimax(Estado(tabuleiro, jogador), profundidade,
+                                               maximizando=maximizando,
+                                               simbolo_computador=simbolo, tabela=tabela)
+        assert valor == referencia(tabuleiro, jogador, profundidade, simbolo, maximizando)[0]
+        if acao is not None:
+            assert acao in MinimaxAlgoritmo.acoes(Estado(tabuleiro, jogador))
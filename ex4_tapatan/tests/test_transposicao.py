@@ -0,0 +1,66 @@
+'''
+Testes da tabela de transposição (transposicao.py): hash de Zobrist
+incremental, política de substituição e valores da busca com tabela
+iguais aos do minimax original.
+'''
+
+import pytest
+
+from conftest import CASOS, POSICOES, referencia
+from estado import Estado, Posicao
+from minimax import BuscaMinimax, MinimaxAlgoritmo, movimentos
+from transposicao import EXATO, INFERIOR, ZOBRIST_MOVIMENTO, TabelaTransposicao, hash_zobrist
+
+
+def test_hash_incremental_igual_ao_calculado():
+    for tabuleiro, jogador in POSICOES:
+        posicao = Posicao(Estado(tabuleiro, jogador))
+        chave = hash_zobrist(*posicao.pecas, posicao.vez)
+        for movimento in movimentos(posicao.pecas[posicao.vez], posicao.pecas[posicao.vez ^ 1]):
+            vez = posicao.vez
+            posicao.fazer(movimento)
+            assert chave ^ ZOBRIST_MOVIMENTO[vez][movimento] == hash_zobrist(*posicao.pecas,
+                                                                            posicao.vez)
+            posicao.desfazer(movimento)
+
+
+def test_substituicao_por_profundidade():
+    tabela = TabelaTransposicao(1)
+    tabela.preparar((1, 1))
+    outra = 7 + len(tabela)  # Mesma entrada que a chave 7
+    tabela.gravar(7, 4, 0.5, EXATO, 3)
+    tabela.gravar(outra, 2, 0.1, EXATO, 5)
+    assert tabela.consultar(7) >= 0 and tabela.consultar(outra) == -1
+    tabela.gravar(outra, 4, 0.1, INFERIOR, 5)
+    assert tabela.consultar(7) == -1 and tabela.consultar(outra) >= 0
+
+    # Na busca seguinte, as entradas antigas podem ser trocadas por qualquer uma
+    tabela.preparar((1, 1))
+    tabela.gravar(7, 1, 0.5, EXATO, 3)
+    assert tabela.consultar(7) >= 0
+
+    # Outro contexto esvazia a tabela
+    tabela.preparar((0, 1))
+    assert tabela.consultar(7) == -1
+
+
+@pytest.mark.parametrize('memoria_kb', [1, 64])
+def test_tabela_de_profundidade_exata_da_o_valor_original(memoria_kb):
+    for tabuleiro, jogador, profundidade, simbolo, maximizando in CASOS:
+        tabela = TabelaTransposicao(memoria_kb, profundidade_exata=True)
+        valor, acao = MinimaxAlgoritmo.minimax(Estado(tabuleiro, jogador), profundidade,
+                                               maximizando=maximizando,
+                                               simbolo_computador=simbolo, tabela=tabela)
+        assert valor == referencia(tabuleiro, jogador, profundidade, simbolo, maximizando)[0]
+        if acao is not None:
+            assert acao in MinimaxAlgoritmo.acoes(Estado(tabuleiro, jogador))
+
+
+def test_tabela_reaproveitada_entre_buscas():
+    # A mesma tabela em buscas sucessivas de profundidades diferentes
+    tabela = TabelaTransposicao(64, profundidade_exata=True)
+    for tabuleiro, jogador in POSICOES[:30]:
+        for profundidade in (3, 5, 4):
+            busca = BuscaMinimax(Estado(tabuleiro, jogador), 'O', tabela)
+            valor, _ = busca.buscar(profundidade, maximizando=jogador == 'O')
+            assert valor == referencia(tabuleiro, jogador, profundidade, 'O', jogador == 'O')[0]
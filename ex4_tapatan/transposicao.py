@@ -0,0 +1,354 @@
+'''
+Tabela de transposição para o minimax do Tapatan.
+
+No Tapatan as mesmas posições aparecem muitas vezes na árvore (peças que
+vão e voltam, ordens diferentes de movimentos). A tabela guarda, para cada
+posição já buscada, a profundidade, o valor, o tipo de limite do valor
+(exato, inferior ou superior) e a melhor jogada, para que a busca possa
+reaproveitá-los.
+
+As posições são identificadas por hashes de Zobrist de 64 bits, atualizados
+a cada movimento com um XOR. A tabela tem tamanho fixo (definido pela
+memória) e política de substituição por profundidade: uma entrada só é
+trocada por outra de profundidade maior ou igual, a não ser que venha de
+uma busca anterior, quando sempre pode ser trocada.
+
+Com simetria=True a tabela é indexada pela representante canônica de cada
+posição (ver simetria.py): as até oito posições simétricas dividem uma
+entrada, e a melhor jogada é guardada na forma canônica.
+
+TabelaCompartilhada guarda as entradas em memória compartilhada, para a
+busca paralela (ver paralelo.py): vários processos leem e gravam nela ao
+mesmo tempo, sem travas.
+'''
+
+import random
+import struct
+from array import array
+from multiprocessing import shared_memory
+
+from estado import VIZINHOS
+from simetria import canonizar
+
+# Tipos de limite do valor guardado
+EXATO = 0
+INFERIOR = 1  # O valor real é maior ou igual ao guardado
+SUPERIOR = 2  # O valor real é menor ou igual ao guardado
+
+# Bytes por entrada: chave, valor, profundidade, limite, jogada e geração
+BYTES_ENTRADA = 8 + 8 + 1 + 1 + 2 + 1
+
+# Na tabela compartilhada: verificação, valor e informações, 64 bits cada,
+# depois de um cabeçalho com a geração e o melhor valor da raiz (valor,
+# índice do movimento e verificação)
+BYTES_ENTRADA_COMPARTILHADA = 3 * 8
+BYTES_CABECALHO = 4 * 8
+
+# Conversão entre um float e os seus 64 bits
+_REAL = struct.Struct('d')
+_INTEIRO = struct.Struct('Q')
+
+# Números aleatórios de cada (jogador, casa) e da vez de O, com semente
+# fixa para que os hashes sejam os mesmos em todas as execuções
+_aleatorio = random.Random(2025)
+ZOBRIST = tuple(tuple(_aleatorio.getrandbits(64) for _ in range(9)) for _ in range(2))
+ZOBRIST_VEZ = _aleatorio.getrandbits(64)
+
+# ZOBRIST_MOVIMENTO[vez][movimento]: XOR que leva o hash de uma posição ao
+# da posição depois do movimento (máscara origem|destino) de quem tem a vez
+ZOBRIST_MOVIMENTO = tuple([0] * 512 for _ in range(2))
+for _vez in range(2):
+    for _origem, _vizinhos in enumerate(VIZINHOS):
+        for _destino, _bit in _vizinhos:
+            ZOBRIST_MOVIMENTO[_vez][1 << _origem | _bit] = \
+                ZOBRIST[_vez][_origem] ^ ZOBRIST[_vez][_destino] ^ ZOBRIST_VEZ
+del _vez, _origem, _vizinhos, _destino, _bit
+
+
+def hash_zobrist(x, o, vez):
+    """
+    Hash de Zobrist de uma posição.
+
+    Args:
+        x: Máscara das peças de X
+        o: Máscara das peças de O
+        vez: 0 se X joga, 1 se O joga
+    """
+    chave = ZOBRIST_VEZ if vez else 0
+    for jogador, pecas in enumerate((x, o)):
+        for casa in range(9):
+            if pecas >> casa & 1:
+                chave ^= ZOBRIST[jogador][casa]
+    return chave
+
+
+def _entradas(memoria_kb, bytes_entrada):
+    """
+    Maior potência de 2 de entradas que cabe na memória.
+    """
+    entradas = 1
+    while entradas * 2 * bytes_entrada <= memoria_kb * 1024:
+        entradas *= 2
+    return entradas
+
+
+_CHAVES_CANONICAS = {}  # (x << 9) | o -> (hash da representante com X na vez, transformação)
+
+
+def chave_canonica(x, o, vez):
+    """
+    Hash de Zobrist da representante canônica de uma posição.
+
+    Returns:
+        Tupla (hash, t), com t a transformação que leva a posição até a
+        representante (ver simetria.canonizar)
+    """
+    chave = x << 9 | o
+    par = _CHAVES_CANONICAS.get(chave)
+    if par is None:
+        x_canonico, o_canonico, t = canonizar(x, o)
+        par = _CHAVES_CANONICAS[chave] = (hash_zobrist(x_canonico, o_canonico, 0), t)
+    return (par[0] ^ ZOBRIST_VEZ, par[1]) if vez else par
+
+
+class TabelaTransposicao:
+    """
+    Tabela de transposição com endereçamento direto pelo hash.
+
+    Args:
+        memoria_kb: Memória máxima das entradas, em KB; o número de entradas
+            é a maior potência de 2 que cabe nela
+        simetria: Indexar as posições pela representante canônica
+        profundidade_exata: Só aceitar valores guardados com a mesma
+            profundidade da busca. A busca dá então exatamente o valor da
+            busca sem tabela, qualquer que seja o conteúdo dela (com entradas
+            mais profundas o valor pode mudar); a tabela continua ordenando
+            os movimentos
+    """
+
+    def __init__(self, memoria_kb=1024, simetria=False, profundidade_exata=False):
+        self.simetria = simetria
+        self.profundidade_exata = profundidade_exata
+        entradas = _entradas(memoria_kb, BYTES_ENTRADA)
+        self.mascara = entradas - 1
+        self.chaves = array('Q', bytes(8 * entradas))
+        self.valores = array('d', bytes(8 * entradas))
+        self.profundidades = array('b', [-1]) * entradas  # -1: entrada vazia
+        self.limites = array('B', bytes(entradas))
+        self.jogadas = array('H', bytes(2 * entradas))
+        self.geracoes = array('B', bytes(entradas))
+        self.geracao = 0
+        self.contexto = None
+        self.consultas = 0
+        self.acertos = 0
+        self.gravacoes = 0
+        self.substituicoes = 0
+
+    def __len__(self):
+        return self.mascara + 1
+
+    def preparar(self, contexto):
+        """
+        Começa uma nova busca. As entradas das buscas anteriores continuam
+        válidas, mas passam a poder ser substituídas por qualquer outra.
+
+        Args:
+            contexto: O que, além da posição, muda os valores (o símbolo do
+                computador, que define a avaliação, e o jogador que maximiza).
+                Se for diferente do da busca anterior, a tabela é esvaziada
+        """
+        if contexto != self.contexto:
+            self.limpar()
+            self.contexto = contexto
+        self.geracao = (self.geracao + 1) & 0xFF
+
+    def limpar(self):
+        self.profundidades = array('b', [-1]) * len(self)
+        self.geracao = 0
+
+    def consultar(self, chave):
+        """
+        Procura a entrada de uma posição.
+
+        Returns:
+            Índice da entrada, ou -1 se a posição não está na tabela
+        """
+        self.consultas += 1
+        i = chave & self.mascara
+        if self.profundidades[i] < 0 or self.chaves[i] != chave:
+            return -1
+        self.acertos += 1
+        return i
+
+    def gravar(self, chave, profundidade, valor, limite, jogada):
+        """
+        Guarda o resultado da busca de uma posição, se a política de
+        substituição permitir.
+        """
+        i = chave & self.mascara
+        antiga = self.profundidades[i]
+        if antiga >= 0:
+            if self.chaves[i] != chave:
+                if profundidade < antiga and self.geracoes[i] == self.geracao:
+                    return
+                self.substituicoes += 1
+            elif profundidade < antiga and self.limites[i] == EXATO:
+                return  # Já tem um resultado exato mais profundo
+        self.chaves[i] = chave
+        self.valores[i] = valor
+        self.profundidades[i] = profundidade
+        self.limites[i] = limite
+        self.jogadas[i] = jogada
+        self.geracoes[i] = self.geracao
+        self.gravacoes += 1
+
+
+class TabelaCompartilhada(TabelaTransposicao):
+    """
+    Tabela de transposição em um bloco de multiprocessing.shared_memory,
+    usada ao mesmo tempo por vários processos e sem travas.
+    
+    Cada entrada tem três palavras de 64 bits: o valor, as informações
+    (profundidade + 1, limite, jogada e geração; 0 é entrada vazia) e a
+    verificação, que é a chave com um XOR das outras duas. Uma entrada lida
+    no meio da gravação de outro processo (ou sobrescrita por outra posição)
+    não passa na verificação e conta como ausente, sem nunca dar um valor
+    misturado de duas gravações.
+    
+    consultar() copia a entrada verificada para arrays locais de uma posição
+    e devolve o índice 0, então BuscaMinimax lê valores, profundidades,
+    limites e jogadas como na tabela comum. A geração e o melhor valor da
+    raiz (usado pela busca paralela) ficam no cabeçalho do bloco.
+    
+    Args:
+        memoria_kb: Memória máxima das entradas, em KB
+        simetria: Indexar as posições pela representante canônica
+        profundidade_exata: Como em TabelaTransposicao; por padrão ligado,
+            para que o valor não dependa da ordem em que os processos gravam
+        nome: Nome de um bloco já criado, para se ligar a ele (nos processos
+            da busca); None cria um bloco novo
+    """
+    
+    def __init__(self, memoria_kb=1024, simetria=False, profundidade_exata=True, nome=None):
+        self.simetria = simetria
+        self.profundidade_exata = profundidade_exata
+        entradas = _entradas(memoria_kb, BYTES_ENTRADA_COMPARTILHADA)
+        self.mascara = entradas - 1
+        self.criadora = nome is None
+        tamanho = BYTES_CABECALHO + entradas * BYTES_ENTRADA_COMPARTILHADA
+        if self.criadora:
+            self.memoria = shared_memory.SharedMemory(create=True, size=tamanho)
+        else:
+            self.memoria = shared_memory.SharedMemory(name=nome)
+        
+        buffer = self.memoria.buf
+        inicio = BYTES_CABECALHO
+        self._cabecalho = buffer[:BYTES_CABECALHO].cast('Q')
+        self._valores = buffer[inicio:inicio + 8 * entradas].cast('Q')
+        self._informacoes = buffer[inicio + 8 * entradas:inicio + 16 * entradas].cast('Q')
+        self._verificacoes = buffer[inicio + 16 * entradas:inicio + 24 * entradas].cast('Q')
+        
+        # Cópia local da última entrada encontrada por consultar()
+        self.valores = array('d', [0.0])
+        self.profundidades = array('b', [-1])
+        self.limites = array('B', [0])
+        self.jogadas = array('H', [0])
+        
+        self.contexto = None
+        self.consultas = 0
+        self.acertos = 0
+        self.gravacoes = 0
+        self.substituicoes = 0
+    
+    @property
+    def nome(self):
+        return self.memoria.name
+    
+    @property
+    def geracao(self):
+        return self._cabecalho[0]
+    
+    @geracao.setter
+    def geracao(self, geracao):
+        self._cabecalho[0] = geracao
+    
+    def ler_raiz(self):
+        """
+        Melhor valor exato já encontrado para a raiz da busca paralela.
+        
+        Returns:
+            Tupla (valor, índice do movimento), ou None se foi lida no meio
+            de uma gravação
+        """
+        cabecalho = self._cabecalho
+        bits, indice = cabecalho[1], cabecalho[2]
+        if cabecalho[3] != bits ^ indice:
+            return None
+        return _REAL.unpack(_INTEIRO.pack(bits))[0], indice
+    
+    def gravar_raiz(self, valor, indice):
+        bits = _INTEIRO.unpack(_REAL.pack(valor))[0]
+        cabecalho = self._cabecalho
+        cabecalho[1] = bits
+        cabecalho[2] = indice
+        cabecalho[3] = bits ^ indice
+    
+    def limpar(self):
+        inicio = BYTES_CABECALHO + 8 * len(self)
+        self.memoria.buf[inicio:inicio + 8 * len(self)] = bytes(8 * len(self))
+        self.geracao = 0
+    
+    def consultar(self, chave):
+        """
+        Procura a entrada de uma posição e a copia para os arrays locais.
+        
+        Returns:
+            0 (o índice da cópia), ou -1 se a posição não está na tabela
+        """
+        self.consultas += 1
+        i = chave & self.mascara
+        bits = self._valores[i]
+        informacao = self._informacoes[i]
+        if not informacao or self._verificacoes[i] ^ informacao ^ bits != chave:
+            return -1
+        self.acertos += 1
+        self.valores[0] = _REAL.unpack(_INTEIRO.pack(bits))[0]
+        self.profundidades[0] = (informacao & 0xFF) - 1
+        self.limites[0] = informacao >> 8 & 0xFF
+        self.jogadas[0] = informacao >> 16 & 0xFFFF
+        return 0
+    
+    def gravar(self, chave, profundidade, valor, limite, jogada):
+        """
+        Guarda o resultado da busca de uma posição, se a política de
+        substituição permitir (com a entrada lida sem trava, a política é só
+        uma heurística; a verificação é que garante as leituras).
+        """
+        i = chave & self.mascara
+        geracao = self.geracao
+        bits_antigos = self._valores[i]
+        antiga = self._informacoes[i]
+        if antiga:
+            profundidade_antiga = (antiga & 0xFF) - 1
+            if self._verificacoes[i] ^ antiga ^ bits_antigos != chave:
+                if profundidade < profundidade_antiga and antiga >> 32 == geracao:
+                    return
+                self.substituicoes += 1
+            elif profundidade < profundidade_antiga and (antiga >> 8 & 0xFF) == EXATO:
+                return
+        bits = _INTEIRO.unpack(_REAL.pack(valor))[0]
+        informacao = (profundidade + 1) | limite << 8 | jogada << 16 | geracao << 32
+        self._valores[i] = bits
+        self._informacoes[i] = informacao
+        self._verificacoes[i] = chave ^ informacao ^ bits
+        self.gravacoes += 1
+    
+    def fechar(self):
+        """
+        Desliga este processo do bloco; a tabela que o criou também o apaga.
+        """
+        for visao in (self._cabecalho, self._valores, self._informacoes, self._verificacoes):
+            visao.release()
+        self.memoria.close()
+        if self.criadora:
+            self.memoria.unlink()